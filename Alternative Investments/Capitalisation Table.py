@@ -1,6 +1,4 @@
-import pandas as pd
 from datetime import datetime
-import matplotlib.pyplot as plt
 
 
 class Security:
@@ -164,28 +162,35 @@ class CapTable:
         exercised_stock = self.stock_options_pool.exercise_options(self.stock_options_pool.exercised_options, exercise_date)
         self.add_security(exercised_stock)
 
-payouts_df = pd.DataFrame(list(payouts.items()), columns=['Security Name', 'Payout Amount'])
-print(payouts_df)
-plt.figure(figsize=(10, 6))
-plt.pie(cap_table_df['Ownership'], labels=cap_table_df['Name'], autopct='%1.1f%%')
-plt.title('Cap Table Ownership Structure')
-plt.show()
-plt.figure(figsize=(12, 6))
-plt.bar(payouts_df['Security Name'], payouts_df['Payout Amount'])
-plt.xlabel('Security Name')
-plt.ylabel('Payout Amount')
-plt.title('Waterfall Analysis Payouts')
-plt.xticks(rotation=45)
-plt.show()
-
 
 # Example usage
-cap_table = CapTable()
-cap_table.add_security(CommonStock("Common Stock A", 10000, 1))
-cap_table.add_security(PreferredStock("Preferred Stock B", 5000, 2, 10000))  # 10000 is the liquidation preference
-cap_table.add_security(ConvertibleNote("Convertible Note C", 10000, 1.1, 1.5))
-
-# Performing waterfall analysis (assuming an exit value)
-exit_value = 50000  # Example exit value
-payouts = cap_table.perform_waterfall_analysis(exit_value)
-print(payouts)
+if __name__ == "__main__":
+    import pandas as pd
+    import matplotlib.pyplot as plt
+
+    cap_table = CapTable()
+    cap_table.add_security(CommonStock("Common Stock A", 10000, 1))
+    cap_table.add_security(PreferredStock("Preferred Stock B", 5000, 2, 10000))  # 10000 is the liquidation preference
+    cap_table.add_security(ConvertibleNote("Convertible Note C", 10000, 1.1, 1.5))
+
+    # Performing waterfall analysis (assuming an exit value)
+    exit_value = 50000  # Example exit value
+    payouts = cap_table.perform_waterfall_analysis(exit_value)
+    print(payouts)
+
+    cap_table_df = pd.DataFrame({'Name': [security.name for security in cap_table.securities],
+                                 'Shares': [security.shares for security in cap_table.securities]})
+    cap_table_df['Ownership'] = cap_table_df['Shares'] / cap_table_df['Shares'].sum()
+    payouts_df = pd.DataFrame(list(payouts.items()), columns=['Security Name', 'Payout Amount'])
+    print(payouts_df)
+    plt.figure(figsize=(10, 6))
+    plt.pie(cap_table_df['Ownership'], labels=cap_table_df['Name'], autopct='%1.1f%%')
+    plt.title('Cap Table Ownership Structure')
+    plt.show()
+    plt.figure(figsize=(12, 6))
+    plt.bar(payouts_df['Security Name'], payouts_df['Payout Amount'])
+    plt.xlabel('Security Name')
+    plt.ylabel('Payout Amount')
+    plt.title('Waterfall Analysis Payouts')
+    plt.xticks(rotation=45)
+    plt.show()
@@ -1,5 +1,3 @@
-import numpy_financial as npf
-
 class PropertyValuationDCF:
     """
     A class to estimate the value of a property using the Discounted Cash Flow (DCF) method,
@@ -39,6 +37,8 @@ class PropertyValuationDCF:
         Raises:
         ValueError: If neither a growth rate nor an exit multiple is provided for the terminal value calculation.
         """
+        import numpy_financial as npf
+
         if growth_rate is not None:
             # Perpetuity Growth Model
             terminal_value = self.projected_cash_flows[-1] * (1 + growth_rate) / (self.discount_rate - growth_rate)
@@ -53,13 +53,13 @@ class PropertyValuationDCF:
         return present_value
 
 # Example usage
-projected_cash_flows = [50000, 52000, 54040, 56121, 58246]  # Example cash flows for 5 years
-discount_rate = 0.08  # 8% discount rate
-growth_rate = 0.02  # 2% growth rate for terminal value
-# Or use an exit multiple, e.g., exit_multiple = 10
-
-valuation_tool = PropertyValuationDCF(projected_cash_flows, discount_rate)
-property_value = valuation_tool.calculate_present_value(growth_rate=growth_rate)
-# Or use exit_multiple, e.g., property_value = valuation_tool.calculate_present_value(exit_multiple=exit_multiple)
-print("Estimated Property Value: ", property_value)
+if __name__ == "__main__":
+    projected_cash_flows = [50000, 52000, 54040, 56121, 58246]  # Example cash flows for 5 years
+    discount_rate = 0.08  # 8% discount rate
+    growth_rate = 0.02  # 2% growth rate for terminal value
+    # Or use an exit multiple, e.g., exit_multiple = 10
 
+    valuation_tool = PropertyValuationDCF(projected_cash_flows, discount_rate)
+    property_value = valuation_tool.calculate_present_value(growth_rate=growth_rate)
+    # Or use exit_multiple, e.g., property_value = valuation_tool.calculate_present_value(exit_multiple=exit_multiple)
+    print("Estimated Property Value: ", property_value)
@@ -81,14 +81,15 @@ class PropertyValuation:
         return noi / (cap_rate / 100)
 
 # Example usage
-valuation_tool = PropertyValuation(10000, 25, 5000)
-valuation_tool.add_operating_expense('property_taxes', 5000)
-valuation_tool.add_operating_expense('insurance', 2000)
-valuation_tool.add_operating_expense('utilities', 3000)
-valuation_tool.add_operating_expense('maintenance', 4000)
-
-try:
-    estimated_value = valuation_tool.estimate_property_value(5)
-    print("Estimated Property Value: ", estimated_value)
-except ValueError as e:
-    print(e)
+if __name__ == "__main__":
+    valuation_tool = PropertyValuation(10000, 25, 5000)
+    valuation_tool.add_operating_expense('property_taxes', 5000)
+    valuation_tool.add_operating_expense('insurance', 2000)
+    valuation_tool.add_operating_expense('utilities', 3000)
+    valuation_tool.add_operating_expense('maintenance', 4000)
+
+    try:
+        estimated_value = valuation_tool.estimate_property_value(5)
+        print("Estimated Property Value: ", estimated_value)
+    except ValueError as e:
+        print(e)
@@ -1,70 +1,539 @@
-import requests
-import pandas as pd
-from datetime import datetime
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
 
+# Shared helpers live in the common package at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from common.rate_limit import RetryableError, TokenBucket, call_with_retry
 
-def convert_timestamp(timestamp_ms):
-    """Convert Unix timestamp in milliseconds to a human-readable date-time format."""
-    return datetime.fromtimestamp(timestamp_ms / 1000).strftime('%Y-%m-%d %H:%M:%S')
+BASE_URL = "https://fapi.binance.com/futures/data/openInterestHist"
+FUNDING_URL = "https://fapi.binance.com/fapi/v1/fundingRate"
+KLINES_URL = "https://fapi.binance.com/fapi/v1/klines"
 
-def fetch_data(url, start_date, limit=500):
-    # Convert start_date to Unix timestamp in milliseconds
-    start_timestamp = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp()) * 1000
-    # Set initial end_timestamp to current time
-    end_timestamp = int(datetime.now().timestamp()) * 1000
+# Length of each supported period in milliseconds
+PERIOD_MS = {'5m': 300000, '15m': 900000, '30m': 1800000, '1h': 3600000, '2h': 7200000, '4h': 14400000,
+             '6h': 21600000, '12h': 43200000, '1d': 86400000}
 
-    column_names = ['symbol','sumOpenInterest','sumOpenInterestValue','timestamp']
-    df = pd.DataFrame(columns = column_names)
-    all_data = []
-    while True:
-        # Update the URL with the current start and end times
-        current_url = f"{url}&startTime={start_timestamp}&endTime={end_timestamp}&limit={limit}"
-        response = requests.get(current_url)
-
-        # Check if the request was successful
-        if response.status_code == 200:
-            data = response.json()
-            if not data:
-                break
-            all_data.extend(data)
-            print(f"Loaded {len(data)} rows, total rows: {len(all_data)}")
-            temp_df = pd.DataFrame(data)
-            df = pd.concat([df, temp_df], ignore_index=True)
-            
-            temp_df = pd.DataFrame(data)
-            temp_df['timestamp'] = temp_df['timestamp'].apply(convert_timestamp)
-            df = pd.concat([df, temp_df], ignore_index=True)
-
-            print(df.tail(5))
-
-            print(f"Current end_timestamp: {end_timestamp}")
-            earliest_timestamp = data[-1]['timestamp']
-            print(f"Earliest timestamp in batch: {earliest_timestamp}")
-            if earliest_timestamp <= start_timestamp:
-                print("Reached start_timestamp, breaking loop")
-                break
-            end_timestamp = earliest_timestamp - (500 * 300000)
-            print(f"Updated end_timestamp for next request: {end_timestamp}")
+# Binance only serves the most recent 30 days of open interest history
+HISTORY_DAYS = 30
+
+# Market data endpoints: request settings, the record field holding the bar time and the stored
+# fields (record key, type). 'weight' is the request weight Binance counts against the IP limit,
+# 'step_ms' the spacing of the records when it does not follow the period.
+ENDPOINTS = {
+    'open_interest': {
+        'url': BASE_URL, 'period_param': 'period', 'limit': 500, 'weight': 1,
+        'time': 'timestamp',
+        'fields': {'sumOpenInterest': ('sumOpenInterest', 'float'),
+                   'sumOpenInterestValue': ('sumOpenInterestValue', 'float')},
+    },
+    'funding': {
+        'url': FUNDING_URL, 'period_param': None, 'limit': 1000, 'weight': 1, 'step_ms': 28800000,
+        'time': 'fundingTime',
+        'fields': {'fundingRate': ('fundingRate', 'float'), 'markPrice': ('markPrice', 'float')},
+    },
+    # Klines are arrays: open time, open, high, low, close, volume, close time, quote volume,
+    # trades, taker buy volume, taker buy quote volume, ignore
+    'klines': {
+        'url': KLINES_URL, 'period_param': 'interval', 'limit': 1500, 'weight': 10, 'closed_bars': True,
+        'time': 0,
+        'fields': {'open': (1, 'float'), 'high': (2, 'float'), 'low': (3, 'float'), 'close': (4, 'float'),
+                   'volume': (5, 'float'), 'quoteVolume': (7, 'float'), 'trades': (8, 'int'),
+                   'takerBuyVolume': (9, 'float'), 'takerBuyQuoteVolume': (10, 'float')},
+    },
+}
+
+
+def to_milliseconds(date):
+    """Convert a 'YYYY-MM-DD' string or a datetime (naive means UTC) to a Unix timestamp in milliseconds."""
+    if isinstance(date, str):
+        date = datetime.strptime(date, "%Y-%m-%d")
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return int(date.timestamp() * 1000)
+
+def binance_fetcher(base_url=BASE_URL, timeout=10, pool_size=16):
+    """
+    Returns a fetch function reading one page of open interest history from Binance.
+    fetch(symbol, period, start_ms, end_ms, limit) returns the records with start_ms <= timestamp <= end_ms
+    in ascending order. A single pooled session is shared by all threads.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    def fetch(symbol, period, start_ms, end_ms, limit):
+        params = {'symbol': symbol, 'period': period, 'startTime': start_ms, 'endTime': end_ms, 'limit': limit}
+        try:
+            response = session.get(base_url, params=params, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as error:
+            raise RetryableError(str(error)) from error
+        if response.status_code in (418, 429) or response.status_code >= 500:
+            retry_after = response.headers.get('Retry-After')
+            raise RetryableError(f"HTTP {response.status_code} for {symbol}",
+                                 float(retry_after) if retry_after else None)
+        response.raise_for_status()
+        return response.json()
+
+    return fetch
+
+class ReplayFetcher:
+    """
+    Serves recorded open interest records in place of the live endpoint, with the same paging
+    semantics, so downloads can be run and checked offline.
+    The fixture is a dict (or the path of a JSON file holding one) mapping each symbol to its
+    records, as saved by RecordingFetcher. Every request is kept in `calls`.
+    """
+    def __init__(self, fixture):
+        if isinstance(fixture, str):
+            with open(fixture) as fixture_file:
+                fixture = json.load(fixture_file)
+        self.records = {symbol: sorted(records, key=lambda record: record['timestamp'])
+                        for symbol, records in fixture.items()}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, symbol, period, start_ms, end_ms, limit):
+        with self.lock:
+            self.calls.append((symbol, period, start_ms, end_ms, limit))
+        page = [record for record in self.records.get(symbol, []) if start_ms <= record['timestamp'] <= end_ms]
+        return page[:limit]
+
+class RecordingFetcher:
+    """
+    Wraps a fetch function and keeps every record it returns, so a live download can be saved as
+    a replay fixture with save(path).
+    """
+    def __init__(self, fetch):
+        self.fetch = fetch
+        self.records = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, symbol, period, start_ms, end_ms, limit):
+        page = self.fetch(symbol, period, start_ms, end_ms, limit)
+        with self.lock:
+            self.records.setdefault(symbol, []).extend(page)
+        return page
+
+    def save(self, path):
+        with open(path, 'w') as fixture_file:
+            json.dump(self.records, fixture_file)
+
+def fetch_with_retry(fetch, bucket, symbol, period, start_ms, end_ms, limit, max_retries=5, backoff=1.0,
+                     max_backoff=60.0):
+    """
+    Calls fetch behind the shared rate limiter, retrying retryable failures with jittered
+    exponential backoff, or after the delay the server asked for.
+    """
+    return call_with_retry(lambda: fetch(symbol, period, start_ms, end_ms, limit), bucket, max_retries, backoff,
+                           max_backoff)
+
+def high_water_mark(output_dir, symbol):
+    """
+    Timestamp (ms) of the last bar stored for a symbol, or None when nothing is stored.
+    It is read from the part file names, so no data needs to be loaded.
+    """
+    symbol_dir = os.path.join(output_dir, f"symbol={symbol}")
+    if not os.path.isdir(symbol_dir):
+        return None
+    # Days sort chronologically by name; the newest day holding a part has the mark
+    for day_dir in sorted(os.listdir(symbol_dir), reverse=True):
+        parts = [name for name in os.listdir(os.path.join(symbol_dir, day_dir))
+                 if name.startswith('part-') and name.endswith('.parquet')]
+        if parts:
+            return max(int(name[:-len('.parquet')].split('-')[2]) for name in parts)
+    return None
+
+def _number(value):
+    """Binance sends numbers as strings, and an empty string when a value is unknown."""
+    return None if value in (None, '') else float(value)
+
+def write_page(records, output_dir, symbol, endpoint='open_interest'):
+    """
+    Appends one page of records of an endpoint to its dataset as one part file per UTC day, under
+    symbol=<symbol>/day=<YYYY-MM-DD>/part-<first ms>-<last ms>.parquet.
+    Days are written in order, each under a temporary name and renamed, so the high-water mark
+    never runs ahead of the data on disk.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    spec = ENDPOINTS[endpoint]
+    types = {'float': pa.float64(), 'int': pa.int64()}
+    schema = pa.schema([('timestamp', pa.timestamp('ms', tz='UTC'))]
+                       + [(name, types[kind]) for name, (_, kind) in spec['fields'].items()])
+    days = {}
+    for record in records:
+        day = datetime.fromtimestamp(record[spec['time']] / 1000, tz=timezone.utc).strftime('%Y-%m-%d')
+        days.setdefault(day, []).append(record)
+
+    for day in sorted(days):
+        rows = days[day]
+        timestamps = [row[spec['time']] for row in rows]
+        columns = {'timestamp': timestamps}
+        for name, (key, kind) in spec['fields'].items():
+            convert = _number if kind == 'float' else int
+            columns[name] = [convert(row[key]) for row in rows]
+        day_dir = os.path.join(output_dir, f"symbol={symbol}", f"day={day}")
+        os.makedirs(day_dir, exist_ok=True)
+        name = f"part-{timestamps[0]}-{timestamps[-1]}.parquet"
+        temporary_path = os.path.join(day_dir, '.' + name + '.tmp')
+        pq.write_table(pa.table(columns, schema=schema), temporary_path)
+        os.replace(temporary_path, os.path.join(day_dir, name))
+
+def download_symbol(symbol, output_dir, fetch, bucket, period='5m', start_time=None, end_time=None, limit=500,
+                    max_retries=5, backoff=1.0):
+    """
+    Downloads the open interest of one symbol from its high-water mark (or start_time) up to
+    end_time, walking forward one page at a time and appending each page to the dataset.
+    :return: The number of bars written.
+    """
+    period_ms = PERIOD_MS[period]
+    end_ms = to_milliseconds(end_time) if end_time is not None else int(time.time() * 1000)
+    mark = high_water_mark(output_dir, symbol)
+    if mark is not None:
+        start_ms = mark + 1
+    elif start_time is not None:
+        start_ms = to_milliseconds(start_time)
+    else:
+        start_ms = end_ms - HISTORY_DAYS * 86400000 + period_ms
+
+    written = 0
+    while start_ms <= end_ms:
+        window_end = min(start_ms + limit * period_ms - 1, end_ms)
+        page = fetch_with_retry(fetch, bucket, symbol, period, start_ms, window_end, limit, max_retries, backoff)
+        page = sorted((record for record in page if start_ms <= record['timestamp'] <= window_end),
+                      key=lambda record: record['timestamp'])
+        if page:
+            write_page(page, output_dir, symbol)
+            written += len(page)
+            start_ms = page[-1]['timestamp'] + 1
         else:
-            print(f"Request failed with status code {response.status_code}")
-            print(f"Failed URL: {current_url}")
+            # Nothing in this window (e.g. before the listing); move on to the next one
+            start_ms = window_end + 1
+    return written
+
+def download_open_interest(symbols, output_dir, period='5m', start_time=None, end_time=None, fetch=None, workers=4,
+                           rate=2.0, burst=None, limit=500, max_retries=5, backoff=1.0):
+    """
+    Downloads the open interest history of many symbols concurrently into a Parquet dataset
+    partitioned by symbol and day. Each symbol resumes from its high-water mark, so reruns only
+    fetch bars newer than those already stored. All threads share one rate limiter.
+    Parameters:
+    - symbols (iterable of str): Futures symbols, e.g. 'BTCUSDT'.
+    - output_dir (str): Dataset directory; read it back with load_open_interest.
+    - period (str): Bar period, one of PERIOD_MS.
+    - start_time (str or datetime): Start for symbols with no stored data (defaults to the oldest bar Binance serves).
+    - end_time (str or datetime): Last bar to fetch (defaults to now).
+    - fetch (callable): fetch(symbol, period, start_ms, end_ms, limit) -> records; defaults to binance_fetcher().
+    - workers (int): Number of symbols downloaded at once.
+    - rate (float): Sustained requests per second across all workers.
+    - burst (int): Token bucket capacity (defaults to rate).
+    - limit (int): Bars per request (at most 500).
+    Returns:
+    - dict: 'written' (bars written per symbol) and 'failed' (error message per symbol).
+    """
+    if period not in PERIOD_MS:
+        raise ValueError(f"period must be one of {', '.join(PERIOD_MS)}.")
+    fetch = fetch if fetch is not None else binance_fetcher(pool_size=workers)
+    bucket = TokenBucket(rate, burst)
+    os.makedirs(output_dir, exist_ok=True)
+
+    summary = {'written': {}, 'failed': {}}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(download_symbol, symbol, output_dir, fetch, bucket, period, start_time, end_time,
+                               limit, max_retries, backoff): symbol for symbol in dict.fromkeys(symbols)}
+        for future, symbol in futures.items():
+            try:
+                summary['written'][symbol] = future.result()
+            except Exception as error:
+                # Bars written before the failure are kept; the next run resumes from them
+                summary['failed'][symbol] = f"{type(error).__name__}: {error}"
+    return summary
+
+def load_open_interest(output_dir, symbols=None, start_time=None, end_time=None):
+    """
+    Reads the stored open interest (or the directory of any endpoint written by
+    collect_market_data) into one DataFrame sorted by symbol and timestamp. Filters on symbols and
+    dates prune whole partitions, so only the files needed are opened.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(output_dir, format='parquet', partitioning='hive')
+    timestamp_type = pa.timestamp('ms', tz='UTC')
+    filters = []
+    if symbols is not None:
+        filters.append(ds.field('symbol').isin(list(symbols)))
+    for bound, compare in ((start_time, '__ge__'), (end_time, '__le__')):
+        if bound is not None:
+            ms = to_milliseconds(bound)
+            day = datetime.fromtimestamp(ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d')
+            filters.append(getattr(ds.field('day'), compare)(day))
+            filters.append(getattr(ds.field('timestamp'), compare)(pa.scalar(ms, type=timestamp_type)))
+    condition = None
+    for expression in filters:
+        condition = expression if condition is None else condition & expression
+    df = dataset.to_table(filter=condition).to_pandas()
+    return df.drop(columns='day').sort_values(['symbol', 'timestamp'], ignore_index=True)
+
+class WeightThrottle:
+    """
+    Asyncio limiter on the request weight Binance counts per IP and minute.
+    Each request reserves its weight before it is sent and waits for the next minute when the
+    budget is spent. The X-MBX-USED-WEIGHT-1M response header keeps the count in step with the
+    server's, and after a 429 or 418 every request waits out the Retry-After delay.
+    """
+    def __init__(self, limit=2400, headroom=0.8):
+        self.budget = limit * headroom
+        self.used = 0
+        self.minute = int(time.time() // 60)
+        self.paused_until = 0.0
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, weight):
+        while True:
+            async with self.lock:
+                now = time.time()
+                minute = int(now // 60)
+                if minute != self.minute:
+                    self.minute, self.used = minute, 0
+                if now >= self.paused_until and self.used + weight <= self.budget:
+                    self.used += weight
+                    return
+                wait_seconds = self.paused_until - now if now < self.paused_until else (minute + 1) * 60 - now
+            await asyncio.sleep(wait_seconds)
+
+    def update(self, used_weight):
+        if int(time.time() // 60) == self.minute:
+            self.used = max(self.used, used_weight)
+
+    def pause(self, seconds):
+        self.paused_until = max(self.paused_until, time.time() + seconds)
+
+def aiohttp_fetcher(session):
+    """
+    Returns an async fetch(url, params) -> (status, headers, payload) on a pooled keep-alive
+    aiohttp session. Connection errors and timeouts are raised as RetryableError.
+    """
+    import aiohttp
+
+    async def fetch(url, params):
+        try:
+            async with session.get(url, params=params) as response:
+                payload = await response.json(content_type=None) if response.status == 200 else await response.text()
+                return response.status, response.headers, payload
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            raise RetryableError(str(error)) from error
+
+    return fetch
+
+async def _request(fetch, throttle, host_slots, url, params, weight, max_retries, backoff, max_backoff=60.0):
+    """
+    Sends one request within the weight budget and the per-host concurrency cap, retrying
+    throttled and failed requests.
+    """
+    for attempt in range(max_retries + 1):
+        await throttle.acquire(weight)
+        try:
+            async with host_slots[urlsplit(url).netloc]:
+                status, headers, payload = await fetch(url, params)
+        except RetryableError:
+            if attempt == max_retries:
+                raise
+            await asyncio.sleep(random.uniform(0, min(max_backoff, backoff * 2 ** attempt)))
+            continue
+        used_weight = headers.get('X-MBX-USED-WEIGHT-1M')
+        if used_weight:
+            throttle.update(int(used_weight))
+        if status == 200:
+            return payload
+        if status in (418, 429):
+            # 429 is the warning before an IP ban (418); back off for as long as the server asks
+            throttle.pause(float(headers.get('Retry-After', 60)))
+        elif status < 500:
+            raise RuntimeError(f"HTTP {status} for {url} {params}: {payload}")
+        else:
+            await asyncio.sleep(random.uniform(0, min(max_backoff, backoff * 2 ** attempt)))
+        if attempt == max_retries:
+            raise RetryableError(f"HTTP {status} for {url} {params}")
+
+async def _collect_series(endpoint, symbol, queue, request, output_dir, period, start_time, end_time):
+    """
+    Pages forward through one endpoint of one symbol from its high-water mark and puts every page
+    on the queue, waiting whenever the queue is full.
+    """
+    spec = ENDPOINTS[endpoint]
+    step_ms = spec.get('step_ms') or PERIOD_MS[period]
+    now_ms = int(time.time() * 1000)
+    end_ms = to_milliseconds(end_time) if end_time is not None else now_ms
+    if spec.get('closed_bars'):
+        # The latest kline is still open
+        end_ms = min(end_ms, now_ms - step_ms)
+    mark = high_water_mark(os.path.join(output_dir, endpoint), symbol)
+    if mark is not None:
+        start_ms = mark + 1
+    elif start_time is not None:
+        start_ms = to_milliseconds(start_time)
+    else:
+        start_ms = now_ms - HISTORY_DAYS * 86400000 + step_ms
+
+    while start_ms <= end_ms:
+        window_end = min(start_ms + spec['limit'] * step_ms - 1, end_ms)
+        params = {'symbol': symbol, 'startTime': start_ms, 'endTime': window_end, 'limit': spec['limit']}
+        if spec['period_param']:
+            params[spec['period_param']] = period
+        page = await request(spec['url'], params, spec['weight'])
+        time_key = spec['time']
+        page = sorted((record for record in page if start_ms <= record[time_key] <= window_end),
+                      key=lambda record: record[time_key])
+        if page:
+            await queue.put((endpoint, symbol, page))
+            start_ms = page[-1][time_key] + 1
+        else:
+            start_ms = window_end + 1
+
+async def _write_batches(queue, output_dir, batch_rows, flush_seconds, written):
+    """
+    Drains the queue into per-(endpoint, symbol) buffers and writes a buffer once it holds
+    batch_rows rows, or when no page has arrived for flush_seconds. Writes run on a thread so the
+    event loop keeps fetching. Stops at a None item after flushing everything.
+    """
+    buffers = {}
+
+    async def flush(key):
+        endpoint, symbol = key
+        rows = buffers.pop(key)
+        await asyncio.to_thread(write_page, rows, os.path.join(output_dir, endpoint), symbol, endpoint)
+        written[endpoint][symbol] = written[endpoint].get(symbol, 0) + len(rows)
+
+    while True:
+        try:
+            item = await asyncio.wait_for(queue.get(), flush_seconds)
+        except asyncio.TimeoutError:
+            for key in list(buffers):
+                await flush(key)
+            continue
+        if item is None:
             break
+        endpoint, symbol, rows = item
+        buffers.setdefault((endpoint, symbol), []).extend(rows)
+        if len(buffers[endpoint, symbol]) >= batch_rows:
+            await flush((endpoint, symbol))
+    for key in list(buffers):
+        await flush(key)
+
+async def collect_market_data(symbols, output_dir, endpoints=tuple(ENDPOINTS), period='5m', start_time=None,
+                              end_time=None, fetch=None, per_host=10, weight_limit=2400, headroom=0.8,
+                              queue_size=64, batch_rows=10000, flush_seconds=5.0, max_retries=5, backoff=1.0,
+                              timeout=30):
+    """
+    Collects open interest, funding rates and klines for many symbols concurrently into one
+    dataset per endpoint (output_dir/<endpoint>, laid out like download_open_interest's).
+    Every (endpoint, symbol) series pages forward from its own high-water mark on one pooled
+    session. Requests are capped per host and throttled on the server's request weight. Pages go
+    through a bounded queue to a single batch writer, so fetching slows down when writing falls behind.
+    Parameters:
+    - symbols (iterable of str): Futures symbols, e.g. 'BTCUSDT'.
+    - output_dir (str): Root directory of the endpoint datasets; read one back with load_open_interest.
+    - endpoints (iterable of str): Keys of ENDPOINTS to collect.
+    - period (str): Bar period of open interest and klines, one of PERIOD_MS.
+    - start_time (str or datetime): Start for series with no stored data (defaults to HISTORY_DAYS back).
+    - end_time (str or datetime): Last bar to fetch (defaults to now).
+    - fetch (callable): async fetch(url, params) -> (status, headers, payload); defaults to aiohttp_fetcher.
+    - per_host (int): Maximum requests in flight to one host.
+    - weight_limit (int): Request weight allowed per minute by the server.
+    - headroom (float): Fraction of weight_limit used, leaving room for other clients on the same IP.
+    - queue_size (int): Pages buffered between the fetchers and the writer.
+    - batch_rows (int): Rows per (endpoint, symbol) buffered before a write.
+    - flush_seconds (float): Idle time after which all buffers are written.
+    Returns:
+    - dict: 'written' (rows by endpoint and symbol) and 'failed' (error message by 'endpoint/symbol').
+    """
+    if period not in PERIOD_MS:
+        raise ValueError(f"period must be one of {', '.join(PERIOD_MS)}.")
+    session = None
+    if fetch is None:
+        import aiohttp
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=per_host, keepalive_timeout=60),
+                                        timeout=aiohttp.ClientTimeout(total=timeout))
+        fetch = aiohttp_fetcher(session)
+    throttle = WeightThrottle(weight_limit, headroom)
+    host_slots = defaultdict(lambda: asyncio.Semaphore(per_host))
+
+    async def request(url, params, weight):
+        return await _request(fetch, throttle, host_slots, url, params, weight, max_retries, backoff)
 
-    return all_data
+    summary = {'written': {endpoint: {} for endpoint in endpoints}, 'failed': {}}
+    queue = asyncio.Queue(maxsize=queue_size)
+    series = [(endpoint, symbol) for endpoint in endpoints for symbol in dict.fromkeys(symbols)]
+    try:
+        writer = asyncio.create_task(_write_batches(queue, output_dir, batch_rows, flush_seconds, summary['written']))
+        producers = asyncio.gather(*(_collect_series(endpoint, symbol, queue, request, output_dir, period, start_time,
+                                                     end_time) for endpoint, symbol in series),
+                                   return_exceptions=True)
+        await asyncio.wait({producers, writer}, return_when=asyncio.FIRST_COMPLETED)
+        if writer.done():
+            # The writer only stops early when a write failed; the producers finish cancelling
+            # before the error is raised and the session closed
+            producers.cancel()
+            await asyncio.gather(producers, return_exceptions=True)
+            writer.result()
+        for (endpoint, symbol), result in zip(series, producers.result()):
+            if isinstance(result, Exception):
+                # Pages queued before the failure are still written; the next run resumes from them
+                summary['failed'][f"{endpoint}/{symbol}"] = f"{type(result).__name__}: {result}"
+        await queue.put(None)
+        await writer
+    finally:
+        if session is not None:
+            await session.close()
+    return summary
 
-# URL for the Binance API
-url = "https://fapi.binance.com/futures/data/openInterestHist?symbol=BTCUSDT&period=5m"
+if __name__ == "__main__":
+    import argparse
 
-# Define the start date
-start_date = "2023-11-14"
+    parser = argparse.ArgumentParser(description="Download Binance futures open interest history into a Parquet dataset.")
+    parser.add_argument("--symbols", nargs="+", default=["BTCUSDT"], help="Futures symbols to download.")
+    parser.add_argument("--output", default="open_interest", help="Dataset directory.")
+    parser.add_argument("--period", default="5m", choices=list(PERIOD_MS), help="Bar period.")
+    parser.add_argument("--start", help="Start date (YYYY-MM-DD) for symbols with no stored data.")
+    parser.add_argument("--workers", type=int, default=4, help="Symbols downloaded at once.")
+    parser.add_argument("--rate", type=float, default=2.0, help="Requests per second across all workers.")
+    parser.add_argument("--collect", nargs="*", choices=list(ENDPOINTS),
+                        help="Collect these endpoints (all when none are named) with the async collector.")
+    parser.add_argument("--replay", help="JSON fixture served instead of the live endpoint.")
+    parser.add_argument("--record", help="Save the fetched records to this JSON fixture.")
+    args = parser.parse_args()
 
-# Fetch data
-data = fetch_data(url, start_date)
+    if args.collect is not None:
+        summary = asyncio.run(collect_market_data(args.symbols, args.output, args.collect or tuple(ENDPOINTS),
+                                                  args.period, args.start))
+        print(summary)
+    else:
+        fetch = ReplayFetcher(args.replay) if args.replay else binance_fetcher(pool_size=args.workers)
+        if args.record:
+            fetch = RecordingFetcher(fetch)
+        summary = download_open_interest(args.symbols, args.output, args.period, args.start, fetch=fetch,
+                                         workers=args.workers, rate=args.rate)
+        if args.record:
+            fetch.save(args.record)
+        print(summary)
 
-# Create DataFrame and convert timestamp
-if data:
-    df = pd.DataFrame(data)
-    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-    print(f"Total rows retrieved: {len(df)}")
-else:
-    print("No data retrieved.")
+        df = load_open_interest(args.output, args.symbols)
+        print(f"Total rows stored: {len(df)}")
+        print(df.tail())
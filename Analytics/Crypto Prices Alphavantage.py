@@ -1,7 +1,20 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-from alpha_vantage.timeseries import TimeSeries
-from alpha_vantage.cryptocurrencies import CryptoCurrencies
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+# Shared helpers live in the common package at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from common.jobs import load_jobs
+from common.plotting import downsample, new_figure, show_or_save
+from common.search import SearchIndex
+
 
 digital_currencies = {'1ST': 'FirstBlood',
  '2GIVE': 'GiveCoin',
@@ -756,14 +769,31 @@ def select_method():
         else:
             print("Invalid selection. Please try again.")
 
-selected_method = select_method()
-
+# Indexes of the catalogs searched in this process, by catalog fingerprint, and the fingerprint of
+# every catalog by id (holding on to the catalog so its id is not reused)
+catalog_indexes = {}
+catalog_fingerprints = {}
 
-    
+def catalog_index(dictionary, index_dir='catalog_index'):
+    """
+    The search index of a {code: name} catalog, built once and saved under a name derived from
+    the catalog's content, so an edited catalog gets a new index instead of a stale one.
+    """
+    if id(dictionary) not in catalog_fingerprints:
+        catalog_fingerprints[id(dictionary)] = (
+            dictionary, hashlib.sha1(json.dumps(dictionary, sort_keys=True).encode()).hexdigest())
+    fingerprint = catalog_fingerprints[id(dictionary)][1]
+    if fingerprint not in catalog_indexes:
+        path = os.path.join(index_dir, f"catalog_{fingerprint[:16]}.json")
+        if os.path.exists(path):
+            catalog_indexes[fingerprint] = SearchIndex.load(path)
+        else:
+            catalog_indexes[fingerprint] = SearchIndex.build(dictionary, fingerprint)
+            catalog_indexes[fingerprint].save(path)
+    return catalog_indexes[fingerprint]
 
-def search_dictionary(query, dictionary):
-    results = {key: value for key, value in dictionary.items() if query.lower() in key.lower() or query.lower() in value.lower()}
-    return results
+def search_dictionary(query, dictionary, limit=None):
+    return catalog_index(dictionary).search(query, limit)
 
 def user_select_option(dictionary, option_type):
     while True:
@@ -784,40 +814,230 @@ def user_select_option(dictionary, option_type):
 
         print("Invalid selection. Please try again.")
 
-# Main execution
-key = 'QESM45CIVLQATEQW'
-cc = CryptoCurrencies(key, output_format='pandas')
+# Short names accepted in job files for the CryptoCurrencies methods
+FUNCTIONS = {
+    'daily': 'get_digital_currency_daily',
+    'weekly': 'get_digital_currency_weekly',
+    'monthly': 'get_digital_currency_monthly',
+}
 
-selected_symbol = user_select_option(digital_currencies, "symbol")
-selected_market = user_select_option(ccy, "market")
+columns = ['Open', 'Open (USD)', 'High', 'High (USD)', 'Low', 'Low (USD)', 'Close', 'Close (USD)', '5. volume', 'Market cap (USD)']
 
-# Dynamically call the selected method
-if hasattr(cc, selected_method):
-    method_to_call = getattr(cc, selected_method)
-    data, meta = method_to_call(symbol=selected_symbol, market=selected_market)
-else:
-    print(f"Method {selected_method} not found in CryptoCurrencies class.")
+def fetch_prices(cc, method, symbol, market):
+    method = FUNCTIONS.get(method, method)
+    if not hasattr(cc, method):
+        raise ValueError(f"Method {method} not found in CryptoCurrencies class.")
+    data, meta = getattr(cc, method)(symbol=symbol, market=market)
+    data.columns = columns
+    return data
 
-columns = ['Open', 'Open (USD)', 'High', 'High (USD)', 'Low', 'Low (USD)', 'Close', 'Close (USD)', '5. volume', 'Market cap (USD)']
-data.columns = columns
-
-# Display available columns for plotting
-print("Available columns for plotting:")
-for i, column in enumerate(data.columns, 1):
-    print(f"{i}. {column}")
-
-# Ask the user to select a column
-while True:
-    column_choice = input("Enter the number of the column you want to plot: ")
-    if column_choice.isdigit() and 0 < int(column_choice) <= len(data.columns):
-        selected_column = data.columns[int(column_choice) - 1]
-        break
+# Plot one column, downsampled to about max_points points; with output set, write a PNG instead of showing it
+def plot_prices(data, column, symbol, market, max_points=2000, method='lttb', output=None):
+    series = data[column].sort_index()
+    if max_points:
+        series = series.iloc[downsample(series.index.asi8, series, max_points, method)]
+    figure = new_figure(output)
+    axes = figure.gca()
+    axes.plot(series)
+    axes.set_title(f"{symbol} - {column} in {market}")
+    axes.set_xlabel("Date")
+    axes.set_ylabel(column)
+    show_or_save(figure, output)
+
+# Resampling rule, as a pandas.offsets class and its arguments, and how each column is aggregated when
+# bars are built from daily prices. Offsets rather than aliases, since month-end is 'ME' from pandas 2.2
+# and 'M' before it.
+RESAMPLE_RULES = {'get_digital_currency_weekly': ('Week', {'weekday': 6}),
+                  'get_digital_currency_monthly': ('MonthEnd', {})}
+
+def aggregation(column):
+    if column.startswith('Open'):
+        return 'first'
+    if column.startswith('High'):
+        return 'max'
+    if column.startswith('Low'):
+        return 'min'
+    if 'volume' in column.lower():
+        return 'sum'
+    return 'last'
+
+def resample_prices(daily, method):
+    """
+    Weekly or monthly bars built from daily prices, labelled with the last date in each bar as
+    Alpha Vantage does (so the current, unfinished bar is labelled with the latest date).
+    """
+    import pandas as pd
+
+    offset, arguments = RESAMPLE_RULES[FUNCTIONS.get(method, method)]
+    rule = getattr(pd.offsets, offset)(**arguments)
+    daily = daily.sort_index()
+    bars = daily.resample(rule).agg({column: aggregation(column) for column in daily.columns})
+    bars.index = daily.index.to_series().resample(rule).max()
+    return bars.dropna(how='all')
+
+class PriceCache:
+    """
+    Cache of Alpha Vantage crypto prices keyed by (function, symbol, market), with an in-memory
+    LRU tier in front of one Parquet file per key.
+    A frame is fresh once it holds the last completed UTC day as fetched after that day closed;
+    today's unfinished bar alone does not trigger a refresh (pass refresh=True for it). A frame
+    fetched less than max_age seconds ago is always fresh, so a series the API has not yet
+    extended is not refetched on every call. Alpha Vantage always returns the full history, so a
+    refresh costs one call and only the rows from the last stored date onwards are merged in.
+    Weekly and monthly bars are resampled from the cached daily prices unless resample is False.
+    Live calls are spaced at least min_interval seconds apart to stay within the free-tier quota.
+    """
+    def __init__(self, cc, cache_dir='alpha_vantage_cache', max_entries=32, max_age=3600, resample=True,
+                 min_interval=12.0):
+        self.cc = cc
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.resample = resample
+        self.min_interval = min_interval
+        self.memory = OrderedDict()
+        self.last_call = None
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path(self, method, symbol, market):
+        return os.path.join(self.cache_dir, f"{method}_{symbol}_{market}.parquet")
+
+    def is_stale(self, data, updated):
+        if data is None or data.empty:
+            return True
+        if time.time() - updated < self.max_age:
+            return False
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        last_completed_day = (today - timedelta(days=1)).date()
+        # A bar fetched before today may have been the unfinished bar of the last completed day
+        return data.index.max().date() < last_completed_day or updated < today.timestamp()
+
+    def get(self, method, symbol, market, refresh=False):
+        """
+        Prices for one key, served from memory or disk when fresh and refreshed otherwise.
+        """
+        method = FUNCTIONS.get(method, method)
+        if method in RESAMPLE_RULES and self.resample:
+            key = (method, symbol, market)
+            daily = self.get('get_digital_currency_daily', symbol, market, refresh)
+            entry = self.memory.get(key)
+            # Derived bars stay valid for as long as the daily frame they came from
+            if entry is None or entry[1] is not daily:
+                entry = (resample_prices(daily, method), daily)
+            self.remember(key, entry)
+            return entry[0]
+
+        key = (method, symbol, market)
+        entry = self.memory.get(key)
+        if entry is None:
+            entry = self.load(method, symbol, market)
+        if refresh or self.is_stale(*entry):
+            entry = self.refresh(method, symbol, market, entry[0])
+        self.remember(key, entry)
+        return entry[0]
+
+    def remember(self, key, entry):
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def load(self, method, symbol, market):
+        """The stored frame and its modification time, or (None, 0) when nothing is stored."""
+        import pandas as pd
+
+        path = self.path(method, symbol, market)
+        if not os.path.exists(path):
+            return None, 0.0
+        return pd.read_parquet(path), os.path.getmtime(path)
+
+    def refresh(self, method, symbol, market, stored):
+        """
+        Fetches the prices and merges the rows from the last stored date onwards into the stored
+        frame; that last row is replaced because it may have been an unfinished bar.
+        """
+        import pandas as pd
+
+        if self.last_call is not None:
+            time.sleep(max(0.0, self.last_call + self.min_interval - time.monotonic()))
+        self.last_call = time.monotonic()
+        fetched = fetch_prices(self.cc, method, symbol, market).sort_index()
+        if stored is not None and not stored.empty:
+            tail = fetched[fetched.index >= stored.index.max()]
+            fetched = pd.concat([stored[stored.index < stored.index.max()], tail])
+
+        path = self.path(method, symbol, market)
+        temporary_path = path + '.tmp'
+        fetched.to_parquet(temporary_path)
+        os.replace(temporary_path, path)
+        return fetched, time.time()
+
+# Fetch every {function, symbol, market} job into one frame indexed by function, symbol, market and date,
+# through the cache when one is given
+def run_jobs(cc, jobs, cache=None):
+    import pandas as pd
+
+    frames = {}
+    for job in jobs:
+        function = job.get('function', 'daily')
+        if cache is not None:
+            frames[(function, job['symbol'], job['market'])] = cache.get(function, job['symbol'], job['market'])
+        else:
+            frames[(function, job['symbol'], job['market'])] = fetch_prices(cc, function, job['symbol'], job['market'])
+    return pd.concat(frames, names=['function', 'symbol', 'market'])
+
+def run_interactive(cc, cache=None):
+    selected_method = select_method()
+    selected_symbol = user_select_option(digital_currencies, "symbol")
+    selected_market = user_select_option(ccy, "market")
+    if cache is not None:
+        data = cache.get(selected_method, selected_symbol, selected_market)
     else:
-        print("Invalid selection. Please try again.")
+        data = fetch_prices(cc, selected_method, selected_symbol, selected_market)
+
+    # Display available columns for plotting
+    print("Available columns for plotting:")
+    for i, column in enumerate(data.columns, 1):
+        print(f"{i}. {column}")
+
+    # Ask the user to select a column
+    while True:
+        column_choice = input("Enter the number of the column you want to plot: ")
+        if column_choice.isdigit() and 0 < int(column_choice) <= len(data.columns):
+            selected_column = data.columns[int(column_choice) - 1]
+            break
+        else:
+            print("Invalid selection. Please try again.")
+
+    plot_prices(data, selected_column, selected_symbol, selected_market)
+
+# Main execution: fetch a job file in bulk, or prompt when no job file is given
+def main():
+    parser = argparse.ArgumentParser(description="Fetch cryptocurrency prices from Alpha Vantage.")
+    parser.add_argument("--jobs", help="JSON, YAML or CSV file of function, symbol and market fields to fetch without prompting.")
+    parser.add_argument("--output", help="CSV file for the prices (printed when omitted).")
+    parser.add_argument("--key", default=os.environ.get('ALPHA_VANTAGE_KEY', 'QESM45CIVLQATEQW'), help="Alpha Vantage API key.")
+    parser.add_argument("--cache", default="alpha_vantage_cache", help="Directory of cached prices.")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the API.")
+    parser.add_argument("--plot-dir", help="Write a PNG of the close of every job to this directory.")
+    args = parser.parse_args()
+
+    from alpha_vantage.cryptocurrencies import CryptoCurrencies
+    cc = CryptoCurrencies(args.key, output_format='pandas')
+    cache = None if args.no_cache else PriceCache(cc, args.cache)
+    if not args.jobs:
+        run_interactive(cc, cache)
+        return
+    data = run_jobs(cc, load_jobs(args.jobs), cache)
+    if args.plot_dir:
+        os.makedirs(args.plot_dir, exist_ok=True)
+        for (function, symbol, market), prices in data.groupby(level=['function', 'symbol', 'market']):
+            plot_prices(prices.droplevel(['function', 'symbol', 'market']), 'Close', symbol, market,
+                        output=os.path.join(args.plot_dir, f"{function}_{symbol}_{market}.png"))
+    if args.output:
+        data.to_csv(args.output)
+    else:
+        print(data)
 
-# Plotting the selected column
-plt.plot(data[selected_column])
-plt.title(f"{selected_symbol} - {selected_column} in {selected_market}")
-plt.xlabel("Date")
-plt.ylabel(selected_column)
-plt.show()
+if __name__ == "__main__":
+    main()
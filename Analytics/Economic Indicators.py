@@ -1,10 +1,41 @@
-import wbgapi as wb
+import argparse
+import os
+import random
+import sys
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from types import SimpleNamespace
+
+# Shared helpers live in the common package at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from common.jobs import load_jobs
+from common.search import SearchIndex
+
+
+# Search index of the World Bank series, loaded once per process
+indicator_indexes = {}
+
+# Function to load the indicator search index, rebuilding it from a full series listing when it
+# is missing or older than max_age seconds
+def indicator_index(path='catalog_index/wb_series.json', max_age=30 * 86400, refresh=False):
+    if path in indicator_indexes and not refresh:
+        return indicator_indexes[path]
+    if not refresh and os.path.exists(path) and time.time() - os.path.getmtime(path) < max_age:
+        index = SearchIndex.load(path)
+    else:
+        import wbgapi as wb
+        index = SearchIndex.build({ind['id']: ind['value'] for ind in wb.series.list()})
+        index.save(path)
+    indicator_indexes[path] = index
+    return index
 
 # Function to search indicators based on a query
-def search_indicators(query):
-    all_indicators = wb.series.list()
-    filtered_indicators = {ind['id']: ind['value'] for ind in all_indicators if query.lower() in ind['value'].lower()}
-    return filtered_indicators
+def search_indicators(query, limit=None):
+    return indicator_index().search(query, limit)
 
 # Function for the user to select an indicator
 def select_indicator():
@@ -38,6 +69,7 @@ def select_timeframe():
 
 # Function to fetch data from the World Bank API
 def fetch_data(indicator, start, end):
+    import wbgapi as wb
     if start is None or end is None:
         data = wb.data.DataFrame(indicator)
     else:
@@ -45,8 +77,216 @@ def fetch_data(indicator, start, end):
 
     return data
 
-# Main execution
-selected_indicator = select_indicator()
-start_year, end_year = select_timeframe()
-data = fetch_data(selected_indicator, start_year, end_year)
-print(data)
+class StubWorldBank:
+    """
+    Offline stand-in for the wbgapi module, serving deterministic values for data.fetch, a series
+    catalog for series.list and the economies for economy.list. Every data request is kept in `requests`; changing `revision`
+    changes the values, like a World Bank data revision.
+    """
+    def __init__(self, economies=('USA', 'GBR', 'DEU', 'JPN', 'CHN'), first_year=1960, last_year=None, series=None):
+        self.economies = list(economies)
+        self.first_year = first_year
+        self.last_year = last_year or date.today().year - 1
+        self.catalog = series or {'NY.GDP.MKTP.CD': 'GDP (current US$)', 'SP.POP.TOTL': 'Population, total',
+                                  'FP.CPI.TOTL.ZG': 'Inflation, consumer prices (annual %)'}
+        self.revision = 0
+        self.requests = []
+        self.data = SimpleNamespace(fetch=self.fetch)
+        self.series = SimpleNamespace(list=self.list_series)
+        self.economy = SimpleNamespace(list=self.list_economies)
+
+    def list_series(self):
+        return [{'id': code, 'value': name} for code, name in self.catalog.items()]
+
+    def list_economies(self):
+        return [{'id': code, 'value': code} for code in self.economies]
+
+    def fetch(self, series, economy='all', time='all', skipBlanks=False, **kwargs):
+        series = [series] if isinstance(series, str) else list(series)
+        economies = self.economies if economy == 'all' else [economy] if isinstance(economy, str) else list(economy)
+        years = range(self.first_year, self.last_year + 1) if time == 'all' else time
+        self.requests.append((tuple(series), tuple(economies), tuple(years)))
+        for code in series:
+            for economy_code in economies:
+                for year in years:
+                    if self.first_year <= year <= self.last_year:
+                        key = f"{code}|{economy_code}|{year}|{self.revision}".encode()
+                        yield {'value': zlib.crc32(key) / 2 ** 32 * 100, 'series': code, 'economy': economy_code,
+                               'time': f"YR{year}", 'aggregate': False}
+
+# Function to fetch one group of indicators in a single multi-series request, retrying failures
+def fetch_group(backend, indicators, economies, years, max_retries=3, backoff=2.0):
+    for attempt in range(max_retries + 1):
+        try:
+            return [(row['series'], row['economy'], int(str(row['time'])[2:]), row['value'])
+                    for row in backend.data.fetch(indicators, economy=economies, time=years, skipBlanks=True)
+                    if row['value'] is not None]
+        except Exception:
+            if attempt == max_retries:
+                raise
+            time.sleep(random.uniform(0, backoff * 2 ** attempt))
+
+# Function to give the path of an indicator's file in the store
+def indicator_path(store_dir, indicator):
+    return os.path.join(store_dir, f"indicator={indicator}", 'data.parquet')
+
+# Function to list the economies whose full history is stored for an indicator: the ones recorded in
+# the file's metadata, or for files written without it, the ones with any stored value
+def stored_economies(store_dir, indicator):
+    import pyarrow.parquet as pq
+
+    path = indicator_path(store_dir, indicator)
+    if not os.path.exists(path):
+        return set()
+    metadata = pq.read_schema(path).metadata or {}
+    if b'economies' in metadata:
+        return set(filter(None, metadata[b'economies'].decode().split(';')))
+    return set(pq.read_table(path, columns=['economy'])['economy'].to_pylist())
+
+# Function to replace the stored values of one indicator for the fetched economies from first_year onwards.
+# With full set the rows hold the whole history of those economies, which is recorded in the file.
+def write_indicator(store_dir, indicator, rows, first_year, economies, full=False):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([('economy', pa.string()), ('year', pa.int16()), ('value', pa.float64())])
+    new = pa.table({'economy': [row[1] for row in rows], 'year': [row[2] for row in rows],
+                    'value': [row[3] for row in rows]}, schema=schema)
+    path = indicator_path(store_dir, indicator)
+    complete = stored_economies(store_dir, indicator)
+    if os.path.exists(path):
+        stored = pq.read_table(path, schema=schema)
+        fetched = pc.is_in(stored['economy'], value_set=pa.array(list(economies), pa.string()))
+        keep = pc.or_(pc.invert(fetched), pc.less(stored['year'], first_year))
+        new = pa.concat_tables([stored.filter(keep), new])
+    if full:
+        complete |= set(economies)
+    new = new.sort_by([('economy', 'ascending'), ('year', 'ascending')])
+    new = new.replace_schema_metadata({'economies': ';'.join(sorted(complete))})
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(new, path + '.tmp')
+    os.replace(path + '.tmp', path)
+    return new.num_rows
+
+# Function to fetch many indicators for many economies into a local Parquet store with one file per indicator.
+# Economies whose full history is already stored for an indicator are refreshed for the last recent_years
+# years only (the years the World Bank still revises); the others are fetched from start. Indicators are
+# requested group_size at a time on a bounded thread pool.
+def fetch_indicators(indicators, store_dir='world_bank', economies='all', start=1960, end=None, recent_years=5,
+                     group_size=20, workers=4, backend=None, max_retries=3):
+    if backend is None:
+        import wbgapi as backend
+    end = end or date.today().year
+    refresh_start = max(start, end - recent_years + 1)
+    if economies == 'all':
+        economies = [row['id'] for row in backend.economy.list()]
+    economies = [economies] if isinstance(economies, str) else list(dict.fromkeys(economies))
+
+    # Requests only combine indicators that need the same years for the same economies
+    by_request = {}
+    for indicator in dict.fromkeys(indicators):
+        complete = stored_economies(store_dir, indicator)
+        missing = tuple(economy for economy in economies if economy not in complete)
+        present = tuple(economy for economy in economies if economy in complete)
+        for first_year, subset in ((start, missing), (refresh_start, present)):
+            if subset:
+                by_request.setdefault((first_year, subset), []).append(indicator)
+    groups = [(first_year, subset, codes[i:i + group_size]) for (first_year, subset), codes in by_request.items()
+              for i in range(0, len(codes), group_size)]
+
+    summary = {'rows': {}, 'failed': {}}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fetch_group, backend, codes, list(subset), range(first_year, end + 1), max_retries):
+                   (first_year, subset, codes) for first_year, subset, codes in groups}
+        for future in as_completed(futures):
+            first_year, subset, codes = futures[future]
+            try:
+                rows = future.result()
+            except Exception as error:
+                for code in codes:
+                    summary['failed'][code] = f"{type(error).__name__}: {error}"
+                continue
+            by_indicator = {code: [] for code in codes}
+            for row in rows:
+                by_indicator.setdefault(row[0], []).append(row)
+            # Files are written from this thread only; an empty refresh keeps what is stored
+            for code, indicator_rows in by_indicator.items():
+                if indicator_rows or first_year == start:
+                    summary['rows'][code] = write_indicator(store_dir, code, indicator_rows, first_year, subset,
+                                                            full=first_year == start)
+    return summary
+
+# Function to read stored indicators as a long frame of indicator, economy, year and value, reading only
+# the files and columns needed
+def load_indicators(store_dir='world_bank', indicators=None, economies=None, start=None, end=None):
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(store_dir, format='parquet', partitioning='hive')
+    filters = []
+    if indicators is not None:
+        filters.append(ds.field('indicator').isin(list(indicators)))
+    if economies is not None:
+        filters.append(ds.field('economy').isin(list(economies)))
+    if start is not None:
+        filters.append(ds.field('year') >= start)
+    if end is not None:
+        filters.append(ds.field('year') <= end)
+    condition = None
+    for expression in filters:
+        condition = expression if condition is None else condition & expression
+    data = dataset.to_table(filter=condition).to_pandas()
+    return data[['indicator', 'economy', 'year', 'value']].sort_values(['indicator', 'economy', 'year'],
+                                                                         ignore_index=True)
+
+# Function to fetch every job without prompting; a missing or 'all' start or end year fetches the full range
+def run_jobs(jobs):
+    import pandas as pd
+
+    frames = {}
+    for index, job in enumerate(jobs):
+        start, end = job.get('start'), job.get('end')
+        if start in (None, '', 'all') or end in (None, '', 'all'):
+            start, end = None, None
+        else:
+            start, end = int(start), int(end)
+        frames[(index, job['indicator'])] = fetch_data(job['indicator'], start, end)
+    # One long frame indexed by job number, indicator and economy, with one column per year; jobs
+    # for the same indicator over different years are kept apart
+    return pd.concat(frames, names=['job', 'indicator'])
+
+# Function for the interactive session
+def run_interactive():
+    selected_indicator = select_indicator()
+    start_year, end_year = select_timeframe()
+    data = fetch_data(selected_indicator, start_year, end_year)
+    print(data)
+
+# Main execution: fetch a job file in bulk, or prompt when no job file is given
+def main():
+    parser = argparse.ArgumentParser(description="Fetch World Bank indicators.")
+    parser.add_argument("--jobs", help="JSON, YAML or CSV file of indicator, start and end fields to fetch without prompting.")
+    parser.add_argument("--indicators", nargs="+", help="Indicator codes to fetch in bulk into the local store.")
+    parser.add_argument("--store", default="world_bank", help="Directory of the local indicator store.")
+    parser.add_argument("--recent-years", type=int, default=5, help="Years refreshed for indicators already stored.")
+    parser.add_argument("--workers", type=int, default=4, help="Requests run at once.")
+    parser.add_argument("--output", help="CSV file for the data (printed when omitted).")
+    args = parser.parse_args()
+
+    if args.indicators:
+        summary = fetch_indicators(args.indicators, args.store, recent_years=args.recent_years, workers=args.workers)
+        if summary['failed']:
+            print(f"Failed: {summary['failed']}")
+        data = load_indicators(args.store, args.indicators)
+    elif not args.jobs:
+        run_interactive()
+        return
+    else:
+        data = run_jobs(load_jobs(args.jobs))
+    if args.output:
+        data.to_csv(args.output)
+    else:
+        print(data)
+
+if __name__ == "__main__":
+    main()
@@ -1,88 +1,201 @@
-import requests
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
-def fetch_gdelt_data(keywords, start_date, end_date):
+# Shared helpers live in the common package at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from common.rate_limit import RetryableError, TokenBucket, call_with_retry
+from common.plotting import downsample, new_figure, show_or_save
+
+GDELT_URL = 'https://api.gdeltproject.org/api/v2/doc/doc'
+GDELT_FORMAT = '%Y%m%d%H%M%S'
+# Chunks are laid on a fixed grid from the start of the DOC API's coverage, so any requested
+# window reuses the chunks cached for earlier windows
+CHUNK_EPOCH = datetime(2017, 1, 1)
+# GDELT publishes new articles every 15 minutes, so a chunk is complete once fetched that long after it ended
+GDELT_UPDATE = timedelta(minutes=15)
+
+def gdelt_fetcher(pool_size=8, timeout=60):
     """
-    Fetches news volume data for the given keywords within a specified date range from the GDELT API.
+    Returns a fetch function sending GDELT DOC API requests over one pooled session.
     Parameters:
-    - keywords (str): A string of keywords to search for, formatted for the GDELT API query.
+    - pool_size (int): Connections kept open to the API.
+    - timeout (float): Seconds to wait for a response.
+    Returns:
+    - callable: fetch(params) -> the decoded JSON response.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+
+    def fetch(params):
+        try:
+            response = session.get(GDELT_URL, params=params, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as error:
+            raise RetryableError(str(error)) from error
+        if response.status_code == 429 or response.status_code >= 500:
+            raise RetryableError(f"HTTP {response.status_code}")
+        response.raise_for_status()
+        try:
+            return response.json()
+        except ValueError:
+            # GDELT explains rejected queries in plain text
+            raise ValueError(f"GDELT rejected the query {params['query']!r}: {response.text.strip()}") from None
+
+    return fetch
+
+def chunk_windows(start_date, end_date, chunk_days=90):
+    """
+    Splits a window into the grid-aligned chunks covering it.
+    Parameters:
+    - start_date (str): Start of the window in "YYYYMMDDHHMMSS" format.
+    - end_date (str): End of the window in "YYYYMMDDHHMMSS" format.
+    - chunk_days (int): Length of each chunk in days.
+    Returns:
+    - list of tuple: (chunk start, chunk end) datetimes.
+    """
+    start, end = datetime.strptime(start_date, GDELT_FORMAT), datetime.strptime(end_date, GDELT_FORMAT)
+    length = timedelta(days=chunk_days)
+    first = (start - CHUNK_EPOCH) // length
+    last = (end - CHUNK_EPOCH) // length
+    return [(CHUNK_EPOCH + k * length, CHUNK_EPOCH + (k + 1) * length - timedelta(seconds=1))
+            for k in range(first, last + 1)]
+
+def fetch_chunk(fetch, bucket, query, mode, chunk_start, chunk_end, cache_dir, open_ttl=3600, max_retries=5,
+                backoff=5.0):
+    """
+    Returns the response for one (query, mode, chunk), from the disk cache when possible.
+    A cache entry fetched after its chunk ended (and GDELT published the last update of it) is
+    kept for good; any other entry, such as the chunk still in progress, fetched up to the time it
+    was requested, expires after open_ttl seconds.
+    """
+    key = hashlib.sha1(f"{query}|{mode}|{chunk_start:{GDELT_FORMAT}}|{chunk_end:{GDELT_FORMAT}}".encode()).hexdigest()
+    path = os.path.join(cache_dir, f"{key}.json")
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    complete_after = (chunk_end + GDELT_UPDATE).replace(tzinfo=timezone.utc).timestamp()
+    if os.path.exists(path) and (os.path.getmtime(path) > complete_after
+                                 or time.time() - os.path.getmtime(path) < open_ttl):
+        with open(path) as cache_file:
+            return json.load(cache_file)
+
+    params = {'query': query, 'mode': mode, 'format': 'json', 'startdatetime': f"{chunk_start:{GDELT_FORMAT}}",
+              'enddatetime': f"{min(chunk_end, now):{GDELT_FORMAT}}"}
+    response = call_with_retry(lambda: fetch(params), bucket, max_retries, backoff)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(path + '.tmp', 'w') as cache_file:
+        json.dump(response, cache_file)
+    os.replace(path + '.tmp', path)
+    return response
+
+def timeline_rows(response, label):
+    """
+    Flattens a timeline response into (query, series, date, value, norm) rows; norm, the total
+    number of articles monitored, is only sent by the raw volume modes.
+    """
+    rows = []
+    for series in response.get('timeline', []):
+        for point in series['data']:
+            rows.append((label, series['series'], point['date'], point['value'], point.get('norm')))
+    return rows
+
+def fetch_gdelt_timelines(queries, start_date, end_date, mode='TimelineVolRaw', chunk_days=90, cache_dir='gdelt_cache',
+                          workers=4, rate=0.2, fetch=None):
+    """
+    Fetches the timelines of many queries over a long window as one tidy long-format DataFrame.
+    The window is split into grid-aligned chunks of chunk_days, every (query, chunk) is fetched
+    concurrently over one pooled session behind a shared rate limiter, and every response is
+    cached on disk, so fetching the same or an overlapping window again only requests the
+    chunks not cached yet.
+    Parameters:
+    - queries (list of str or dict): GDELT queries, or a dict of label: query.
     - start_date (str): The start date for the data query in "YYYYMMDDHHMMSS" format.
     - end_date (str): The end date for the data query in "YYYYMMDDHHMMSS" format.
+    - mode (str): A timeline mode such as 'TimelineVolRaw', 'TimelineVol' or 'TimelineTone'.
+    - chunk_days (int): Days per request; shorter chunks keep a finer resolution.
+    - cache_dir (str): Directory of cached responses.
+    - workers (int): Number of requests in flight.
+    - rate (float): Requests per second across all workers (GDELT asks for one every 5 seconds).
+    - fetch (callable): fetch(params) -> JSON response; defaults to gdelt_fetcher(workers).
     Returns:
-    - dict: A dictionary containing the JSON response from the GDELT API if the request is successful; None otherwise.
+    - DataFrame: Columns query, series, date, value and norm, sorted by query and date.
     """
-    # GDELT API endpoint for document retrieval.
-    url = 'https://api.gdeltproject.org/api/v2/doc/doc'
-    # Parameters for the API request.
-    params = {
-        'query': keywords,
-        'mode': 'TimelineVolRaw',
-        'format': 'json',
-        'startdatetime': start_date,
-        'enddatetime': end_date
-    }
-    # Attempt to fetch data from the GDELT API.
-    try:
-        response = requests.get(url, params=params)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(f"HTTP Error: {response.status_code}")
-            print("Response content:", response.text)
-            return None
-    except Exception as e:
-        print(f"Request Error: {e}")
-        return None
-
-def plot_data(*dataframes, labels=None):
+    import pandas as pd
+
+    queries = queries if isinstance(queries, dict) else {query: query for query in queries}
+    fetch = fetch if fetch is not None else gdelt_fetcher(workers)
+    bucket = TokenBucket(rate)
+    chunks = chunk_windows(start_date, end_date, chunk_days)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [(label, pool.submit(fetch_chunk, fetch, bucket, query, mode, chunk_start, chunk_end, cache_dir))
+                   for label, query in queries.items() for chunk_start, chunk_end in chunks]
+        rows = [row for label, future in futures for row in timeline_rows(future.result(), label)]
+
+    frame = pd.DataFrame(rows, columns=['query', 'series', 'date', 'value', 'norm'])
+    frame['date'] = pd.to_datetime(frame['date'], format='%Y%m%dT%H%M%SZ')
+    start, end = pd.Timestamp(datetime.strptime(start_date, GDELT_FORMAT)), pd.Timestamp(datetime.strptime(end_date, GDELT_FORMAT))
+    frame = frame[(frame['date'] >= start) & (frame['date'] <= end)]
+    return frame.drop_duplicates(['query', 'series', 'date'], keep='last').sort_values(['query', 'series', 'date'],
+                                                                                      ignore_index=True)
+
+def plot_data(*dataframes, labels=None, max_points=2000, method='lttb', output=None):
     """
     Plots multiple series of news volume data from given DataFrames using Matplotlib.
+    Each series is downsampled to about max_points points before plotting.
     Parameters:
     - *dataframes: A sequence of Pandas DataFrames each with a 'date' column and a 'value' column.
     - labels (list of str): A list of labels for the DataFrames. Must be the same length as dataframes.
+    - max_points (int): Points drawn per series; None draws every point.
+    - method (str): Downsampling method, 'lttb' or 'minmax' (see downsample).
+    - output (str): Path of a PNG file to write instead of showing the plot.
     """
-    plt.figure(figsize=(10, 6))
+    import matplotlib.dates as mdates
+    import pandas as pd
+
+    figure = new_figure(output)
+    axes = figure.gca()
     # If labels are not provided or their length doesn't match the number of DataFrames, create default labels.
     if not labels or len(labels) != len(dataframes):
         labels = [f"Series {i+1}" for i in range(len(dataframes))]
-    # Plot each DataFrame with its corresponding label.
+    # Plot each DataFrame with its corresponding label, keeping only the points that shape the line.
     for df, label in zip(dataframes, labels):
-        plt.plot(df['date'], df['value'], linestyle='-', label=label)
+        df = df.sort_values('date')
+        if max_points:
+            df = df.iloc[downsample(pd.DatetimeIndex(df['date']).asi8, df['value'], max_points, method)]
+        axes.plot(df['date'], df['value'], linestyle='-', label=label)
     # Formatting the plot with title, labels, and grid.
-    plt.title("GDELT Data Plot Comparison")
-    plt.xlabel("Date")
-    plt.ylabel("Value")
-    plt.legend()
-    plt.grid(True)
+    axes.set_title("GDELT Data Plot Comparison")
+    axes.set_xlabel("Date")
+    axes.set_ylabel("Value")
+    axes.legend()
+    axes.grid(True)
+    # Format the x-axis to display dates properly, with a tick spacing that suits the window.
+    axes.xaxis.set_major_locator(mdates.AutoDateLocator())
+    axes.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
     # Rotate the x-axis date labels for better readability.
-    plt.xticks(rotation=45)
-    # Format the x-axis to display dates properly.
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    plt.gca().xaxis.set_major_locator(mdates.DayLocator(interval=15))  # Adjust interval as needed.
-    # Display the plot.
-    plt.show()
+    axes.tick_params(axis='x', labelrotation=45)
+    # Display or save the plot.
+    show_or_save(figure, output)
 
 # Example usage:
 if __name__ == "__main__":
     # Define your search parameters.
-    keywords = "(Inflation OR interest rates)"
+    queries = {"Inflation": "(Inflation OR interest rates)", "Recession": "recession"}
     start_date = "20230101010101"
     end_date = "20231217010101"
-    # Fetch data from GDELT.
-    fetched_data = fetch_gdelt_data(keywords, start_date, end_date)
-    # Prepare the DataFrame.
-    if fetched_data:
-        # Extract the list of data items and create a DataFrame.
-        data_items = fetched_data['timeline'][0]['data']
-        df = pd.DataFrame(data_items)
-        df['date'] = pd.to_datetime(df['date'], format='%Y%m%dT%H%M%SZ')
-        # Plot the data.
-        # You can add more DataFrames as arguments to the plot_data function.
-        # For example, to add another search term, fetch its data, prepare another DataFrame,
-        # and add it as another argument to the plot_data function.
-        # Ensure you provide a list of labels corresponding to the DataFrames.
-        plot_data(df, labels=[f"Volume of News articles that mention{keywords}"])
+    # Fetch every query over the whole window; a rerun is served from the cache.
+    timelines = fetch_gdelt_timelines(queries, start_date, end_date)
+    if not timelines.empty:
+        labels = list(timelines['query'].unique())
+        plot_data(*(timelines[timelines['query'] == label] for label in labels),
+                  labels=[f"Volume of News articles that mention {label}" for label in labels])
     else:
         print("No data fetched or unable to parse the data")
@@ -1,57 +1,369 @@
-import pandas as pd
-from yahoo_fin import stock_info as si
-import yfinance as yf
+import json
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+
+# Shared helpers live in the common package at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from common.rate_limit import RetryableError, TokenBucket, call_with_retry
+
+# Some stocks are 5 characters. Those stocks with the suffixes listed below are not of interest.
+my_list = ['W', 'R', 'P', 'Q']
+
+# Columns stored for every symbol, with their Parquet types; the full info dict is kept as JSON in 'info_json'
+INFO_FIELDS = {
+    'shortName': 'string',
+    'longName': 'string',
+    'quoteType': 'string',
+    'exchange': 'string',
+    'currency': 'string',
+    'country': 'string',
+    'sector': 'string',
+    'industry': 'string',
+    'marketCap': 'float64',
+    'sharesOutstanding': 'float64',
+    'floatShares': 'float64',
+    'beta': 'float64',
+    'trailingPE': 'float64',
+    'forwardPE': 'float64',
+    'priceToBook': 'float64',
+    'dividendYield': 'float64',
+    'fiftyTwoWeekHigh': 'float64',
+    'fiftyTwoWeekLow': 'float64',
+    'averageVolume': 'float64',
+}
+
+# Ticker lists from major US exchanges making up the universe, and how long a cached list stays fresh (seconds)
+SYMBOL_SOURCES = {
+    'sp500': 'tickers_sp500',
+    'nasdaq': 'tickers_nasdaq',
+    'dow': 'tickers_dow',
+    'other': 'tickers_other',
+}
+SOURCE_TTL = {'sp500': 86400, 'nasdaq': 86400, 'dow': 7 * 86400, 'other': 86400}
+
+def load_source(name, cache_dir, ttl=None, fetch=None):
+    """
+    Returns one ticker list, read from its Parquet cache while it is younger than its TTL and
+    downloaded (and cached) otherwise.
+    Parameters:
+    - name (str): Key of SYMBOL_SOURCES.
+    - cache_dir (str): Directory holding the cached lists and the universe snapshot.
+    - ttl (float): Freshness in seconds (defaults to SOURCE_TTL[name]).
+    - fetch (callable): Returns the list of symbols; defaults to the matching yahoo_fin function.
+    Returns:
+    - pd.Series: The symbols, as Arrow-backed strings.
+    """
+    import pandas as pd
+
+    path = os.path.join(cache_dir, f"source_{name}.parquet")
+    ttl = SOURCE_TTL.get(name, 86400) if ttl is None else ttl
+    if os.path.exists(path) and time.time() - os.path.getmtime(path) < ttl:
+        return pd.read_parquet(path)['symbol']
+    if fetch is None:
+        from yahoo_fin import stock_info as si
+        fetch = getattr(si, SYMBOL_SOURCES[name])
+    symbols = pd.Series(list(fetch()), name='symbol', dtype='string[pyarrow]').str.strip().dropna()
+    symbols = symbols[symbols != ''].drop_duplicates().reset_index(drop=True)
+    os.makedirs(cache_dir, exist_ok=True)
+    symbols.to_frame().to_parquet(path + '.tmp', index=False)
+    os.replace(path + '.tmp', path)
+    return symbols
+
+def unqualified(symbols):
+    """
+    Vectorized filter for 5+ character symbols ending in one of the suffixes in my_list.
+    Returns:
+    - pd.Series: Boolean mask of the symbols that are not of interest.
+    """
+    return (symbols.str.len() > 4) & symbols.str[-1].isin(my_list)
+
+def build_symbol_universe(cache_dir='symbol_universe', ttl=None, fetchers=None):
+    """
+    Builds the symbol universe from the cached ticker lists and diffs it against the previous snapshot.
+    The diff decides what a harvest refreshes: removed symbols are dropped from the harvested dataset
+    and added ones are fetched anew. The rest of the universe is harvested too, skipping the symbols
+    already in the checkpoint, so symbols whose harvest failed or was interrupted are picked up again
+    on the next run even though the snapshot already lists them.
+    The universe is stored in cache_dir/universe.parquet as one row per qualified symbol with an Arrow
+    string symbol column and one boolean membership column per source.
+    Parameters:
+    - cache_dir (str): Directory holding the cached lists and the universe snapshot.
+    - ttl (dict): Freshness in seconds by source, overriding SOURCE_TTL.
+    - fetchers (dict): Functions returning the ticker list by source, overriding yahoo_fin.
+    Returns:
+    - tuple: (universe DataFrame, added symbols, removed symbols), the last two as pd.Series.
+    """
+    import pandas as pd
+
+    ttl = ttl or {}
+    fetchers = fetchers or {}
+    lists = {name: load_source(name, cache_dir, ttl.get(name), fetchers.get(name)) for name in SYMBOL_SOURCES}
+
+    symbols = pd.concat(lists.values(), ignore_index=True).drop_duplicates().sort_values(ignore_index=True)
+    universe = pd.DataFrame({'symbol': symbols})
+    for name, source in lists.items():
+        universe[name] = universe['symbol'].isin(source)
+    mask = unqualified(universe['symbol'])
+    print( f'Removed {int(mask.sum())} unqualified stock symbols...' )
+    universe = universe[~mask].reset_index(drop=True)
+    print( f'There are {len( universe )} qualified stock symbols...' )
+
+    path = os.path.join(cache_dir, 'universe.parquet')
+    previous = pd.read_parquet(path, columns=['symbol'])['symbol'] if os.path.exists(path) else universe['symbol'].iloc[:0]
+    added = universe.loc[~universe['symbol'].isin(previous), 'symbol'].reset_index(drop=True)
+    removed = previous[~previous.isin(universe['symbol'])].reset_index(drop=True)
+    universe.to_parquet(path + '.tmp', index=False)
+    os.replace(path + '.tmp', path)
+    return universe, added, removed
 
 # gather stock symbols from major US exchanges
-df1 = pd.DataFrame( si.tickers_sp500() )
-df2 = pd.DataFrame( si.tickers_nasdaq() )
-df3 = pd.DataFrame( si.tickers_dow() )
-df4 = pd.DataFrame( si.tickers_other() )
+def get_symbols(cache_dir='symbol_universe'):
+    universe, _, _ = build_symbol_universe(cache_dir)
+    return set(universe['symbol'])
 
-# convert DataFrame to list, then to sets
-sym1 = set( symbol for symbol in df1[0].values.tolist() )
-sym2 = set( symbol for symbol in df2[0].values.tolist() )
-sym3 = set( symbol for symbol in df3[0].values.tolist() )
-sym4 = set( symbol for symbol in df4[0].values.tolist() )
+def yfinance_fetcher():
+    """
+    Returns a fetch function reading Ticker.info with yfinance. Only network failures, rate limiting
+    and 5xx responses are retried; other errors, such as a bad symbol or an unparsable response,
+    fail the symbol straight away.
+    Returns:
+    - callable: fetch(symbol) -> dict of info, or None when the symbol is unknown.
+    """
+    import yfinance as yf
 
-# join the 4 sets into one. Because it's a set, there will be no duplicate symbols
-symbols = set.union( sym1, sym2, sym3, sym4 )
+    # YFRateLimitError only exists in recent yfinance releases
+    rate_limit_errors = tuple(filter(None, [getattr(getattr(yf, 'exceptions', None), 'YFRateLimitError', None)]))
 
-# Some stocks are 5 characters. Those stocks with the suffixes listed below are not of interest.
-my_list = ['W', 'R', 'P', 'Q']
-del_set = set()
-sav_set = set()
+    def fetch(symbol):
+        try:
+            info = yf.Ticker(symbol).info
+        except rate_limit_errors as e:
+            raise RetryableError(str(e)) from e
+        except OSError as e:
+            # Connection errors and timeouts of requests and curl_cffi are OSErrors, and so are their
+            # HTTP errors, of which only 429 and 5xx are worth retrying
+            status = getattr(getattr(e, 'response', None), 'status_code', None)
+            if status is not None and status != 429 and status < 500:
+                raise
+            raise RetryableError(str(e)) from e
+        return info or None
+    return fetch
 
-for symbol in symbols:
-    if len( symbol ) > 4 and symbol[-1] in my_list:
-        del_set.add( symbol )
-    else:
-        sav_set.add( symbol )
+def http_fetcher(base_url, timeout=10, pool_size=16):
+    """
+    Returns a fetch function reading Yahoo's quoteSummary JSON from base_url, flattened into one
+    dict like Ticker.info. Pointing base_url at a local fake server makes the harvester testable offline.
+    Parameters:
+    - base_url (str): Server root, e.g. 'https://query2.finance.yahoo.com' or 'http://127.0.0.1:8000'.
+    - timeout (float): Request timeout in seconds.
+    - pool_size (int): Connections kept alive in the shared session; match it to the number of workers.
+    Returns:
+    - callable: fetch(symbol) -> dict of info, or None when the symbol is unknown.
+    """
+    import requests
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    modules = 'price,summaryProfile,summaryDetail,defaultKeyStatistics'
+
+    def fetch(symbol):
+        url = f"{base_url.rstrip('/')}/v10/finance/quoteSummary/{symbol}"
+        try:
+            response = session.get(url, params={'modules': modules}, timeout=timeout)
+        except requests.RequestException as e:
+            raise RetryableError(str(e)) from e
+        if response.status_code == 404:
+            return None
+        if response.status_code == 429 or response.status_code >= 500:
+            raise RetryableError(f"HTTP {response.status_code} for {symbol}")
+        response.raise_for_status()
+        results = response.json().get('quoteSummary', {}).get('result') or []
+        info = {}
+        for module in results[:1]:
+            for section in module.values():
+                # Numbers come as {'raw': 1.2, 'fmt': '1.20'}
+                info.update({key: value.get('raw') if isinstance(value, dict) else value
+                             for key, value in section.items()})
+        return info or None
+    return fetch
 
-print( f'Removed {len( del_set )} unqualified stock symbols...' )
-print( f'There are {len( sav_set )} qualified stock symbols...' )
+def fetch_with_retry(fetch, symbol, bucket, max_retries=5, backoff=1.0, max_backoff=60.0):
+    """
+    Calls fetch(symbol) under the rate limiter, retrying RetryableError with exponential backoff
+    and full jitter (a random sleep between 0 and backoff * 2 ** attempt seconds).
+    """
+    return call_with_retry(lambda: fetch(symbol), bucket, max_retries, backoff, max_backoff)
 
+def harvested_symbols(output_dir):
+    """
+    Symbols already stored in the Parquet part files of output_dir, i.e. the checkpoint of a previous run.
+    """
+    if not os.path.isdir(output_dir) or not any(name.endswith('.parquet') for name in os.listdir(output_dir)):
+        return set()
+    import pyarrow.dataset as ds
+    table = ds.dataset(output_dir, format='parquet').to_table(columns=['symbol'])
+    return set(table.column('symbol').to_pylist())
 
+def drop_symbols(output_dir, symbols):
+    """
+    Removes the rows of the given symbols from the Parquet part files of output_dir, rewriting only the
+    files that hold them. Each file is rewritten under a temporary name and renamed, so a crash leaves
+    either the old or the new file behind. Returns the number of rows removed.
+    """
+    symbols = set(symbols)
+    if not symbols or not os.path.isdir(output_dir):
+        return 0
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
 
-# Use your set of symbols
-symbols = sav_set  # replace with your set of valid symbols
+    value_set = pa.array(sorted(symbols), pa.string())
+    removed = 0
+    for name in sorted(os.listdir(output_dir)):
+        if not (name.startswith('part-') and name.endswith('.parquet')):
+            continue
+        path = os.path.join(output_dir, name)
+        table = pq.read_table(path)
+        dropped = pc.is_in(table['symbol'], value_set=value_set)
+        count = pc.sum(dropped).as_py() or 0
+        if not count:
+            continue
+        if count == table.num_rows:
+            os.remove(path)
+        else:
+            temporary_path = os.path.join(output_dir, '.' + name + '.tmp')
+            pq.write_table(table.filter(pc.invert(dropped)), temporary_path)
+            os.replace(temporary_path, path)
+        removed += count
+    return removed
 
-# Initialize a list to store the information
-info_list = []
+def write_part(rows, output_dir):
+    """
+    Writes one batch of info rows as a new Parquet part file. The file is written under a temporary
+    name and renamed, so a crash never leaves a partial part behind.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
 
-for symbol in symbols:
-    try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
-        info_list.append(info)
-    except Exception as e:
-        print(f"Could not retrieve data for {symbol}: {e}")
+    schema = pa.schema([('symbol', pa.string()), ('fetched_at', pa.timestamp('us'))]
+                       + [(name, pa.string() if kind == 'string' else pa.float64()) for name, kind in INFO_FIELDS.items()]
+                       + [('info_json', pa.string())])
+    columns = {'symbol': [row['symbol'] for row in rows], 'fetched_at': [row['fetched_at'] for row in rows]}
+    for name, kind in INFO_FIELDS.items():
+        values = [row['info'].get(name) for row in rows]
+        if kind == 'string':
+            columns[name] = [None if value is None else str(value) for value in values]
+        else:
+            columns[name] = [value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+                             for value in values]
+    columns['info_json'] = [json.dumps(row['info'], default=str) for row in rows]
 
-# Convert the list to a DataFrame
-df = pd.DataFrame(info_list)
+    name = f"part-{datetime.now():%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+    temporary_path = os.path.join(output_dir, '.' + name + '.tmp')
+    pq.write_table(pa.table(columns, schema=schema), temporary_path)
+    os.replace(temporary_path, os.path.join(output_dir, name))
 
-# At the time of fetching data, store the current time
-data_fetch_time = datetime.now()
+def harvest_ticker_info(symbols, output_dir, fetch=None, workers=8, rate=5.0, burst=None, batch_size=500,
+                        max_retries=5, backoff=1.0):
+    """
+    Retrieves the info of many symbols concurrently and streams it into a Parquet dataset.
+    Requests run on a bounded thread pool behind a shared token-bucket limiter, failures are retried
+    with jittered backoff, and every batch_size results are written out as a new part file. Symbols
+    already present in output_dir are skipped, so a crashed or interrupted run resumes where it stopped.
+    Parameters:
+    - symbols (iterable of str): Ticker symbols to harvest.
+    - output_dir (str): Directory of Parquet part files; read it back with pd.read_parquet(output_dir).
+    - fetch (callable): fetch(symbol) -> info dict or None; defaults to yfinance_fetcher().
+    - workers (int): Number of worker threads.
+    - rate (float): Sustained requests per second across all workers.
+    - burst (int): Token bucket capacity (defaults to rate).
+    - batch_size (int): Results buffered before a part file is written.
+    - max_retries (int): Retries per symbol after the first attempt.
+    - backoff (float): Base backoff in seconds.
+    Returns:
+    - dict: Counts of 'harvested', 'skipped' (already done), 'missing' (unknown symbols) and
+      'failed', plus the list of 'failed_symbols' (retried again on the next run).
+    """
+    fetch = fetch or yfinance_fetcher()
+    os.makedirs(output_dir, exist_ok=True)
+    done = harvested_symbols(output_dir)
+    requested = list(dict.fromkeys(symbols))
+    todo = [symbol for symbol in requested if symbol not in done]
+    bucket = TokenBucket(rate, burst)
+    summary = {'harvested': 0, 'skipped': len(requested) - len(todo), 'missing': 0, 'failed': 0, 'failed_symbols': []}
+    rows = []
 
-# You can add this timestamp as a new column to your DataFrame if needed
-df['dataFetchTimestamp'] = data_fetch_time
+    def flush():
+        if rows:
+            write_part(rows, output_dir)
+            summary['harvested'] += len(rows)
+            rows.clear()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+        queue = iter(todo)
+        try:
+            while True:
+                # Keep at most two requests per worker in flight instead of queueing every symbol
+                for symbol in queue:
+                    pending[pool.submit(fetch_with_retry, fetch, symbol, bucket, max_retries, backoff)] = symbol
+                    if len(pending) >= 2 * workers:
+                        break
+                if not pending:
+                    break
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    symbol = pending.pop(future)
+                    try:
+                        info = future.result()
+                    except Exception as e:
+                        print(f"Could not retrieve data for {symbol}: {e}")
+                        summary['failed'] += 1
+                        summary['failed_symbols'].append(symbol)
+                        continue
+                    if info is None:
+                        summary['missing'] += 1
+                        continue
+                    rows.append({'symbol': symbol, 'fetched_at': datetime.now(), 'info': info})
+                    if len(rows) >= batch_size:
+                        flush()
+        finally:
+            # Stop queued work and keep what has already been fetched
+            for future in pending:
+                future.cancel()
+            flush()
+    return summary
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Harvest Yahoo Finance ticker info into a Parquet dataset.")
+    parser.add_argument("--output", default="ticker_info", help="Directory of Parquet part files (also the checkpoint).")
+    parser.add_argument("--symbols", help="Text file with one symbol per line (default: the exchange ticker lists).")
+    parser.add_argument("--universe", default="symbol_universe", help="Cache directory of the symbol universe.")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=5.0, help="Requests per second.")
+    parser.add_argument("--base-url", help="Read quoteSummary JSON from this server instead of using yfinance.")
+    args = parser.parse_args()
+
+    if args.symbols:
+        with open(args.symbols) as symbol_file:
+            symbols = [line.strip() for line in symbol_file if line.strip()]
+    else:
+        universe, added, removed = build_symbol_universe(args.universe)
+        print(f"{len(added)} symbols added and {len(removed)} removed since the last snapshot")
+        # Removed symbols leave the dataset and added ones are fetched anew, even if an older listing
+        # left them in the checkpoint; the rest of the universe only fills in what is not harvested yet
+        dropped = drop_symbols(args.output, set(removed) | set(added))
+        print(f"Dropped {dropped} stored rows of removed or re-added symbols")
+        symbols = added.tolist() + universe['symbol'].tolist()
+    fetch = http_fetcher(args.base_url, pool_size=args.workers) if args.base_url else None
+    print(harvest_ticker_info(symbols, args.output, fetch, workers=args.workers, rate=args.rate))
@@ -0,0 +1,203 @@
+"""
+Import-time benchmark for the modules in this repository.
+
+Every module is loaded from its file in a fresh interpreter started with `python -X importtime`,
+so each measurement includes all of the module's own imports. The benchmark fails (exit status 1)
+when a module
+- takes longer than the budget to import,
+- is slower than its entry in a baseline file by more than the tolerance, or
+- has a side effect on import: prompting with input(), opening a network connection or
+  loading matplotlib.pyplot, or
+- cannot be imported because a dependency is not installed, since it then cannot be checked
+  (pass --allow-missing to only report these as skipped).
+Modules listed in EXCLUDED are not benchmarked, each for the reason given there.
+
+numpy is imported before timing starts by default: every numeric module needs it, a pricing
+worker loads it once, and on its own it takes close to the whole budget on a slow machine, so
+timing it would make the gate fail at random. Pass an empty --preload to include it.
+
+Usage:
+    From the repository root:
+    python "Application/Import Time Benchmark.py"                        # pricing modules, 100 ms budget
+    python "Application/Import Time Benchmark.py" .                      # the whole repository
+    python "Application/Import Time Benchmark.py" Analytics --budget-ms 250
+    python "Application/Import Time Benchmark.py" --preload              # include numpy in the timings
+    python "Application/Import Time Benchmark.py" . --allow-missing      # skip modules missing a dependency
+    python "Application/Import Time Benchmark.py" --write-baseline import_times.json
+    python "Application/Import Time Benchmark.py" --baseline import_times.json --tolerance 0.25
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Folders loaded by the short-lived pricing workers, benchmarked by default
+PRICING_FOLDERS = ['Derviatives', 'Fixed Income']
+
+# Modules that cannot import quickly by design, with the reason
+EXCLUDED = {
+    os.path.join('Statistical Learning', 'LTSM.py'): "defines torch.nn.Module subclasses, so torch loads on import",
+}
+
+# Runs in the child interpreter: blocks side effects, loads the module and reports the timing
+PROBE = r'''
+import builtins, importlib.util, json, socket, sys, time
+
+def forbid(action):
+    def fail(*args, **kwargs):
+        raise RuntimeError(f"{action} on import")
+    return fail
+
+builtins.input = forbid("input() prompt")
+socket.socket.connect = forbid("network connection")
+socket.create_connection = forbid("network connection")
+for module in sys.argv[2:]:
+    __import__(module)
+
+path = sys.argv[1]
+spec = importlib.util.spec_from_file_location("benchmarked_module", path)
+module = importlib.util.module_from_spec(spec)
+sys.stderr.write("--- benchmark start ---\n")
+sys.stderr.flush()
+result = {}
+start = time.perf_counter()
+try:
+    spec.loader.exec_module(module)
+except ImportError as error:
+    result["skipped"] = str(error)
+except Exception as error:
+    result["error"] = f"{type(error).__name__}: {error}"
+result["ms"] = (time.perf_counter() - start) * 1000
+if "matplotlib.pyplot" in sys.modules and "error" not in result:
+    result["error"] = "RuntimeError: matplotlib.pyplot loaded on import"
+print(json.dumps(result))
+'''
+
+
+def find_modules(paths):
+    """
+    Lists the Python files under the given files or folders, relative to the repository root.
+    """
+    modules = []
+    for path in paths:
+        full_path = os.path.join(ROOT, path)
+        if os.path.isfile(full_path):
+            modules.append(path)
+            continue
+        for folder, _, files in os.walk(full_path):
+            if '__pycache__' in folder:
+                continue
+            modules.extend(os.path.relpath(os.path.join(folder, name), ROOT) for name in sorted(files)
+                           if name.endswith('.py'))
+    return sorted(modules)
+
+
+def slowest_imports(importtime_log, count=3):
+    """
+    Parses `-X importtime` output and returns the slowest top-level imports made by the module
+    as (package, cumulative milliseconds) pairs.
+    """
+    _, _, log = importtime_log.partition('--- benchmark start ---\n')
+    imports = []
+    for line in log.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, package = line[len('import time:'):].split('|')
+        # Nested imports are indented under the package that triggered them
+        if cumulative.strip().isdigit() and not package.startswith('  '):
+            imports.append((package.strip(), int(cumulative) / 1000))
+    return sorted(imports, key=lambda item: -item[1])[:count]
+
+
+def benchmark_module(path, repeat=3, preload=()):
+    """
+    Imports one module in fresh interpreters and keeps the fastest of `repeat` runs.
+
+    Returns:
+        dict: 'module', 'ms' (fastest import time), 'slowest' (top-level imports of that run),
+        and 'skipped' or 'error' with a message when the import did not succeed.
+    """
+    best = None
+    for _ in range(repeat):
+        environment = dict(os.environ, MPLBACKEND='Agg')
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', PROBE, os.path.join(ROOT, path),
+                                    *preload], capture_output=True, text=True, cwd=os.path.dirname(os.path.join(ROOT, path)),
+                                   env=environment, stdin=subprocess.DEVNULL)
+        try:
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+        except (IndexError, ValueError):
+            result = {'ms': float('nan'), 'error': (completed.stderr.strip().splitlines() or ['no output'])[-1]}
+        result['module'] = path
+        result['slowest'] = slowest_imports(completed.stderr)
+        if 'skipped' in result or 'error' in result:
+            return result
+        if best is None or result['ms'] < best['ms']:
+            best = result
+    return best
+
+
+def check(results, budget_ms, baseline=None, tolerance=0.25, allow_missing=False):
+    """
+    Returns the list of failure messages for a set of benchmark results.
+    """
+    failures = []
+    for result in results:
+        module = result['module']
+        if 'error' in result:
+            failures.append(f"{module}: {result['error']}")
+        elif 'skipped' in result:
+            if not allow_missing:
+                failures.append(f"{module}: not checked, {result['skipped']}")
+        else:
+            if result['ms'] > budget_ms:
+                failures.append(f"{module}: {result['ms']:.1f} ms exceeds the {budget_ms:g} ms budget")
+            if baseline and module in baseline and result['ms'] > baseline[module] * (1 + tolerance):
+                failures.append(f"{module}: {result['ms']:.1f} ms regressed from {baseline[module]:.1f} ms")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark and gate the import time of the repository modules.")
+    parser.add_argument("paths", nargs="*", default=PRICING_FOLDERS,
+                        help="Files or folders relative to the repository root (default: the pricing folders).")
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="Maximum import time of any module.")
+    parser.add_argument("--repeat", type=int, default=3, help="Imports per module; the fastest is kept.")
+    parser.add_argument("--preload", nargs="*", default=['numpy'],
+                        help="Packages imported before timing starts (default: numpy, shared by every worker).")
+    parser.add_argument("--baseline", help="JSON file of import times (ms) by module to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown relative to the baseline.")
+    parser.add_argument("--write-baseline", help="Write the measured import times to this JSON file.")
+    parser.add_argument("--allow-missing", action="store_true",
+                        help="Report modules whose dependencies are not installed as skipped instead of failing.")
+    args = parser.parse_args()
+
+    modules = find_modules(args.paths)
+    for module in modules:
+        if module in EXCLUDED:
+            print(f"{'':>11}  {module}  (excluded: {EXCLUDED[module]})")
+    results = [benchmark_module(path, args.repeat, args.preload) for path in modules if path not in EXCLUDED]
+    for result in results:
+        slowest = ', '.join(f"{package} {ms:.0f} ms" for package, ms in result['slowest'])
+        status = 'skipped: ' + result['skipped'] if 'skipped' in result else result.get('error', slowest)
+        print(f"{result['ms']:8.1f} ms  {result['module']}  ({status})")
+
+    if args.write_baseline:
+        with open(args.write_baseline, 'w') as baseline_file:
+            json.dump({result['module']: round(result['ms'], 2) for result in results
+                       if 'skipped' not in result and 'error' not in result}, baseline_file, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    failures = check(results, args.budget_ms, baseline, args.tolerance, args.allow_missing)
+    for failure in failures:
+        print("FAIL " + failure)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+File-based alternative to the TimeSeriesStore in SQL Query.py, for analytics data (crypto open
+interest, Alpha Vantage bars, World Bank series, GDELT timelines) without a database server.
+
+A store is a directory of Parquet files partitioned by symbol and year:
+    <root>/<name>/symbol=<symbol>/year=<year>/part-<batch>-<id>.parquet
+Symbols are percent-encoded in the path, so symbols such as 'BRK/B' or 'A=B' keep the layout intact.
+Writes only ever add files. Every row carries the batch number of the write that produced it,
+and when a (symbol, ts) pair appears in several files the row from the latest batch wins.
+compact() merges the files of each partition into one.
+Reads prune partitions and row groups with the filters and load only the requested columns,
+from memory-mapped files, one partition at a time.
+
+It has the same interface as TimeSeriesStore: create, upsert, read_chunks, read and latest.
+"""
+import os
+import time
+import uuid
+from urllib.parse import quote, unquote
+
+
+class ParquetStore:
+    """
+    Time series keyed by (symbol, ts) with one float column per value, stored as a partitioned
+    Parquet dataset. Timestamps are stored as naive UTC.
+    """
+    def __init__(self, root, name, value_columns, row_group_size=100000):
+        self.path = os.path.join(root, name)
+        self.value_columns = list(value_columns)
+        self.row_group_size = row_group_size
+
+    def schema(self):
+        import pyarrow as pa
+
+        return pa.schema([('ts', pa.timestamp('us'))] + [(column, pa.float64()) for column in self.value_columns]
+                         + [('_batch', pa.int64())])
+
+    def create(self):
+        os.makedirs(self.path, exist_ok=True)
+        return self
+
+    def partitions(self, symbols=None, start=None, end=None):
+        """The (symbol, year, directory) partitions holding data for the filters, ordered by symbol and year."""
+        import pandas as pd
+
+        first_year = pd.Timestamp(start).year if start is not None else None
+        last_year = pd.Timestamp(end).year if end is not None else None
+        wanted = set(symbols) if symbols is not None else None
+        found = []
+        for symbol_dir in sorted(os.listdir(self.path)) if os.path.isdir(self.path) else []:
+            symbol = unquote(symbol_dir.partition('=')[2])
+            if wanted is not None and symbol not in wanted:
+                continue
+            for year_dir in sorted(os.listdir(os.path.join(self.path, symbol_dir))):
+                year = int(year_dir.partition('=')[2])
+                if (first_year is None or year >= first_year) and (last_year is None or year <= last_year):
+                    found.append((symbol, year, os.path.join(self.path, symbol_dir, year_dir)))
+        return found
+
+    def write_part(self, directory, table, batch):
+        import pyarrow.parquet as pq
+
+        os.makedirs(directory, exist_ok=True)
+        name = f"part-{batch:020d}-{uuid.uuid4().hex[:8]}.parquet"
+        temporary_path = os.path.join(directory, '.' + name + '.tmp')
+        pq.write_table(table, temporary_path, row_group_size=self.row_group_size)
+        os.replace(temporary_path, os.path.join(directory, name))
+
+    def upsert(self, frame):
+        """
+        Appends a DataFrame with symbol, ts and value columns as one new file per (symbol, year).
+        Rows replace stored rows with the same (symbol, ts) on read. Returns the number of rows written.
+        """
+        import pandas as pd
+        import pyarrow as pa
+
+        frame = frame[['symbol', 'ts'] + self.value_columns].copy()
+        frame['ts'] = pd.to_datetime(frame['ts'], utc=True).dt.tz_convert(None).astype('datetime64[us]')
+        frame[self.value_columns] = frame[self.value_columns].astype('float64')
+        batch = time.time_ns()
+        schema = self.schema()
+        for (symbol, year), rows in frame.groupby(['symbol', frame['ts'].dt.year], sort=True):
+            rows = rows.drop_duplicates('ts', keep='last').sort_values('ts')
+            table = pa.Table.from_pandas(rows.drop(columns='symbol').assign(_batch=batch), schema=schema,
+                                         preserve_index=False)
+            self.write_part(os.path.join(self.path, f"symbol={quote(symbol, safe='')}", f"year={year}"), table, batch)
+        return len(frame)
+
+    def read_partition(self, directory, start=None, end=None, columns=None):
+        """
+        One partition as an Arrow table of ts, the requested columns and _batch, with only the
+        latest row of every ts, sorted by ts.
+        """
+        import numpy as np
+        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        from pyarrow.fs import LocalFileSystem
+
+        dataset = ds.dataset(directory, schema=self.schema(), format='parquet',
+                             filesystem=LocalFileSystem(use_mmap=True))
+        condition = None
+        if start is not None:
+            condition = ds.field('ts') >= pa.scalar(pd.Timestamp(start).to_datetime64(), type=pa.timestamp('us'))
+        if end is not None:
+            upper = ds.field('ts') <= pa.scalar(pd.Timestamp(end).to_datetime64(), type=pa.timestamp('us'))
+            condition = upper if condition is None else condition & upper
+        columns = self.value_columns if columns is None else list(columns)
+        table = dataset.to_table(columns=['ts'] + columns + ['_batch'], filter=condition)
+        if len(dataset.files) == 1:
+            return table.sort_by('ts')
+        # Latest batch first within every ts, then keep the first row of every ts
+        table = table.sort_by([('ts', 'ascending'), ('_batch', 'descending')])
+        ts = table['ts'].to_numpy()
+        keep = np.ones(len(ts), dtype=bool)
+        keep[1:] = ts[1:] != ts[:-1]
+        return table.filter(pa.array(keep))
+
+    def read_chunks(self, symbols=None, start=None, end=None, columns=None, chunksize=50000):
+        """
+        Yields the selected rows as DataFrames of at most chunksize rows, ordered by symbol and ts,
+        holding at most one partition (one symbol and year) in memory at a time.
+        """
+        for symbol, _, directory in self.partitions(symbols, start, end):
+            table = self.read_partition(directory, start, end, columns).drop_columns(['_batch'])
+            for offset in range(0, table.num_rows, chunksize):
+                chunk = table.slice(offset, chunksize).to_pandas()
+                chunk.insert(0, 'symbol', symbol)
+                yield chunk
+
+    def read(self, symbols=None, start=None, end=None, columns=None, chunksize=50000):
+        import pandas as pd
+
+        chunks = list(self.read_chunks(symbols, start, end, columns, chunksize))
+        if not chunks:
+            return pd.DataFrame(columns=['symbol', 'ts'] + list(columns or self.value_columns))
+        return pd.concat(chunks, ignore_index=True)
+
+    def latest(self, symbol):
+        """The last stored timestamp of a symbol, or None; downloaders resume from it."""
+        import pyarrow.compute as pc
+
+        partitions = self.partitions([symbol])
+        if not partitions:
+            return None
+        table = self.read_partition(partitions[-1][2], columns=[])
+        return pc.max(table['ts']).as_py() if table.num_rows else None
+
+    def dataset(self, compact=True):
+        """
+        The whole store as a pyarrow Dataset, for scans and aggregations that Arrow runs lazily.
+        A Dataset reads every file as it is, including rows that later batches replaced, so the
+        store is compacted first to leave one row per (symbol, ts). Rows upserted after the call
+        are only deduplicated by the next compaction. With compact=False the superseded rows are
+        included, and aggregations over them double-count until compact() runs.
+        """
+        import pyarrow.dataset as ds
+        from pyarrow.fs import LocalFileSystem
+
+        if compact:
+            self.compact()
+        return ds.dataset(self.path, format='parquet', partitioning='hive', filesystem=LocalFileSystem(use_mmap=True))
+
+    def compact(self, min_files=2):
+        """
+        Rewrites every partition with at least min_files files as a single file without
+        superseded rows. The merged file is written before the old ones are removed and keeps
+        the latest batch number of its sources, so an interrupted compaction loses nothing and
+        rows written meanwhile still win. Returns the number of partitions compacted.
+        """
+        import pyarrow as pa
+
+        compacted = 0
+        for _, _, directory in self.partitions():
+            parts = [name for name in os.listdir(directory) if name.startswith('part-') and name.endswith('.parquet')]
+            if len(parts) < min_files:
+                continue
+            table = self.read_partition(directory)
+            batch = max(int(name.split('-')[1]) for name in parts)
+            table = table.set_column(table.schema.get_field_index('_batch'), '_batch',
+                                     pa.array([batch] * table.num_rows, pa.int64()))
+            self.write_part(directory, table, batch)
+            for name in parts:
+                os.remove(os.path.join(directory, name))
+            compacted += 1
+        return compacted
+
+if __name__ == "__main__":
+    import pandas as pd
+
+    store = ParquetStore('data_lake', 'open_interest', ['sumOpenInterest', 'sumOpenInterestValue']).create()
+    bars = pd.DataFrame({'symbol': 'BTCUSDT', 'ts': pd.date_range('2023-12-31', periods=576, freq='5min', tz='UTC'),
+                         'sumOpenInterest': 80000.0, 'sumOpenInterestValue': 3.0e9})
+    store.upsert(bars)
+    store.upsert(bars.tail(12).assign(sumOpenInterest=81000.0))
+    print(store.latest('BTCUSDT'))
+    print(store.read(['BTCUSDT'], start='2024-01-01 23:00').tail())
+    print(f"Compacted {store.compact()} partitions")
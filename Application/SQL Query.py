@@ -1,4 +1,5 @@
-from sqlalchemy import create_engine
+import json
+import os
 
 # Replace with your own connection details
 username = 'root'
@@ -6,5 +7,142 @@ password = 'password'
 host = 'localhost'
 database = 'timeseries'
 
-# Create a connection to the MySQL database
-engine = create_engine(f'mysql+mysqlconnector://{username}:{password}@{host}/{database}')
+# Connection pool: connections kept open, extra connections allowed under load, and seconds after
+# which a connection is replaced (below MySQL's wait_timeout)
+pool_size = 10
+max_overflow = 20
+pool_recycle = 3600
+
+# Create a connection to the MySQL database, or to any database given by url (e.g. 'sqlite:///timeseries.db');
+# SQLAlchemy is only imported when an engine is needed
+def get_engine(username=username, password=password, host=host, database=database, url=None, pool_size=pool_size,
+               max_overflow=max_overflow, pool_recycle=pool_recycle):
+    from sqlalchemy import create_engine
+    url = url or f'mysql+mysqlconnector://{username}:{password}@{host}/{database}'
+    if url.startswith('sqlite'):
+        # SQLite connections are local files; there is no server-side pool to size
+        return create_engine(url)
+    return create_engine(url, pool_size=pool_size, max_overflow=max_overflow, pool_recycle=pool_recycle,
+                         pool_pre_ping=True)
+
+# Create an engine from a JSON file holding any of the get_engine arguments, e.g.
+# {"url": "mysql+mysqlconnector://user:secret@db/timeseries", "pool_size": 32}
+def engine_from_config(path):
+    with open(path) as config_file:
+        return get_engine(**json.load(config_file))
+
+class TimeSeriesStore:
+    """
+    A table of time series keyed by (symbol, ts) with one column per value, e.g. one table for
+    open interest and one for daily bars. Writes are batched upserts, reads stream in
+    chunks. Timestamps are stored as naive UTC.
+    On MySQL the table is partitioned by a hash of the symbol, so reads for a few symbols only
+    touch their partitions.
+    """
+    def __init__(self, engine, name, value_columns, symbol_length=32, partitions=16, batch_size=5000):
+        from sqlalchemy import Column, DateTime, Double, MetaData, String, Table
+
+        self.engine = engine
+        self.value_columns = list(value_columns)
+        self.batch_size = batch_size
+        self.metadata = MetaData()
+        self.table = Table(name, self.metadata,
+                           Column('symbol', String(symbol_length), primary_key=True),
+                           Column('ts', DateTime, primary_key=True),
+                           *(Column(column, Double) for column in self.value_columns),
+                           mysql_partition_by='KEY(symbol)', mysql_partitions=str(partitions))
+
+    def create(self):
+        self.metadata.create_all(self.engine)
+        return self
+
+    def upsert_statement(self):
+        """An INSERT that updates the values of rows whose (symbol, ts) already exists."""
+        dialect = self.engine.dialect.name
+        if dialect == 'mysql':
+            from sqlalchemy.dialects.mysql import insert
+            statement = insert(self.table)
+            return statement.on_duplicate_key_update({column: statement.inserted[column] for column in self.value_columns})
+        if dialect in ('sqlite', 'postgresql'):
+            if dialect == 'sqlite':
+                from sqlalchemy.dialects.sqlite import insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert
+            statement = insert(self.table)
+            return statement.on_conflict_do_update(index_elements=['symbol', 'ts'],
+                                                   set_={column: statement.excluded[column] for column in self.value_columns})
+        raise ValueError(f"Upserts are not supported on {dialect}.")
+
+    def upsert(self, frame):
+        """
+        Writes a DataFrame with symbol, ts and value columns in batches of batch_size rows, all in
+        one transaction. Each batch is one executemany of a statement compiled once, which MySQL
+        drivers send as a single multi-row INSERT ... ON DUPLICATE KEY UPDATE. Returns the number
+        of rows written.
+        """
+        import pandas as pd
+
+        frame = frame[['symbol', 'ts'] + self.value_columns].copy()
+        frame['ts'] = pd.to_datetime(frame['ts'], utc=True).dt.tz_convert(None)
+        frame = frame.astype(object).where(frame.notna(), None)
+        rows = frame.to_dict('records')
+        statement = self.upsert_statement()
+        with self.engine.begin() as connection:
+            for start in range(0, len(rows), self.batch_size):
+                connection.execute(statement, rows[start:start + self.batch_size])
+        return len(rows)
+
+    def query(self, symbols=None, start=None, end=None, columns=None):
+        from sqlalchemy import select
+
+        selected = [self.table.c.symbol, self.table.c.ts] + [self.table.c[column] for column in columns or self.value_columns]
+        statement = select(*selected)
+        if symbols is not None:
+            statement = statement.where(self.table.c.symbol.in_(list(symbols)))
+        if start is not None:
+            statement = statement.where(self.table.c.ts >= start)
+        if end is not None:
+            statement = statement.where(self.table.c.ts <= end)
+        return statement.order_by(self.table.c.symbol, self.table.c.ts)
+
+    def read_chunks(self, symbols=None, start=None, end=None, columns=None, chunksize=50000):
+        """
+        Yields the selected rows as DataFrames of at most chunksize rows, ordered by symbol and ts.
+        Results stream through a server-side cursor where the driver supports one, so memory use
+        is bounded by the chunk size rather than the result size.
+        """
+        import pandas as pd
+
+        with self.engine.connect() as connection:
+            result = connection.execution_options(stream_results=True, yield_per=chunksize).execute(
+                self.query(symbols, start, end, columns))
+            names = list(result.keys())
+            for rows in result.partitions(chunksize):
+                yield pd.DataFrame(rows, columns=names)
+
+    def read(self, symbols=None, start=None, end=None, columns=None, chunksize=50000):
+        import pandas as pd
+
+        chunks = list(self.read_chunks(symbols, start, end, columns, chunksize))
+        if not chunks:
+            return pd.DataFrame(columns=['symbol', 'ts'] + list(columns or self.value_columns))
+        return pd.concat(chunks, ignore_index=True)
+
+    def latest(self, symbol):
+        """The last stored timestamp of a symbol, or None; downloaders resume from it."""
+        from sqlalchemy import func, select
+
+        with self.engine.connect() as connection:
+            return connection.execute(select(func.max(self.table.c.ts)).where(self.table.c.symbol == symbol)).scalar()
+
+if __name__ == "__main__":
+    import pandas as pd
+
+    # Runs against a local SQLite file unless TIMESERIES_DB_URL points at the MySQL server
+    engine = get_engine(url=os.environ.get('TIMESERIES_DB_URL', 'sqlite:///timeseries.db'))
+    store = TimeSeriesStore(engine, 'open_interest', ['sumOpenInterest', 'sumOpenInterestValue']).create()
+    bars = pd.DataFrame({'symbol': 'BTCUSDT', 'ts': pd.date_range('2023-11-14', periods=288, freq='5min', tz='UTC'),
+                         'sumOpenInterest': 80000.0, 'sumOpenInterestValue': 3.0e9})
+    store.upsert(bars)
+    print(store.latest('BTCUSDT'))
+    print(store.read(['BTCUSDT']).tail())
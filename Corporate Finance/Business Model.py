@@ -1,7 +1,10 @@
+def format_value(val):
+    if isinstance(val, float):
+        if val < 1:  # Assuming growth rates are less than 1
+            return "{:.2%}".format(val)
+        return "${:,.2f}".format(val)
+    return val
 
-import pandas as pd
-
-import numpy as np
 
 class BaseRevenueModel:
     """
@@ -741,6 +744,7 @@ class ShippingCosts:
 
 
     def _format_to_dataframe(self, rows, time_frame):
+        import pandas as pd
         columns = ['Attribute'] + [f'Year {i + 1}' for i in range(time_frame)]
         df = pd.DataFrame(rows, columns=columns)
         return df.applymap(format_value)
@@ -873,691 +877,688 @@ class MiscellaneousExpenses:
     
     
 # Example usage
-abc_revenue_model = BaseRevenueModel(time_frame=5)
-time_frame = 5
+if __name__ == "__main__":
+    import numpy as np
+    import pandas as pd
 
-# Create Employee Types
-manager = EmployeeType("Manager", 100000, 10, 0.02, 0.03)
-engineer = EmployeeType("Engineer", 80000, 20, 0.03, 0.02)
+    abc_revenue_model = BaseRevenueModel(time_frame=5)
+    time_frame = 5
 
-# Initialize Compensation Cost
-compensation_cost = CompensationCost()
-compensation_cost.add_employee_type(manager)
-compensation_cost.add_employee_type(engineer)
+    # Create Employee Types
+    manager = EmployeeType("Manager", 100000, 10, 0.02, 0.03)
+    engineer = EmployeeType("Engineer", 80000, 20, 0.03, 0.02)
 
+    # Initialize Compensation Cost
+    compensation_cost = CompensationCost()
+    compensation_cost.add_employee_type(manager)
+    compensation_cost.add_employee_type(engineer)
 
-total_compensation_costs = compensation_cost.calculate_total_compensation(time_frame)
 
-# Example values for rent, insurance, and utilities
-rent = 10000  # Monthly rent
-insurance = 500  # Monthly insurance
-utilities = 1000  # Monthly utilities
+    total_compensation_costs = compensation_cost.calculate_total_compensation(time_frame)
 
-# Initialize Building Expenses
-building_expenses = BuildingExpenses(rent, insurance, utilities)
+    # Example values for rent, insurance, and utilities
+    rent = 10000  # Monthly rent
+    insurance = 500  # Monthly insurance
+    utilities = 1000  # Monthly utilities
 
+    # Initialize Building Expenses
+    building_expenses = BuildingExpenses(rent, insurance, utilities)
 
-# Calculate Building Expenses
-annual_building_expenses = building_expenses.calculate_annual_expenses(time_frame)
 
-# Initialize data structure
-data = {
-    'Attribute': [],
-}
+    # Calculate Building Expenses
+    annual_building_expenses = building_expenses.calculate_annual_expenses(time_frame)
 
-# Add years as column headers
-for year in range(time_frame):
-    data[f'Year {year + 1}'] = []
-
-# Add data for each employee type
-for employee in compensation_cost.employee_types:
-    data['Attribute'].append(f'{employee.name} - Initial Cost per Employee')
-    data['Attribute'].append(f'{employee.name} - Initial Number of Employees')
-    data['Attribute'].append(f'{employee.name} - Employee Growth Rate')
-    data['Attribute'].append(f'{employee.name} - Compensation Growth Rate')
-    data['Attribute'].append(f'{employee.name} - Total Compensation')
+    # Initialize data structure
+    data = {
+        'Attribute': [],
+    }
 
+    # Add years as column headers
     for year in range(time_frame):
-        adjusted_employee_count = employee.employee_count * (1 + employee.employee_growth_rate) ** year
-        adjusted_cost_per_employee = employee.cost_per_employee * (1 + employee.compensation_growth_rate) ** year
-        total_compensation = adjusted_cost_per_employee * adjusted_employee_count
-
-        if year == 0:
-            data[f'Year {year + 1}'].extend([
-                employee.cost_per_employee,
-                employee.employee_count,
-                employee.employee_growth_rate,
-                employee.compensation_growth_rate,
-                total_compensation
-            ])
-        else:
-            data[f'Year {year + 1}'].extend([
-                adjusted_cost_per_employee,
-                adjusted_employee_count,
-                '',  # Growth rates are constant, only display in the first year
-                '',
-                total_compensation
-            ])
-compensation_df = pd.DataFrame(data)
+        data[f'Year {year + 1}'] = []
 
-def format_value(val):
-    if isinstance(val, float):
-        if val < 1:  # Assuming growth rates are less than 1
-            return "{:.2%}".format(val)
-        return "${:,.2f}".format(val)
-    return val
+    # Add data for each employee type
+    for employee in compensation_cost.employee_types:
+        data['Attribute'].append(f'{employee.name} - Initial Cost per Employee')
+        data['Attribute'].append(f'{employee.name} - Initial Number of Employees')
+        data['Attribute'].append(f'{employee.name} - Employee Growth Rate')
+        data['Attribute'].append(f'{employee.name} - Compensation Growth Rate')
+        data['Attribute'].append(f'{employee.name} - Total Compensation')
 
-compensation_df.set_index('Attribute', inplace=True)
-compensation_df = compensation_df.applymap(format_value)
-
-# Initialize Marketing Expenses with hypothetical values
-marketing_expenses = MarketingExpenses(
-    num_campaigns=10,
-    avg_cost_per_campaign=2000,
-    num_events=5,
-    cost_per_event=3000,
-    additional_event_expenses=2000,
-    monthly_pr_retainer=1500,
-    pr_months=12,
-    ad_spend=10000,
-    social_media_management_cost=2500,
-    content_creation_cost=5000,
-    content_creation=4000,
-    content_distribution=2000,
-    content_promotion=3000,
-    seo_tools_cost=1200,
-    agency_fees=3500,
-    ppc_budget=8000,
-    staff_salaries=50000,
-    bonuses=10000,
-    external_agency_fees=6000
-)
-
-
-# Initialize Travel Expenses with hypothetical values
-travel_expenses = TravelExpenses(
-    airfare=500,
-    accommodation=200,
-    meals_entertainment=100,
-    ground_transport=50,
-    miscellaneous=30,
-    per_diem=70,
-    number_of_trips=10,
-    days_per_trip=3
-)
-
-#Create a Professional Services Object    
-proserv_costs = ProfessionalServices(
-    hourly_legal = 500,
-    hourly_audit = 300,
-    hourly_tax = 350,
-    hourly_other = 150,
-    legal_hours = 100,
-    audit_hours = 50,
-    tax_hours = 50,
-    other_hours = 500
-)
-
-#Initialise a subscriptions object with hypothetical values
-
-sub_costs = Subscriptions(
-    corporate_subscription_cost = 500,
-    num_corporate_subscriptions = 3,
-    employee_subscription_cost = 150,
-    num_employees = 10
-)
-
-# Example usage for tax and insurance
-sales_tax_allocations = {'local': (0.5, 0.05), 'federal': (0.5, 0.08)}  # Allocating 50% of sales to local and federal taxes with respective rates
-insurance_premiums = {'property': 500, 'liability': 300}
-
-tax_insurance_expenses = TaxAndInsuranceExpenses(
-    sales_tax_allocations=sales_tax_allocations,
-    total_sales=10000,    # Total sales amount
-    insurance_premiums=insurance_premiums
-)
-
-
-# Example miscellaneous expenses
-misc_expenses = {
-    'Item1': 200,
-    'Item2': 500,
-    'Item3': 1000
-}
-
-# Create an instance of misc expenses class
-misc_expenses_obj = MiscellaneousExpenses(misc_expenses)
-
-# Define different product types
-product_1 = ProductType("Product A", 50, 2000, 0.03)
-product_2 = ProductType("Product B", 80, 1500, 0.05)
-product_3 = ProductType("Product C", 100, 1000, 0.04)
-
-# Define cost structures for each product type
-
-# Define cost structures for Product 1
-product_1_costs = ProductCostStructure(material_costs=[("Material1", 1.2, 2), ("Material2", 1.1, 3)], labor_cost_per_unit=50000, overhead_cost_per_unit=10000)
-
-
-# Define cost structures for Product 2
-product_2_costs = ProductCostStructure(material_costs=[("Material1", 1.2, 2), ("Material2", 1.1, 3)], labor_cost_per_unit=50000, overhead_cost_per_unit=10000)
-
-
-# Define cost structures for Product 3
-product_3_costs = ProductCostStructure(material_costs=[("Material1", 1.2, 2), ("Material2", 1.1, 3)], labor_cost_per_unit=50000, overhead_cost_per_unit=10000)
-
-
-
-# Aggregate them in ProductSalesRevenue with associated costs
-product_sales = ProductSalesRevenue(
-    [product_1, product_2, product_3],
-    [product_1_costs, product_2_costs, product_3_costs]
-)
-
-# Growth rates for subscriptions
-basic_sub_drivers = [
-    {"base_growth": 0.1, "marketing_impact": 0.02},
-    {"base_growth": 0.12, "marketing_impact": 0.03},
-    # ... other years' drivers ...
-]
-
-premium_sub_drivers = [
-    {"base_growth": 0.15, "marketing_impact": 0.04},
-    {"base_growth": 0.18, "marketing_impact": 0.05},
-    # ... other years' drivers ...
-]
-
-data_center_cost = 10000  # Example value
-software_costs = {'Software1': 500, 'Software2': 300}  # Example dictionary
-sales_commission_rate = 0.05  # Example value
+        for year in range(time_frame):
+            adjusted_employee_count = employee.employee_count * (1 + employee.employee_growth_rate) ** year
+            adjusted_cost_per_employee = employee.cost_per_employee * (1 + employee.compensation_growth_rate) ** year
+            total_compensation = adjusted_cost_per_employee * adjusted_employee_count
+
+            if year == 0:
+                data[f'Year {year + 1}'].extend([
+                    employee.cost_per_employee,
+                    employee.employee_count,
+                    employee.employee_growth_rate,
+                    employee.compensation_growth_rate,
+                    total_compensation
+                ])
+            else:
+                data[f'Year {year + 1}'].extend([
+                    adjusted_cost_per_employee,
+                    adjusted_employee_count,
+                    '',  # Growth rates are constant, only display in the first year
+                    '',
+                    total_compensation
+                ])
+    compensation_df = pd.DataFrame(data)
+
+    compensation_df.set_index('Attribute', inplace=True)
+    compensation_df = compensation_df.applymap(format_value)
+
+    # Initialize Marketing Expenses with hypothetical values
+    marketing_expenses = MarketingExpenses(
+        num_campaigns=10,
+        avg_cost_per_campaign=2000,
+        num_events=5,
+        cost_per_event=3000,
+        additional_event_expenses=2000,
+        monthly_pr_retainer=1500,
+        pr_months=12,
+        ad_spend=10000,
+        social_media_management_cost=2500,
+        content_creation_cost=5000,
+        content_creation=4000,
+        content_distribution=2000,
+        content_promotion=3000,
+        seo_tools_cost=1200,
+        agency_fees=3500,
+        ppc_budget=8000,
+        staff_salaries=50000,
+        bonuses=10000,
+        external_agency_fees=6000
+    )
 
 
-# Correct initialization
-basic_subscription = SubscriptionType(
-    "Basic", 
-    20, 
-    1000, 
-    0.02, 
-    basic_sub_drivers, 
-    data_center_cost,  # Assuming you have a value for this
-    software_costs,    # Assuming you have a dictionary for this
-    sales_commission_rate  # Assuming you have a value for this
-)
+    # Initialize Travel Expenses with hypothetical values
+    travel_expenses = TravelExpenses(
+        airfare=500,
+        accommodation=200,
+        meals_entertainment=100,
+        ground_transport=50,
+        miscellaneous=30,
+        per_diem=70,
+        number_of_trips=10,
+        days_per_trip=3
+    )
 
-premium_subscription = SubscriptionType(
-    "Premium", 
-    50, 
-    500, 
-    0.01, 
-    premium_sub_drivers, 
-    data_center_cost,  # Assuming you have a value for this
-    software_costs,    # Assuming you have a dictionary for this
-    sales_commission_rate  # Assuming you have a value for this
-)
+    #Create a Professional Services Object    
+    proserv_costs = ProfessionalServices(
+        hourly_legal = 500,
+        hourly_audit = 300,
+        hourly_tax = 350,
+        hourly_other = 150,
+        legal_hours = 100,
+        audit_hours = 50,
+        tax_hours = 50,
+        other_hours = 500
+    )
 
+    #Initialise a subscriptions object with hypothetical values
 
-# Define subscription costs
-subscription_costs = SubscriptionCostStructure(data_center_cost=20000, software_licenses=[("License A", 5000), ("License B", 3000)], sales_commissions=0.05)
+    sub_costs = Subscriptions(
+        corporate_subscription_cost = 500,
+        num_corporate_subscriptions = 3,
+        employee_subscription_cost = 150,
+        num_employees = 10
+    )
 
-# Aggregate subscriptions and their costs
-subscription_revenue = SubscriptionRevenue(
-    [basic_subscription, premium_subscription],
-    subscription_costs
-)
+    # Example usage for tax and insurance
+    sales_tax_allocations = {'local': (0.5, 0.05), 'federal': (0.5, 0.08)}  # Allocating 50% of sales to local and federal taxes with respective rates
+    insurance_premiums = {'property': 500, 'liability': 300}
 
+    tax_insurance_expenses = TaxAndInsuranceExpenses(
+        sales_tax_allocations=sales_tax_allocations,
+        total_sales=10000,    # Total sales amount
+        insurance_premiums=insurance_premiums
+    )
 
 
-# Define consulting revenue and its costs
-hourly_cost_example = 100  # Example value for the hourly cost
-consulting_revenue = ConsultingRevenue(150, 500, 0.03, hourly_cost_example)
+    # Example miscellaneous expenses
+    misc_expenses = {
+        'Item1': 200,
+        'Item2': 500,
+        'Item3': 1000
+    }
 
-###SG&A
+    # Create an instance of misc expenses class
+    misc_expenses_obj = MiscellaneousExpenses(misc_expenses)
 
+    # Define different product types
+    product_1 = ProductType("Product A", 50, 2000, 0.03)
+    product_2 = ProductType("Product B", 80, 1500, 0.05)
+    product_3 = ProductType("Product C", 100, 1000, 0.04)
 
+    # Define cost structures for each product type
 
-# Initialize SG&A Cost
-sga_cost = SGandACost()
-sga_cost.add_cost_component("Compensation", compensation_cost)
+    # Define cost structures for Product 1
+    product_1_costs = ProductCostStructure(material_costs=[("Material1", 1.2, 2), ("Material2", 1.1, 3)], labor_cost_per_unit=50000, overhead_cost_per_unit=10000)
 
-# Define asset inventory
-asset_inventory = [
-    Asset("Computer", 1000, 5),
-    Asset("Vehicle", 20000, 10, 5000),
-    # Add other assets as needed
-]
 
-# Initialize Depreciation
-depreciation = Depreciation(asset_inventory)
+    # Define cost structures for Product 2
+    product_2_costs = ProductCostStructure(material_costs=[("Material1", 1.2, 2), ("Material2", 1.1, 3)], labor_cost_per_unit=50000, overhead_cost_per_unit=10000)
 
-# Calculate yearly depreciation
-yearly_depreciation = depreciation.calculate_depreciation("straight_line", time_frame)
 
+    # Define cost structures for Product 3
+    product_3_costs = ProductCostStructure(material_costs=[("Material1", 1.2, 2), ("Material2", 1.1, 3)], labor_cost_per_unit=50000, overhead_cost_per_unit=10000)
 
-# Add Depreciation to SG&A Costs
-sga_cost.add_depreciation(depreciation)
 
-# Initialize shipping items
-shipping_items = [
-    ShippingCosts("Item A", 1000, 1.5),
-    ShippingCosts("Item B", 800, 2.0),
-    # Add more items as needed
-]
 
-total_employees_by_year = compensation_cost.calculate_total_employees(time_frame)
+    # Aggregate them in ProductSalesRevenue with associated costs
+    product_sales = ProductSalesRevenue(
+        [product_1, product_2, product_3],
+        [product_1_costs, product_2_costs, product_3_costs]
+    )
 
+    # Growth rates for subscriptions
+    basic_sub_drivers = [
+        {"base_growth": 0.1, "marketing_impact": 0.02},
+        {"base_growth": 0.12, "marketing_impact": 0.03},
+        # ... other years' drivers ...
+    ]
+
+    premium_sub_drivers = [
+        {"base_growth": 0.15, "marketing_impact": 0.04},
+        {"base_growth": 0.18, "marketing_impact": 0.05},
+        # ... other years' drivers ...
+    ]
+
+    data_center_cost = 10000  # Example value
+    software_costs = {'Software1': 500, 'Software2': 300}  # Example dictionary
+    sales_commission_rate = 0.05  # Example value
+
+
+    # Correct initialization
+    basic_subscription = SubscriptionType(
+        "Basic", 
+        20, 
+        1000, 
+        0.02, 
+        basic_sub_drivers, 
+        data_center_cost,  # Assuming you have a value for this
+        software_costs,    # Assuming you have a dictionary for this
+        sales_commission_rate  # Assuming you have a value for this
+    )
 
-supply_expenses = SuppliesCost(
-    total_employees_by_year = total_employees_by_year,
-    tech_supplies = 500,
-    office_supplies = 200
-)
+    premium_subscription = SubscriptionType(
+        "Premium", 
+        50, 
+        500, 
+        0.01, 
+        premium_sub_drivers, 
+        data_center_cost,  # Assuming you have a value for this
+        software_costs,    # Assuming you have a dictionary for this
+        sales_commission_rate  # Assuming you have a value for this
+    )
 
-# Generate a list of years (e.g., [1, 2, 3, 4, 5] for a time frame of 5 years)
-years = list(range(1, time_frame + 1))
 
-# Calculate supply costs for each year
-tech_costs = [supply_expenses.calculate_tech_supply_costs(year) for year in years]
-office_costs = [supply_expenses.calculate_office_supply_costs(year) for year in years]
-total_supply_costs = supply_expenses.calculate_total_supply_costs()
+    # Define subscription costs
+    subscription_costs = SubscriptionCostStructure(data_center_cost=20000, software_licenses=[("License A", 5000), ("License B", 3000)], sales_commissions=0.05)
 
+    # Aggregate subscriptions and their costs
+    subscription_revenue = SubscriptionRevenue(
+        [basic_subscription, premium_subscription],
+        subscription_costs
+    )
 
-# Supplies expenses data for DataFrame
-supply_cost_rows = [
-    ["Tech Supply Costs"] + tech_costs,
-    ["Office Supply Costs"] + office_costs,
-    ["Total Supply Costs"] + total_supply_costs
-]
 
-# Add to the revenue model
-abc_revenue_model.add_revenue_type(product_sales)
-abc_revenue_model.add_revenue_type(subscription_revenue)
-abc_revenue_model.add_revenue_type(consulting_revenue)
-abc_revenue_model.add_sga_costs(sga_cost)
 
+    # Define consulting revenue and its costs
+    hourly_cost_example = 100  # Example value for the hourly cost
+    consulting_revenue = ConsultingRevenue(150, 500, 0.03, hourly_cost_example)
 
+    ###SG&A
 
 
-# Assuming the same setup for product types, subscription types, consulting types, product costs, subscription costs, and time frame
 
+    # Initialize SG&A Cost
+    sga_cost = SGandACost()
+    sga_cost.add_cost_component("Compensation", compensation_cost)
 
-# Function todef format_numbers(df):
-def format_numbers(df):
-    for col in df.columns:
-        df[col] = df[col].apply(lambda x: "{:,.2f}".format(x) if isinstance(x, (int, float)) else x)
-    return df
+    # Define asset inventory
+    asset_inventory = [
+        Asset("Computer", 1000, 5),
+        Asset("Vehicle", 20000, 10, 5000),
+        # Add other assets as needed
+    ]
 
-# Product Revenue Data
-product_revenue_rows = []
-total_product_revenue_per_year = [0] * time_frame
-for product in product_sales.product_types:
-    yearly_revenues = product.calculate_yearly_revenues(time_frame)
-    details = product.component_details(time_frame)
-    total_product_revenue_per_year = [total + rev for total, rev in zip(total_product_revenue_per_year, yearly_revenues)]
+    # Initialize Depreciation
+    depreciation = Depreciation(asset_inventory)
 
-    product_revenue_rows.extend([
-        [f"{product.name} Revenue"] + yearly_revenues,
-        [f"  {product.name} Unit Price"] + details["Unit Price"],
-        [f"  {product.name} Volume"] + details["Volume"],
-        [f"  {product.name} Growth Rate"] + details["Growth Rate"]
-    ])
-product_revenue_rows.insert(0, ["Total Product Revenue"] + total_product_revenue_per_year)
+    # Calculate yearly depreciation
+    yearly_depreciation = depreciation.calculate_depreciation("straight_line", time_frame)
 
 
+    # Add Depreciation to SG&A Costs
+    sga_cost.add_depreciation(depreciation)
 
+    # Initialize shipping items
+    shipping_items = [
+        ShippingCosts("Item A", 1000, 1.5),
+        ShippingCosts("Item B", 800, 2.0),
+        # Add more items as needed
+    ]
 
+    total_employees_by_year = compensation_cost.calculate_total_employees(time_frame)
 
 
-# Subscription Revenue Data
-subscription_revenue_rows = []
-total_subscription_revenue_per_year = [0] * time_frame
-for subscription in subscription_revenue.subscription_types:
-    yearly_revenues = subscription.calculate_revenues(time_frame)
-    details = subscription.component_details(time_frame)
-    total_subscription_revenue_per_year = [total + rev for total, rev in zip(total_subscription_revenue_per_year, yearly_revenues)]
+    supply_expenses = SuppliesCost(
+        total_employees_by_year = total_employees_by_year,
+        tech_supplies = 500,
+        office_supplies = 200
+    )
 
-    subscription_revenue_rows.extend([
-        [f"{subscription.name} Revenue"] + yearly_revenues,
-        [f"  {subscription.name} Monthly Fee"] + details["Monthly Fee"],
-        [f"  {subscription.name} Subscribers"] + details["Subscribers"],
-        [f"  {subscription.name} Churn Rate"] + details["Churn Rate"],
-        [f"  {subscription.name} Growth Rate"] + details["Growth Rate"]
-    ])
-subscription_revenue_rows.insert(0, ["Total Subscription Revenue"] + total_subscription_revenue_per_year)
-
-
-# Consulting Revenue Data
-consulting_revenue_rows = []
-total_consulting_revenue_per_year = [0] * time_frame
-yearly_revenues = consulting_revenue.calculate_yearly_revenues(time_frame)
-details = consulting_revenue.component_details(time_frame)
-total_consulting_revenue_per_year = [total + rev for total, rev in zip(total_consulting_revenue_per_year, yearly_revenues)]
-
-consulting_revenue_rows.extend([
-    ["Consulting Revenue"] + yearly_revenues,
-    ["  Consulting Hourly Rate"] + details["Hourly Rate"],
-    ["  Consulting Billable Hours"] + details["Billable Hours"],
-    ["  Consulting Growth Rate"] + details["Growth Rate"]
-])
-consulting_revenue_rows.insert(0, ["Total Consulting Revenue"] + total_consulting_revenue_per_year)
-
-
-# Product Costs
-product_cost_rows = []
-total_product_cost_per_year = [0] * time_frame
-
-for product, product_cost_structure in zip(product_sales.product_types, product_sales.product_costs):
-    yearly_volumes = product.component_details(time_frame)["Volume"]
-    yearly_material_costs = []
-    yearly_costs = []  # Define the yearly_costs list here
-
-    for volume in yearly_volumes:
-        total_material_cost_per_year = sum([mc.calculate_cost() * volume for mc in product_cost_structure.material_costs])
-        yearly_material_costs.append(total_material_cost_per_year)
-        total_cost_per_unit = product_cost_structure.calculate_total_cost_per_unit()
-        yearly_costs.append(total_cost_per_unit * volume)  # Calculate yearly costs for each product
-
-    product_cost_rows.extend([
-        [f"{product.name} Total Cost"] + yearly_costs,
-        [f"  {product.name} Material Cost"] + yearly_material_costs,
-        [f"  {product.name} Labor Cost"] + [product_cost_structure.labor_cost_per_unit * volume for volume in yearly_volumes],
-        [f"  {product.name} Overhead Cost"] + [product_cost_structure.overhead_cost_per_unit * volume for volume in yearly_volumes]
+    # Generate a list of years (e.g., [1, 2, 3, 4, 5] for a time frame of 5 years)
+    years = list(range(1, time_frame + 1))
+
+    # Calculate supply costs for each year
+    tech_costs = [supply_expenses.calculate_tech_supply_costs(year) for year in years]
+    office_costs = [supply_expenses.calculate_office_supply_costs(year) for year in years]
+    total_supply_costs = supply_expenses.calculate_total_supply_costs()
+
+
+    # Supplies expenses data for DataFrame
+    supply_cost_rows = [
+        ["Tech Supply Costs"] + tech_costs,
+        ["Office Supply Costs"] + office_costs,
+        ["Total Supply Costs"] + total_supply_costs
+    ]
+
+    # Add to the revenue model
+    abc_revenue_model.add_revenue_type(product_sales)
+    abc_revenue_model.add_revenue_type(subscription_revenue)
+    abc_revenue_model.add_revenue_type(consulting_revenue)
+    abc_revenue_model.add_sga_costs(sga_cost)
+
+
+
+
+    # Assuming the same setup for product types, subscription types, consulting types, product costs, subscription costs, and time frame
+
+
+    # Function todef format_numbers(df):
+    def format_numbers(df):
+        for col in df.columns:
+            df[col] = df[col].apply(lambda x: "{:,.2f}".format(x) if isinstance(x, (int, float)) else x)
+        return df
+
+    # Product Revenue Data
+    product_revenue_rows = []
+    total_product_revenue_per_year = [0] * time_frame
+    for product in product_sales.product_types:
+        yearly_revenues = product.calculate_yearly_revenues(time_frame)
+        details = product.component_details(time_frame)
+        total_product_revenue_per_year = [total + rev for total, rev in zip(total_product_revenue_per_year, yearly_revenues)]
+
+        product_revenue_rows.extend([
+            [f"{product.name} Revenue"] + yearly_revenues,
+            [f"  {product.name} Unit Price"] + details["Unit Price"],
+            [f"  {product.name} Volume"] + details["Volume"],
+            [f"  {product.name} Growth Rate"] + details["Growth Rate"]
+        ])
+    product_revenue_rows.insert(0, ["Total Product Revenue"] + total_product_revenue_per_year)
+
+
+
+
+
+
+    # Subscription Revenue Data
+    subscription_revenue_rows = []
+    total_subscription_revenue_per_year = [0] * time_frame
+    for subscription in subscription_revenue.subscription_types:
+        yearly_revenues = subscription.calculate_revenues(time_frame)
+        details = subscription.component_details(time_frame)
+        total_subscription_revenue_per_year = [total + rev for total, rev in zip(total_subscription_revenue_per_year, yearly_revenues)]
+
+        subscription_revenue_rows.extend([
+            [f"{subscription.name} Revenue"] + yearly_revenues,
+            [f"  {subscription.name} Monthly Fee"] + details["Monthly Fee"],
+            [f"  {subscription.name} Subscribers"] + details["Subscribers"],
+            [f"  {subscription.name} Churn Rate"] + details["Churn Rate"],
+            [f"  {subscription.name} Growth Rate"] + details["Growth Rate"]
+        ])
+    subscription_revenue_rows.insert(0, ["Total Subscription Revenue"] + total_subscription_revenue_per_year)
+
+
+    # Consulting Revenue Data
+    consulting_revenue_rows = []
+    total_consulting_revenue_per_year = [0] * time_frame
+    yearly_revenues = consulting_revenue.calculate_yearly_revenues(time_frame)
+    details = consulting_revenue.component_details(time_frame)
+    total_consulting_revenue_per_year = [total + rev for total, rev in zip(total_consulting_revenue_per_year, yearly_revenues)]
+
+    consulting_revenue_rows.extend([
+        ["Consulting Revenue"] + yearly_revenues,
+        ["  Consulting Hourly Rate"] + details["Hourly Rate"],
+        ["  Consulting Billable Hours"] + details["Billable Hours"],
+        ["  Consulting Growth Rate"] + details["Growth Rate"]
     ])
+    consulting_revenue_rows.insert(0, ["Total Consulting Revenue"] + total_consulting_revenue_per_year)
+
+
+    # Product Costs
+    product_cost_rows = []
+    total_product_cost_per_year = [0] * time_frame
+
+    for product, product_cost_structure in zip(product_sales.product_types, product_sales.product_costs):
+        yearly_volumes = product.component_details(time_frame)["Volume"]
+        yearly_material_costs = []
+        yearly_costs = []  # Define the yearly_costs list here
 
+        for volume in yearly_volumes:
+            total_material_cost_per_year = sum([mc.calculate_cost() * volume for mc in product_cost_structure.material_costs])
+            yearly_material_costs.append(total_material_cost_per_year)
+            total_cost_per_unit = product_cost_structure.calculate_total_cost_per_unit()
+            yearly_costs.append(total_cost_per_unit * volume)  # Calculate yearly costs for each product
 
+        product_cost_rows.extend([
+            [f"{product.name} Total Cost"] + yearly_costs,
+            [f"  {product.name} Material Cost"] + yearly_material_costs,
+            [f"  {product.name} Labor Cost"] + [product_cost_structure.labor_cost_per_unit * volume for volume in yearly_volumes],
+            [f"  {product.name} Overhead Cost"] + [product_cost_structure.overhead_cost_per_unit * volume for volume in yearly_volumes]
+        ])
 
 
-# Subscription Costs Data
-subscription_cost_rows = []
-total_subscription_cost_per_year = [0] * time_frame
-for subscription in subscription_revenue.subscription_types:
-    yearly_costs = subscription.calculate_subscription_costs(time_frame)
-    total_subscription_cost_per_year = [total + cost for total, cost in zip(total_subscription_cost_per_year, yearly_costs)]
 
-    subscription_cost_rows.extend([
-        [f"{subscription.name} Total Cost"] + yearly_costs,
-        [f"  {subscription.name} Data Center Cost"] + [subscription.data_center_cost * 12] * time_frame,
-        [f"  {subscription.name} Software Costs"] + [sum(subscription.software_costs.values()) * 12] * time_frame,
-        [f"  {subscription.name} Sales Commission"] + [subscription.sales_commission_rate * revenue for revenue in subscription.calculate_revenues(time_frame)]
+
+    # Subscription Costs Data
+    subscription_cost_rows = []
+    total_subscription_cost_per_year = [0] * time_frame
+    for subscription in subscription_revenue.subscription_types:
+        yearly_costs = subscription.calculate_subscription_costs(time_frame)
+        total_subscription_cost_per_year = [total + cost for total, cost in zip(total_subscription_cost_per_year, yearly_costs)]
+
+        subscription_cost_rows.extend([
+            [f"{subscription.name} Total Cost"] + yearly_costs,
+            [f"  {subscription.name} Data Center Cost"] + [subscription.data_center_cost * 12] * time_frame,
+            [f"  {subscription.name} Software Costs"] + [sum(subscription.software_costs.values()) * 12] * time_frame,
+            [f"  {subscription.name} Sales Commission"] + [subscription.sales_commission_rate * revenue for revenue in subscription.calculate_revenues(time_frame)]
+        ])
+    subscription_cost_rows.insert(0, ["Total Subscription Costs"] + total_subscription_cost_per_year)
+
+
+    # Consulting Costs Data
+    consulting_cost_rows = []
+    total_consulting_cost_per_year = [0] * time_frame
+    yearly_costs = consulting_revenue.consulting_cost.calculate_yearly_costs(time_frame)
+    total_consulting_cost_per_year = [total + cost for total, cost in zip(total_consulting_cost_per_year, yearly_costs)]
+
+    consulting_cost_rows.extend([
+        ["Total Consulting Costs"] + total_consulting_cost_per_year,
+        ["  Consulting Hourly Cost"] + [consulting_revenue.consulting_cost.hourly_cost] * time_frame,
+        ["  Consulting Billable Hours"] + [consulting_revenue.consulting_cost.billable_hours] * time_frame
     ])
-subscription_cost_rows.insert(0, ["Total Subscription Costs"] + total_subscription_cost_per_year)
-
-
-# Consulting Costs Data
-consulting_cost_rows = []
-total_consulting_cost_per_year = [0] * time_frame
-yearly_costs = consulting_revenue.consulting_cost.calculate_yearly_costs(time_frame)
-total_consulting_cost_per_year = [total + cost for total, cost in zip(total_consulting_cost_per_year, yearly_costs)]
-
-consulting_cost_rows.extend([
-    ["Total Consulting Costs"] + total_consulting_cost_per_year,
-    ["  Consulting Hourly Cost"] + [consulting_revenue.consulting_cost.hourly_cost] * time_frame,
-    ["  Consulting Billable Hours"] + [consulting_revenue.consulting_cost.billable_hours] * time_frame
-])
-
-
-# Depreciation Data
-depreciation_rows = []
-depreciation_rows.extend([
-    ["Total Depreciation"] + yearly_depreciation
-])
-
-
-# Building Expenses Data
-building_expense_rows = [
-    ["Rent"] + [rent * 12] * time_frame,
-    ["Insurance"] + [insurance * 12] * time_frame,
-    ["Utilities"] + [utilities * 12] * time_frame,
-    ["Total Building Expenses"] + annual_building_expenses
-]
-
-# Travel Expenses Data for DataFrame
-travel_expense_rows = [
-    ["Airfare"] + [travel_expenses.calculate_airfare_total()] * time_frame,
-    ["Accommodation"] + [travel_expenses.calculate_accommodation_total()] * time_frame,
-    ["Meals and Entertainment"] + [travel_expenses.calculate_meals_entertainment_total()] * time_frame,
-    ["Ground Transport"] + [travel_expenses.calculate_ground_transport_total()] * time_frame,
-    ["Miscellaneous"] + [travel_expenses.calculate_miscellaneous_total()] * time_frame,
-    ["Per Diem"] + [travel_expenses.calculate_per_diem_total()] * time_frame,
-    ["Total Travel Expenses"] + [travel_expenses.calculate_total_travel_expenses()] * time_frame
-]
-
-# Marketing Expenses Data for DataFrame
-marketing_expense_rows = [
-    ["Campaign Budget"] + [marketing_expenses.calculate_campaign_budget()] * time_frame,
-    ["Events Budget"] + [marketing_expenses.calculate_events_budget()] * time_frame,
-    ["PR Budget"] + [marketing_expenses.calculate_pr_budget()] * time_frame,
-    ["Social Media Budget"] + [marketing_expenses.calculate_social_media_budget()] * time_frame,
-    ["Content Budget"] + [marketing_expenses.calculate_content_budget()] * time_frame,
-    ["SEO Budget"] + [marketing_expenses.calculate_seo_budget()] * time_frame,
-    ["Staff and Agency Fees"] + [marketing_expenses.calculate_staff_and_agency_fees()] * time_frame,
-    ["Total Marketing Expenses"] + [marketing_expenses.calculate_total_marketing_expenses()] * time_frame
-]
-
-# Calculate total shipping costs and create data rows
-shipping_cost_rows = [["Total Shipping Costs"]]
-total_shipping_cost_per_year = [0] * time_frame
-
-for item in shipping_items:
-    item_costs = item.calculate_shipping_costs(time_frame)
-    total_shipping_cost_per_year = [total + cost for total, cost in zip(total_shipping_cost_per_year, item_costs)]
-
-    # Add item details to the rows
-    shipping_cost_rows.extend([
-        [f"  {item.item_name} Volume"] + [item.shipping_volume] * time_frame,
-        [f"  {item.item_name} Rate"] + [item.shipping_rate] * time_frame,
-        [f"  {item.item_name} Cost"] + item_costs
+
+
+    # Depreciation Data
+    depreciation_rows = []
+    depreciation_rows.extend([
+        ["Total Depreciation"] + yearly_depreciation
     ])
 
-# Add the total costs to the first row
-shipping_cost_rows[0] += total_shipping_cost_per_year
 
-# Initialize the SystemsCost object
-systems_costs = SystemsCost(
-    total_employees_by_year=total_employees_by_year,
-    system_cost_per_employee=500
-)
+    # Building Expenses Data
+    building_expense_rows = [
+        ["Rent"] + [rent * 12] * time_frame,
+        ["Insurance"] + [insurance * 12] * time_frame,
+        ["Utilities"] + [utilities * 12] * time_frame,
+        ["Total Building Expenses"] + annual_building_expenses
+    ]
+
+    # Travel Expenses Data for DataFrame
+    travel_expense_rows = [
+        ["Airfare"] + [travel_expenses.calculate_airfare_total()] * time_frame,
+        ["Accommodation"] + [travel_expenses.calculate_accommodation_total()] * time_frame,
+        ["Meals and Entertainment"] + [travel_expenses.calculate_meals_entertainment_total()] * time_frame,
+        ["Ground Transport"] + [travel_expenses.calculate_ground_transport_total()] * time_frame,
+        ["Miscellaneous"] + [travel_expenses.calculate_miscellaneous_total()] * time_frame,
+        ["Per Diem"] + [travel_expenses.calculate_per_diem_total()] * time_frame,
+        ["Total Travel Expenses"] + [travel_expenses.calculate_total_travel_expenses()] * time_frame
+    ]
+
+    # Marketing Expenses Data for DataFrame
+    marketing_expense_rows = [
+        ["Campaign Budget"] + [marketing_expenses.calculate_campaign_budget()] * time_frame,
+        ["Events Budget"] + [marketing_expenses.calculate_events_budget()] * time_frame,
+        ["PR Budget"] + [marketing_expenses.calculate_pr_budget()] * time_frame,
+        ["Social Media Budget"] + [marketing_expenses.calculate_social_media_budget()] * time_frame,
+        ["Content Budget"] + [marketing_expenses.calculate_content_budget()] * time_frame,
+        ["SEO Budget"] + [marketing_expenses.calculate_seo_budget()] * time_frame,
+        ["Staff and Agency Fees"] + [marketing_expenses.calculate_staff_and_agency_fees()] * time_frame,
+        ["Total Marketing Expenses"] + [marketing_expenses.calculate_total_marketing_expenses()] * time_frame
+    ]
+
+    # Calculate total shipping costs and create data rows
+    shipping_cost_rows = [["Total Shipping Costs"]]
+    total_shipping_cost_per_year = [0] * time_frame
+
+    for item in shipping_items:
+        item_costs = item.calculate_shipping_costs(time_frame)
+        total_shipping_cost_per_year = [total + cost for total, cost in zip(total_shipping_cost_per_year, item_costs)]
+
+        # Add item details to the rows
+        shipping_cost_rows.extend([
+            [f"  {item.item_name} Volume"] + [item.shipping_volume] * time_frame,
+            [f"  {item.item_name} Rate"] + [item.shipping_rate] * time_frame,
+            [f"  {item.item_name} Cost"] + item_costs
+        ])
+
+    # Add the total costs to the first row
+    shipping_cost_rows[0] += total_shipping_cost_per_year
+
+    # Initialize the SystemsCost object
+    systems_costs = SystemsCost(
+        total_employees_by_year=total_employees_by_year,
+        system_cost_per_employee=500
+    )
 
-# Calculate the systems costs by year
-total_systems_costs = [systems_costs.calculate_total_systems_cost(year) for year in years]
+    # Calculate the systems costs by year
+    total_systems_costs = [systems_costs.calculate_total_systems_cost(year) for year in years]
 
-# Systems costs expenses for DataFrame
-system_cost_rows = [
-    ["Systems Cost"] + total_systems_costs
-]
+    # Systems costs expenses for DataFrame
+    system_cost_rows = [
+        ["Systems Cost"] + total_systems_costs
+    ]
 
-#Professional services expenses for dataframe
+    #Professional services expenses for dataframe
 
-proserv_rows = [
-    ["Legal"] + [proserv_costs.calculate_legal_costs()] * time_frame,
-    ["Audit"] + [proserv_costs.calculate_audit_costs()] * time_frame,
-    ["Tax"] + [proserv_costs.calculate_tax_costs()] * time_frame,
-    ["Other Professional Services"] + [proserv_costs.calculate_other_costs()] * time_frame,
-    ["Total Professional Service Costs"] + [proserv_costs.calculate_total_proserv_costs()] * time_frame
-]
+    proserv_rows = [
+        ["Legal"] + [proserv_costs.calculate_legal_costs()] * time_frame,
+        ["Audit"] + [proserv_costs.calculate_audit_costs()] * time_frame,
+        ["Tax"] + [proserv_costs.calculate_tax_costs()] * time_frame,
+        ["Other Professional Services"] + [proserv_costs.calculate_other_costs()] * time_frame,
+        ["Total Professional Service Costs"] + [proserv_costs.calculate_total_proserv_costs()] * time_frame
+    ]
 
-#Put sub costs in a list for use in dataframe
+    #Put sub costs in a list for use in dataframe
 
-sub_cost_rows = [
-    ["Corporate Subscription Costs"] + [sub_costs.calculate_corporate_subscription_costs()] * time_frame,
-    ["Employee Subscriptions Costs"] + [sub_costs.calculate_employee_subscription_costs()] * time_frame,
-    ["Total Subscriptions Costs"] + [sub_costs.calculate_total_susbcription_costs()] * time_frame
-    
-]
+    sub_cost_rows = [
+        ["Corporate Subscription Costs"] + [sub_costs.calculate_corporate_subscription_costs()] * time_frame,
+        ["Employee Subscriptions Costs"] + [sub_costs.calculate_employee_subscription_costs()] * time_frame,
+        ["Total Subscriptions Costs"] + [sub_costs.calculate_total_susbcription_costs()] * time_frame
 
+    ]
 
-# Create rows for DataFrame
-tax_insurance_expense_rows = []
-for regime in sales_tax_allocations:
-    tax_insurance_expense_rows.append(
-        [f"{regime.title()} Sales Tax"] + [tax_insurance_expenses.calculate_sales_tax_for_regime(regime)] * time_frame
-    )
-for insurance_type in insurance_premiums:
+
+    # Create rows for DataFrame
+    tax_insurance_expense_rows = []
+    for regime in sales_tax_allocations:
+        tax_insurance_expense_rows.append(
+            [f"{regime.title()} Sales Tax"] + [tax_insurance_expenses.calculate_sales_tax_for_regime(regime)] * time_frame
+        )
+    for insurance_type in insurance_premiums:
+        tax_insurance_expense_rows.append(
+            [f"{insurance_type.title()} Insurance"] + [insurance_premiums[insurance_type]] * time_frame
+        )
     tax_insurance_expense_rows.append(
-        [f"{insurance_type.title()} Insurance"] + [insurance_premiums[insurance_type]] * time_frame
+        ["Total Tax and Insurance Expenses"] + [tax_insurance_expenses.calculate_total_tax_insurance_expenses()] * time_frame
     )
-tax_insurance_expense_rows.append(
-    ["Total Tax and Insurance Expenses"] + [tax_insurance_expenses.calculate_total_tax_insurance_expenses()] * time_frame
-)
-
-# Create dataframe rows for misc expenses
-misc_expense_rows = []
-for expense_type, cost in misc_expenses.items():
-    misc_expense_rows.append([expense_type.title()] + [cost] * time_frame)
-misc_expense_rows.append(["Total Miscellaneous Expenses"] + [total_misc_expenses] * time_frame)
-
-SGA_expense_rows = [
-    ["Compensation"] + compensation_cost.calculate_total_compensation(time_frame),
-    ["Building"] + annual_building_expenses,
-    ["Depreciation"] + yearly_depreciation,
-    ["T&E"] + [travel_expenses.calculate_total_travel_expenses()] * time_frame,
-    ["Professional Services"] + [proserv_costs.calculate_total_proserv_costs()] * time_frame,
-    ["Marketing"] + [marketing_expenses.calculate_total_marketing_expenses()] * time_frame,
-    ["Tax & Insurance"] + [tax_insurance_expenses.calculate_total_tax_insurance_expenses()] * time_frame,
-    ["Supplies"] + supply_expenses.calculate_total_supply_costs(),
-    ["Systems"] + total_systems_costs,
-    ["Subscriptions"] + [sub_costs.calculate_total_susbcription_costs()] * time_frame,
-    ["Miscellaneous"] + [total_misc_expenses] * time_frame
-]
-
-def format_with_commas(x):
-  
-    if isinstance(x, (int, float)):
-        return "{:,.2f}".format(x)
-    return x
 
-# Column headers
-columns = ['Attribute'] + [f'Year {i + 1}' for i in range(time_frame)]
+    # Create dataframe rows for misc expenses
+    misc_expense_rows = []
+    for expense_type, cost in misc_expenses.items():
+        misc_expense_rows.append([expense_type.title()] + [cost] * time_frame)
+    misc_expense_rows.append(["Total Miscellaneous Expenses"] + [total_misc_expenses] * time_frame)
+
+    SGA_expense_rows = [
+        ["Compensation"] + compensation_cost.calculate_total_compensation(time_frame),
+        ["Building"] + annual_building_expenses,
+        ["Depreciation"] + yearly_depreciation,
+        ["T&E"] + [travel_expenses.calculate_total_travel_expenses()] * time_frame,
+        ["Professional Services"] + [proserv_costs.calculate_total_proserv_costs()] * time_frame,
+        ["Marketing"] + [marketing_expenses.calculate_total_marketing_expenses()] * time_frame,
+        ["Tax & Insurance"] + [tax_insurance_expenses.calculate_total_tax_insurance_expenses()] * time_frame,
+        ["Supplies"] + supply_expenses.calculate_total_supply_costs(),
+        ["Systems"] + total_systems_costs,
+        ["Subscriptions"] + [sub_costs.calculate_total_susbcription_costs()] * time_frame,
+        ["Miscellaneous"] + [total_misc_expenses] * time_frame
+    ]
+
+    def format_with_commas(x):
+
+        if isinstance(x, (int, float)):
+            return "{:,.2f}".format(x)
+        return x
+
+    # Column headers
+    columns = ['Attribute'] + [f'Year {i + 1}' for i in range(time_frame)]
 
-# Convert rows to DataFrames
+    # Convert rows to DataFrames
 
 
-df_product_revenue = pd.DataFrame(product_revenue_rows, columns=columns)
-formatted_df_product_revenue = df_product_revenue.applymap(format_with_commas)
-print(formatted_df_product_revenue.to_string(index=False))
+    df_product_revenue = pd.DataFrame(product_revenue_rows, columns=columns)
+    formatted_df_product_revenue = df_product_revenue.applymap(format_with_commas)
+    print(formatted_df_product_revenue.to_string(index=False))
 
-df_subscription_revenue = pd.DataFrame(subscription_revenue_rows, columns=columns)
-formatted_df_subscription_revenue = df_subscription_revenue.applymap(format_with_commas)
-print(formatted_df_subscription_revenue.to_string(index=False))
+    df_subscription_revenue = pd.DataFrame(subscription_revenue_rows, columns=columns)
+    formatted_df_subscription_revenue = df_subscription_revenue.applymap(format_with_commas)
+    print(formatted_df_subscription_revenue.to_string(index=False))
 
-# Convert rows to DataFrame
-df_product_costs = pd.DataFrame(product_cost_rows, columns=columns)
+    # Convert rows to DataFrame
+    df_product_costs = pd.DataFrame(product_cost_rows, columns=columns)
 
-# Apply formatting
-formatted_df_product_costs = df_product_costs.applymap(format_with_commas)
+    # Apply formatting
+    formatted_df_product_costs = df_product_costs.applymap(format_with_commas)
 
-# Display the DataFrame
-print(formatted_df_product_costs.to_string(index=False))
+    # Display the DataFrame
+    print(formatted_df_product_costs.to_string(index=False))
 
-df_product_costs = pd.DataFrame(product_cost_rows, columns = columns)
-formatted_df_product_costs = df_product_costs.applymap(format_with_commas)
-print(formatted_df_product_costs.to_string(index=False))
+    df_product_costs = pd.DataFrame(product_cost_rows, columns = columns)
+    formatted_df_product_costs = df_product_costs.applymap(format_with_commas)
+    print(formatted_df_product_costs.to_string(index=False))
 
-df_subscription_costs = pd.DataFrame(subscription_cost_rows, columns=columns)
-formatted_df_subscription_costs = df_subscription_costs.applymap(format_with_commas)
-print(formatted_df_subscription_costs.to_string(index=False))
+    df_subscription_costs = pd.DataFrame(subscription_cost_rows, columns=columns)
+    formatted_df_subscription_costs = df_subscription_costs.applymap(format_with_commas)
+    print(formatted_df_subscription_costs.to_string(index=False))
 
-df_consulting_costs = pd.DataFrame(consulting_cost_rows, columns=columns)
-formatted_df_consulting_costs = df_consulting_costs.applymap(format_with_commas)
-print(formatted_df_consulting_costs.to_string(index=False))
+    df_consulting_costs = pd.DataFrame(consulting_cost_rows, columns=columns)
+    formatted_df_consulting_costs = df_consulting_costs.applymap(format_with_commas)
+    print(formatted_df_consulting_costs.to_string(index=False))
 
-print(compensation_df)
+    print(compensation_df)
 
-# Convert depreciation rows to DataFrame
-df_depreciation = pd.DataFrame(depreciation_rows, columns=columns)
-formatted_df_depreciation = df_depreciation.applymap(format_with_commas)
+    # Convert depreciation rows to DataFrame
+    df_depreciation = pd.DataFrame(depreciation_rows, columns=columns)
+    formatted_df_depreciation = df_depreciation.applymap(format_with_commas)
 
 
-# Display the DataFrame
-print(formatted_df_depreciation.to_string(index=False))
+    # Display the DataFrame
+    print(formatted_df_depreciation.to_string(index=False))
 
-# Convert building expense rows to DataFrame
-df_building_expenses = pd.DataFrame(building_expense_rows, columns=columns)
-formatted_df_building_expenses = df_building_expenses.applymap(format_with_commas)
+    # Convert building expense rows to DataFrame
+    df_building_expenses = pd.DataFrame(building_expense_rows, columns=columns)
+    formatted_df_building_expenses = df_building_expenses.applymap(format_with_commas)
 
-# Display the DataFrame
-print(formatted_df_building_expenses.to_string(index=False))
+    # Display the DataFrame
+    print(formatted_df_building_expenses.to_string(index=False))
 
 
 
-# Convert marketing expense rows to DataFrame
+    # Convert marketing expense rows to DataFrame
 
-df_marketing_expenses = pd.DataFrame(marketing_expense_rows, columns=columns)
-formatted_df_marketing_expenses = df_marketing_expenses.applymap(format_with_commas)
+    df_marketing_expenses = pd.DataFrame(marketing_expense_rows, columns=columns)
+    formatted_df_marketing_expenses = df_marketing_expenses.applymap(format_with_commas)
 
-# Display the DataFrame
-print(formatted_df_marketing_expenses.to_string(index=False))
+    # Display the DataFrame
+    print(formatted_df_marketing_expenses.to_string(index=False))
 
 
-# Convert travel expense rows to DataFrame
+    # Convert travel expense rows to DataFrame
 
-df_travel_expenses = pd.DataFrame(travel_expense_rows, columns=columns)
-formatted_df_travel_expenses = df_travel_expenses.applymap(format_with_commas)
+    df_travel_expenses = pd.DataFrame(travel_expense_rows, columns=columns)
+    formatted_df_travel_expenses = df_travel_expenses.applymap(format_with_commas)
 
-# Display the DataFrame
-print(formatted_df_travel_expenses.to_string(index=False))
+    # Display the DataFrame
+    print(formatted_df_travel_expenses.to_string(index=False))
 
 
-# Convert shipping costs rows to  DataFrame and apply formatting
-df_shipping_costs = pd.DataFrame(shipping_cost_rows, columns=columns)
-formatted_df_shipping_costs = df_shipping_costs.applymap(format_with_commas)
-print(formatted_df_shipping_costs.to_string(index=False))
+    # Convert shipping costs rows to  DataFrame and apply formatting
+    df_shipping_costs = pd.DataFrame(shipping_cost_rows, columns=columns)
+    formatted_df_shipping_costs = df_shipping_costs.applymap(format_with_commas)
+    print(formatted_df_shipping_costs.to_string(index=False))
 
 
-# Define columns for DataFrame
-columns = ["Attribute"] + ["Year " + str(year) for year in years]
-df_supply_costs = pd.DataFrame(supply_cost_rows, columns=columns)
-formatted_df_supply_costs = df_supply_costs.applymap(format_with_commas)
+    # Define columns for DataFrame
+    columns = ["Attribute"] + ["Year " + str(year) for year in years]
+    df_supply_costs = pd.DataFrame(supply_cost_rows, columns=columns)
+    formatted_df_supply_costs = df_supply_costs.applymap(format_with_commas)
 
-# Display the DataFrame
-print(formatted_df_supply_costs.to_string(index=False))
+    # Display the DataFrame
+    print(formatted_df_supply_costs.to_string(index=False))
 
-# Create, format and print a DataFrame for systems costs
-df_systems_costs = pd.DataFrame(system_cost_rows, columns=["Attribute"] + [f'Year {i}' for i in years])
-formatted_df_systems_costs = df_systems_costs.applymap(format_with_commas)
-print(formatted_df_systems_costs.to_string(index=False))
+    # Create, format and print a DataFrame for systems costs
+    df_systems_costs = pd.DataFrame(system_cost_rows, columns=["Attribute"] + [f'Year {i}' for i in years])
+    formatted_df_systems_costs = df_systems_costs.applymap(format_with_commas)
+    print(formatted_df_systems_costs.to_string(index=False))
 
-#Create a Dataframe with proserv costs and print
+    #Create a Dataframe with proserv costs and print
 
-df_proserv_costs = pd.DataFrame(proserv_rows, columns=columns)
-formatted_proserv_costs = df_proserv_costs.applymap(format_with_commas)
-print(formatted_proserv_costs.to_string(index = False))
+    df_proserv_costs = pd.DataFrame(proserv_rows, columns=columns)
+    formatted_proserv_costs = df_proserv_costs.applymap(format_with_commas)
+    print(formatted_proserv_costs.to_string(index = False))
 
 
-#Create,format and print DF for sub costs
-df_sub_costs = pd.DataFrame(sub_cost_rows, columns = columns)
-formatted_df_sub_costs = df_sub_costs.applymap(format_with_commas)
-print(formatted_df_sub_costs.to_string(index = False)) 
+    #Create,format and print DF for sub costs
+    df_sub_costs = pd.DataFrame(sub_cost_rows, columns = columns)
+    formatted_df_sub_costs = df_sub_costs.applymap(format_with_commas)
+    print(formatted_df_sub_costs.to_string(index = False)) 
 
-# Convert tax and insurance costs to DataFrame and format and print
-df_tax_insurance_expenses = pd.DataFrame(tax_insurance_expense_rows, columns=columns)
-formatted_df_tax_insurance_expenses = df_tax_insurance_expenses.applymap(format_with_commas)
+    # Convert tax and insurance costs to DataFrame and format and print
+    df_tax_insurance_expenses = pd.DataFrame(tax_insurance_expense_rows, columns=columns)
+    formatted_df_tax_insurance_expenses = df_tax_insurance_expenses.applymap(format_with_commas)
 
-print(formatted_df_tax_insurance_expenses.to_string(index=False))
+    print(formatted_df_tax_insurance_expenses.to_string(index=False))
 
 
-# Create DataFrame and format and print for misc expenses
+    # Create DataFrame and format and print for misc expenses
 
-df_misc_expenses = pd.DataFrame(misc_expense_rows, columns=columns)
-formatted_df_misc_expenses = df_misc_expenses.applymap(format_with_commas)
-print(formatted_df_misc_expenses.to_string(index=False))
+    df_misc_expenses = pd.DataFrame(misc_expense_rows, columns=columns)
+    formatted_df_misc_expenses = df_misc_expenses.applymap(format_with_commas)
+    print(formatted_df_misc_expenses.to_string(index=False))
 
 
-# Convert SG&A ros to DataFrame and format
-df_SGA_expenses = pd.DataFrame(SGA_expense_rows, columns=columns)
-formatted_df_SGA_expenses = df_SGA_expenses.applymap(format_with_commas)
+    # Convert SG&A ros to DataFrame and format
+    df_SGA_expenses = pd.DataFrame(SGA_expense_rows, columns=columns)
+    formatted_df_SGA_expenses = df_SGA_expenses.applymap(format_with_commas)
 
 
-# Calculate the sum of each numeric column
-sums = df_SGA_expenses.select_dtypes(np.number).sum()
+    # Calculate the sum of each numeric column
+    sums = df_SGA_expenses.select_dtypes(np.number).sum()
 
-# Create a new row with 'Total' as the first column and the sums in the other columns
-total_row = ['Total SG&A Expenses'] + sums.tolist()
+    # Create a new row with 'Total' as the first column and the sums in the other columns
+    total_row = ['Total SG&A Expenses'] + sums.tolist()
 
-# Append this row to DataFrame
-df_SGA_expenses.loc[len(df_SGA_expenses)] = total_row
+    # Append this row to DataFrame
+    df_SGA_expenses.loc[len(df_SGA_expenses)] = total_row
 
-# Format the DataFrame
-formatted_df_SGA_expenses = df_SGA_expenses.applymap(format_with_commas)
+    # Format the DataFrame
+    formatted_df_SGA_expenses = df_SGA_expenses.applymap(format_with_commas)
 
-# Display the DataFrame
-print(formatted_df_SGA_expenses.to_string(index=False))
+    # Display the DataFrame
+    print(formatted_df_SGA_expenses.to_string(index=False))
@@ -1,171 +1,237 @@
-def capital_budgeting_expand():
+import argparse
+import os
+import sys
+
+# Shared helpers live in the common package at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from common.jobs import as_list, load_jobs, write_results
+
+def input_positive_number(prompt):
     """
-    This function encapsulates the entire capital budgeting process including 
-    getting user inputs, calculating cash flows, and discounting those cash flows 
-    to calculate the Net Present Value (NPV) of a project.
+    Asks the user for a positive number input.
+    Parameters:
+        prompt (str): The message displayed to the user.
+    Returns:
+        float: A positive number input by the user.
     """
-    import pandas as pd
-    import matplotlib.pyplot as plt
+    while True:
+        try:
+            value = float(input(prompt))
+            if value < 0:
+                raise ValueError("The value must be positive.")
+            return value
+        except ValueError as e:
+            print(f"Invalid input: {e}. Please try again.")
+
+def input_number_in_range(prompt, min_value=0, max_value=100):
+    """
+    Asks the user for input and validates that it is a number within the given range [min_value, max_value].
+    Parameters:
+        prompt (str): The message displayed to the user.
+        min_value (float): The minimum acceptable value.
+        max_value (float): The maximum acceptable value.
+    Returns:
+        float: A number within the specified range input by the user.
+    """
+    while True:
+        try:
+            value = float(input(prompt))
+            if not min_value <= value <= max_value:
+                raise ValueError(f"The value must be between {min_value} and {max_value}.")
+            return value
+        except ValueError as e:
+            print(f"Invalid input: {e}. Please try again.")
+
+def get_user_input():
+    """
+    Prompts the user for all of the inputs required to calculate the NPV of a project
+    and validates the input to ensure that they are correct numeric values.
+    Returns:
+        user_input (dict): A dictionary containing all the validated user inputs.
+    """
+    user_input = {
+        "years": int(input_positive_number("For how long, (in years), will the proposed project generate cash flows? ")),
+        "capex_items": int(input_positive_number("How many distinct pieces of capital expenditure will be required for the project? ")),
+        "tax_rate": input_number_in_range("Insert tax rate (0-100) %: ") / 100,
+        "cost_of_capital": input_number_in_range("Insert cost of capital (0-100) %: ") / 100,
+        "nwc_investment": input_positive_number("Insert net working capital investment: "),
+        "sales": input_positive_number("Insert annual sales amount: "),
+        "fixed_costs": input_positive_number("Insert fixed annual costs: "),
+        "variable_costs_percentage": input_positive_number("Insert variable costs as a percentage of sales: ") / 100
+    }
+
+    user_input["capex"] = [input_positive_number(f"Insert amount of Capex for item {i + 1}: ") for i in range(user_input["capex_items"])]
+    user_input["depreciation"] = [input_positive_number(f"Insert annual depreciation for year {i + 1}: ") for i in range(user_input["years"])]
+    user_input["salvage_value"] = [input_positive_number(f"Insert salvage value for item {i + 1}: ") for i in range(user_input["capex_items"])]
+    user_input["book_value"] = [input_positive_number(f"Insert book value for item {i + 1}: ") for i in range(user_input["capex_items"])]
+
+    return user_input
+
+def calculate_cash_flows(user_input):
+    """
+    Calculates the annual cash flows and the terminal net operating cash flow (TNOCF)
+    for the project based on user inputs.
+    Parameters:
+        user_input (dict): The dictionary containing all user inputs.
+    Returns:
+        List[float]: A list of cash flows including initial outlay and TNOCF.
+    """
+    FCInv = sum(user_input['capex'])
+    NWCInv = user_input["nwc_investment"]
+    Initial_outlay = FCInv + NWCInv
+    S = user_input["sales"]
+    Variable_costs = S * user_input["variable_costs_percentage"]
+    C = user_input["fixed_costs"] + Variable_costs
+    D = user_input["depreciation"]
+    T = user_input["tax_rate"]
 
-    def input_positive_number(prompt):
-        """
-        Asks the user for a positive number input.
-        Parameters:
-            prompt (str): The message displayed to the user.
-        Returns:
-            float: A positive number input by the user.
-        """
-        while True:
-            try:
-                value = float(input(prompt))
-                if value < 0:
-                    raise ValueError("The value must be positive.")
-                return value
-            except ValueError as e:
-                print(f"Invalid input: {e}. Please try again.")
-
-    def input_number_in_range(prompt, min_value=0, max_value=100):
-        """
-        Asks the user for input and validates that it is a number within the given range [min_value, max_value].
-        Parameters:
-            prompt (str): The message displayed to the user.
-            min_value (float): The minimum acceptable value.
-            max_value (float): The maximum acceptable value.
-        Returns:
-            float: A number within the specified range input by the user.
-        """
-        while True:
-            try:
-                value = float(input(prompt))
-                if not min_value <= value <= max_value:
-                    raise ValueError(f"The value must be between {min_value} and {max_value}.")
-                return value
-            except ValueError as e:
-                print(f"Invalid input: {e}. Please try again.")
-
-    def get_user_input():
-        """
-        Prompts the user for all of the inputs required to calculate the NPV of a project
-        and validates the input to ensure that they are correct numeric values.
-        Returns:
-            user_input (dict): A dictionary containing all the validated user inputs.
-        """
-        user_input = {
-            "years": int(input_positive_number("For how long, (in years), will the proposed project generate cash flows? ")),
-            "capex_items": int(input_positive_number("How many distinct pieces of capital expenditure will be required for the project? ")),
-            "tax_rate": input_number_in_range("Insert tax rate (0-100) %: ") / 100,
-            "cost_of_capital": input_number_in_range("Insert cost of capital (0-100) %: ") / 100,
-            "nwc_investment": input_positive_number("Insert net working capital investment: "),
-            "sales": input_positive_number("Insert annual sales amount: "),
-            "fixed_costs": input_positive_number("Insert fixed annual costs: "),
-            "variable_costs_percentage": input_positive_number("Insert variable costs as a percentage of sales: ") / 100
-        }
-
-        user_input["capex"] = [input_positive_number(f"Insert amount of Capex for item {i + 1}: ") for i in range(user_input["capex_items"])]
-        user_input["depreciation"] = [input_positive_number(f"Insert annual depreciation for year {i + 1}: ") for i in range(user_input["years"])]
-        user_input["salvage_value"] = [input_positive_number(f"Insert salvage value for item {i + 1}: ") for i in range(user_input["capex_items"])]
-        user_input["book_value"] = [input_positive_number(f"Insert book value for item {i + 1}: ") for i in range(user_input["capex_items"])]
-
-        return user_input
-
-    def calculate_cash_flows(user_input):
-        """
-        Calculates the annual cash flows and the terminal net operating cash flow (TNOCF)
-        for the project based on user inputs.
-        Parameters:
-            user_input (dict): The dictionary containing all user inputs.
-        Returns:
-            List[float]: A list of cash flows including initial outlay and TNOCF.
-        """
-        FCInv = sum(user_input['capex'])
-        NWCInv = user_input["nwc_investment"]
-        Initial_outlay = FCInv + NWCInv
-        S = user_input["sales"]
-        Variable_costs = S * user_input["variable_costs_percentage"]
-        C = user_input["fixed_costs"] + Variable_costs
-        D = user_input["depreciation"]
-        T = user_input["tax_rate"]
-
-        Cash_flows = [(S - C) * (1 - T) + (D[year] * T) for year in range(user_input["years"])]
-
-        Salvage_value_total = sum(user_input["salvage_value"])
-        Book_value_total = sum(user_input["book_value"])
-        TNOCF = Salvage_value_total + NWCInv - (T * (Salvage_value_total - Book_value_total))
-
-        Cash_flows[-1] += TNOCF
-        Cash_flows.insert(0, -Initial_outlay)
-
-        return Cash_flows
-    
-    def cash_flow_table(Cash_flows):
-        """
-        Creates a dataframe to hold the cash flows calculated elsewhere
-        Parameters:
-            cash_flows (List[float]): The list of cash flows from the project.
+    Cash_flows = [(S - C) * (1 - T) + (D[year] * T) for year in range(user_input["years"])]
 
-        Returns:
-            Dataframe: Dataframe holding cash flows
-        """
-        import pandas as pd
-        import matplotlib.pyplot as plt
+    Salvage_value_total = sum(user_input["salvage_value"])
+    Book_value_total = sum(user_input["book_value"])
+    TNOCF = Salvage_value_total + NWCInv - (T * (Salvage_value_total - Book_value_total))
 
-        # Creating a DataFrame starting from year 0
-        df = pd.DataFrame({'Year': range(0, len(Cash_flows)), 'Cash Flow': Cash_flows})
+    Cash_flows[-1] += TNOCF
+    Cash_flows.insert(0, -Initial_outlay)
 
-        # Calculate cumulative cash flows
-        df['Cumulative Cash Flow'] = df['Cash Flow'].cumsum()
+    return Cash_flows
 
-        # Plotting
-        plt.figure(figsize=(12, 6))
+def cash_flow_table(Cash_flows, show_plot=True):
+    """
+    Creates a dataframe to hold the cash flows calculated elsewhere
+    Parameters:
+        cash_flows (List[float]): The list of cash flows from the project.
+        show_plot (bool): Whether to plot the annual and cumulative cash flows.
 
-        # Plotting individual cash flows
-        plt.bar(df['Year'], df['Cash Flow'], color='blue', label='Annual Cash Flow')
+    Returns:
+        Dataframe: Dataframe holding cash flows
+    """
+    import pandas as pd
 
-        # Plotting cumulative cash flows
-        plt.plot(df['Year'], df['Cumulative Cash Flow'], color='red', marker='o', linestyle='-', label='Cumulative Cash Flow')
+    # Creating a DataFrame starting from year 0
+    df = pd.DataFrame({'Year': range(0, len(Cash_flows)), 'Cash Flow': Cash_flows})
 
-        # Adding labels and title
-        plt.title('Cash Flows Over Time')
-        plt.xlabel('Year')
-        plt.ylabel('Amount')
-        plt.xticks(df['Year'])  # Set x-ticks to be each year
-        plt.grid(True)
+    # Calculate cumulative cash flows
+    df['Cumulative Cash Flow'] = df['Cash Flow'].cumsum()
 
-        # Adding a legend
-        plt.legend()
+    if not show_plot:
+        return df
 
-        # Display the plot
-        plt.show()
+    import matplotlib.pyplot as plt
 
-        return df
+    # Plotting
+    plt.figure(figsize=(12, 6))
 
+    # Plotting individual cash flows
+    plt.bar(df['Year'], df['Cash Flow'], color='blue', label='Annual Cash Flow')
 
-        
-        
+    # Plotting cumulative cash flows
+    plt.plot(df['Year'], df['Cumulative Cash Flow'], color='red', marker='o', linestyle='-', label='Cumulative Cash Flow')
 
-    def discount_cash_flows(cash_flows, cost_of_capital):
-        """
-        Discounts the calculated cash flows to their present value and calculates
-        the Net Present Value (NPV) of the project.
-        Parameters:
-            cash_flows (List[float]): The list of cash flows from the project.
-            cost_of_capital (float): The cost of capital rate.
-        Returns:
-            float: The Net Present Value (NPV) of the project.
-        """
-        discounted_cash_flows = [cash_flow / ((1 + cost_of_capital) ** index) for index, cash_flow in enumerate(cash_flows)]
-        return sum(discounted_cash_flows)
+    # Adding labels and title
+    plt.title('Cash Flows Over Time')
+    plt.xlabel('Year')
+    plt.ylabel('Amount')
+    plt.xticks(df['Year'])  # Set x-ticks to be each year
+    plt.grid(True)
 
+    # Adding a legend
+    plt.legend()
+
+    # Display the plot
+    plt.show()
+
+    return df
+
+def discount_cash_flows(cash_flows, cost_of_capital):
+    """
+    Discounts the calculated cash flows to their present value and calculates
+    the Net Present Value (NPV) of the project.
+    Parameters:
+        cash_flows (List[float]): The list of cash flows from the project.
+        cost_of_capital (float): The cost of capital rate.
+    Returns:
+        float: The Net Present Value (NPV) of the project.
+    """
+    discounted_cash_flows = [cash_flow / ((1 + cost_of_capital) ** index) for index, cash_flow in enumerate(cash_flows)]
+    return sum(discounted_cash_flows)
+
+def capital_budgeting_expand(user_input=None, show_plot=True):
+    """
+    This function encapsulates the entire capital budgeting process including 
+    getting user inputs, calculating cash flows, and discounting those cash flows 
+    to calculate the Net Present Value (NPV) of a project.
+    Parameters:
+        user_input (dict): Optional inputs in the format returned by get_user_input; the user is prompted when omitted.
+        show_plot (bool): Whether to plot the cash flows.
+    Returns:
+        float: The Net Present Value (NPV) of the project.
+    """
     # Main execution starts here
-    user_input = get_user_input()
+    if user_input is None:
+        user_input = get_user_input()
     cash_flows = calculate_cash_flows(user_input)
     net_present_value = discount_cash_flows(cash_flows, user_input['cost_of_capital'])
     
-    cash_flow_table(cash_flows)
+    cash_flow_table(cash_flows, show_plot)
 
     print(f"The Net Present Value (NPV) of the project is: {net_present_value:.2f}")
 
     return net_present_value
 
-# Call the main function to run the capital budgeting process
-capital_budgeting_expand()
+def scenario_input(job):
+    """
+    Converts one job file scenario into the input dictionary used by calculate_cash_flows.
+    Rates are given as percentages (0-100), as at the interactive prompts.
+    """
+    user_input = {
+        "years": int(float(job["years"])),
+        "tax_rate": float(job["tax_rate"]) / 100,
+        "cost_of_capital": float(job["cost_of_capital"]) / 100,
+        "nwc_investment": float(job["nwc_investment"]),
+        "sales": float(job["sales"]),
+        "fixed_costs": float(job["fixed_costs"]),
+        "variable_costs_percentage": float(job["variable_costs_percentage"]) / 100,
+        "capex": as_list(job["capex"]),
+        "depreciation": as_list(job["depreciation"]),
+        "salvage_value": as_list(job["salvage_value"]),
+        "book_value": as_list(job["book_value"]),
+    }
+    user_input["capex_items"] = len(user_input["capex"])
+    return user_input
+
+def evaluate_projects(jobs):
+    """
+    Calculates the NPV of many expansion project scenarios without prompting or plotting.
+    Parameters:
+        jobs (List[dict]): Scenarios as loaded by load_jobs; an optional 'name' field labels each one.
+    Returns:
+        Dataframe: One row per scenario with its name and NPV.
+    """
+    import pandas as pd
+
+    rows = []
+    for index, job in enumerate(jobs):
+        user_input = scenario_input(job)
+        cash_flows = calculate_cash_flows(user_input)
+        rows.append({"name": job.get("name", index), "npv": discount_cash_flows(cash_flows, user_input["cost_of_capital"])})
+    return pd.DataFrame(rows)
+
+def main():
+    """
+    Command line entry point: evaluates a job file in bulk, or runs the interactive prompts when no job file is given.
+    """
+    parser = argparse.ArgumentParser(description="Capital budgeting for expansion projects.")
+    parser.add_argument("--jobs", help="JSON, YAML or CSV file of scenarios to evaluate without prompting.")
+    parser.add_argument("--output", help="CSV or JSON file for the results (printed when omitted).")
+    args = parser.parse_args()
+
+    if args.jobs:
+        write_results(evaluate_projects(load_jobs(args.jobs)), args.output)
+    else:
+        capital_budgeting_expand()
+
+if __name__ == "__main__":
+    main()
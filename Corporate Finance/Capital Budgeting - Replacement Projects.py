@@ -1,130 +1,142 @@
-def capital_budgeting_replace():
+import argparse
+import os
+import sys
+
+# Shared helpers live in the common package at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from common.jobs import as_list, load_jobs, write_results
+
+def input_positive_number(prompt):
     """
-    This function encapsulates the entire capital budgeting process for a replacement project including 
-    getting user inputs, calculating cash flows, and discounting those cash flows 
-    to calculate the Net Present Value (NPV) of a project.
+    Asks the user for a positive number input.
+    """
+    while True:
+        try:
+            value = float(input(prompt))
+            if value < 0:
+                raise ValueError("The value must be positive.")
+            print(f"Input received for {prompt}: {value}")
+            return value
+        except ValueError as e:
+            print(f"Invalid input: {e}. Please try again.")
+
+def input_number(prompt):
+    """
+    Asks the user for a number input which can be negative.
+    """
+    while True:
+        try:
+            value = float(input(prompt))
+            print(f"Input received for {prompt}: {value}")
+            return value
+        except ValueError as e:
+            print(f"Invalid input: {e}. Please try again.")
+
+def input_number_in_range(prompt, min_value=0, max_value=100):
+    """
+    Asks the user for input and validates that it is a number within the given range [min_value, max_value].
+    """
+    while True:
+        try:
+            value = float(input(prompt))
+            if not min_value <= value <= max_value:
+                raise ValueError(f"The value must be between {min_value} and {max_value}.")
+            print(f"Input received for {prompt}: {value}")
+            return value
+        except ValueError as e:
+            print(f"Invalid input: {e}. Please try again.")
+
+def get_user_input():
+    """
+    Prompts the user for all of the inputs required to calculate the NPV of a replacement project
+    and validates the input to ensure that they are correct numeric values.
+    """
+    print("Getting user inputs...")
+    user_input = {
+        "years": int(input_positive_number("For how long, (in years), will the proposed replacement project generate cash flows? ")),
+        "capex_items": int(input_positive_number("How many distinct pieces of capital expenditure will be required for the project? ")),
+        "tax_rate": input_number_in_range("Insert tax rate (0-100) %: ", 0, 100) / 100,
+        "cost_of_capital": input_number_in_range("Insert cost of capital (0-100) %: ", 0, 100) / 100,
+        "salvage_old_now": input_positive_number("What is the market value of the existing asset now? "),
+        "salvage_old_years": input_positive_number("What would be the market value of the existing asset at the end of the replacement project lifespan? "),
+        "book_old_years": input_positive_number("What would be the book value of the existing asset at the end of the replacement project lifespan? "),
+        "book_old": input_positive_number("What is the book value of the existing asset now? "),
+        "nwc_investment": input_positive_number("Insert net working capital investment: "),
+        "sales_change": input_number("Insert increase/(decrease) in sales: "),
+        "operating_costs_change": input_number("Insert increase/(decrease) in operating costs: "),
+    }
+
+    # Collecting additional inputs based on the number of capex items and years
+    user_input["capex"] = [input_positive_number(f"Insert amount of Capex for item {i + 1}: ") for i in range(user_input["capex_items"])]
+    user_input["depreciation_old"] = [input_positive_number(f"Insert annual depreciation for the existing asset for year {i + 1}: ") for i in range(user_input["years"])]
+    user_input["depreciation_new"] = [input_positive_number(f"Insert annual depreciation for the new asset for year {i + 1}: ") for i in range(user_input["years"])]
+    user_input["salvage_value_new"] = [input_positive_number(f"Insert salvage value for new item {i + 1} at the end of the project: ") for i in range(user_input["capex_items"])]
+    user_input["book_value_new"] = [input_positive_number(f"Insert book value for new item {i + 1} at the end of the project: ") for i in range(user_input["capex_items"])]
+
+
+    return user_input
+
+def calculate_cash_flows(user_input):
+    """
+    Calculates the annual cash flows and the terminal net operating cash flow (TNOCF)
+    for the project based on user inputs.
+    """
+
+    FCInv = sum(user_input['capex'])
+    NWCInv = user_input["nwc_investment"]
+    S_old_now = user_input["salvage_old_now"]
+    S_old_years = user_input["salvage_old_years"]
+    B_old = user_input["book_old"]
+    B_old_years = user_input["book_old_years"]
+    IncrementalSales = user_input["sales_change"]
+    IncrementalCosts = user_input["operating_costs_change"]
+    D_old = user_input["depreciation_old"]
+    D_new = user_input["depreciation_new"]
+    Incremental_depreciation = [D_new[year] - D_old[year] for year in range(user_input["years"])]
+    T = user_input["tax_rate"]
+
+    Initial_outlay = FCInv + NWCInv - S_old_now + (T * (S_old_now - B_old))
+
+
+    Incremental_Cash_flows = [(IncrementalSales - IncrementalCosts) * (1 - T) + (Incremental_depreciation[year] * T) for year in range(user_input["years"])]
+
+
+    Salvage_value_new_total = sum(user_input["salvage_value_new"])
+    Book_value_new_total = sum(user_input["book_value_new"])
+    TNOCF = (Salvage_value_new_total - S_old_years) + NWCInv - (T * (Salvage_value_new_total - Book_value_new_total) + (S_old_years - B_old_years))
+
+
+    Incremental_Cash_flows[-1] += TNOCF
+    Incremental_Cash_flows.insert(0, -Initial_outlay)
+
+
+    return Incremental_Cash_flows
+
+def discount_cash_flows(Incremental_Cash_flows, cost_of_capital, verbose=True):
     """
+    Discounts the calculated incremental cash flows to their present value and calculates
+    the Net Present Value (NPV) of the project.
+    """
+
+    discounted_cash_flows = [cash_flow / ((1 + cost_of_capital) ** index) for index, cash_flow in enumerate(Incremental_Cash_flows)]
+    NPV = sum(discounted_cash_flows)
 
-    def input_positive_number(prompt):
-        """
-        Asks the user for a positive number input.
-        """
-        while True:
-            try:
-                value = float(input(prompt))
-                if value < 0:
-                    raise ValueError("The value must be positive.")
-                print(f"Input received for {prompt}: {value}")
-                return value
-            except ValueError as e:
-                print(f"Invalid input: {e}. Please try again.")
-
-    def input_number(prompt):
-        """
-        Asks the user for a number input which can be negative.
-        """
-        while True:
-            try:
-                value = float(input(prompt))
-                print(f"Input received for {prompt}: {value}")
-                return value
-            except ValueError as e:
-                print(f"Invalid input: {e}. Please try again.")
-
-    def input_number_in_range(prompt, min_value=0, max_value=100):
-        """
-        Asks the user for input and validates that it is a number within the given range [min_value, max_value].
-        """
-        while True:
-            try:
-                value = float(input(prompt))
-                if not min_value <= value <= max_value:
-                    raise ValueError(f"The value must be between {min_value} and {max_value}.")
-                print(f"Input received for {prompt}: {value}")
-                return value
-            except ValueError as e:
-                print(f"Invalid input: {e}. Please try again.")
-
-    def get_user_input():
-        """
-        Prompts the user for all of the inputs required to calculate the NPV of a replacement project
-        and validates the input to ensure that they are correct numeric values.
-        """
-        print("Getting user inputs...")
-        user_input = {
-            "years": int(input_positive_number("For how long, (in years), will the proposed replacement project generate cash flows? ")),
-            "capex_items": int(input_positive_number("How many distinct pieces of capital expenditure will be required for the project? ")),
-            "tax_rate": input_number_in_range("Insert tax rate (0-100) %: ", 0, 100) / 100,
-            "cost_of_capital": input_number_in_range("Insert cost of capital (0-100) %: ", 0, 100) / 100,
-            "salvage_old_now": input_positive_number("What is the market value of the existing asset now? "),
-            "salvage_old_years": input_positive_number("What would be the market value of the existing asset at the end of the replacement project lifespan? "),
-            "book_old_years": input_positive_number("What would be the book value of the existing asset at the end of the replacement project lifespan? "),
-            "book_old": input_positive_number("What is the book value of the existing asset now? "),
-            "nwc_investment": input_positive_number("Insert net working capital investment: "),
-            "sales_change": input_number("Insert increase/(decrease) in sales: "),
-            "operating_costs_change": input_number("Insert increase/(decrease) in operating costs: "),
-        }
-
-        # Collecting additional inputs based on the number of capex items and years
-        user_input["capex"] = [input_positive_number(f"Insert amount of Capex for item {i + 1}: ") for i in range(user_input["capex_items"])]
-        user_input["depreciation_old"] = [input_positive_number(f"Insert annual depreciation for the existing asset for year {i + 1}: ") for i in range(user_input["years"])]
-        user_input["depreciation_new"] = [input_positive_number(f"Insert annual depreciation for the new asset for year {i + 1}: ") for i in range(user_input["years"])]
-        user_input["salvage_value_new"] = [input_positive_number(f"Insert salvage value for new item {i + 1} at the end of the project: ") for i in range(user_input["capex_items"])]
-        user_input["book_value_new"] = [input_positive_number(f"Insert book value for new item {i + 1} at the end of the project: ") for i in range(user_input["capex_items"])]
-        
-        
-        return user_input
-
-    def calculate_cash_flows(user_input):
-        """
-        Calculates the annual cash flows and the terminal net operating cash flow (TNOCF)
-        for the project based on user inputs.
-        """
-       
-        FCInv = sum(user_input['capex'])
-        NWCInv = user_input["nwc_investment"]
-        S_old_now = user_input["salvage_old_now"]
-        S_old_years = user_input["salvage_old_years"]
-        B_old = user_input["book_old"]
-        B_old_years = user_input["book_old_years"]
-        IncrementalSales = user_input["sales_change"]
-        IncrementalCosts = user_input["operating_costs_change"]
-        D_old = user_input["depreciation_old"]
-        D_new = user_input["depreciation_new"]
-        Incremental_depreciation = [D_new[year] - D_old[year] for year in range(user_input["years"])]
-        T = user_input["tax_rate"]
-        
-        Initial_outlay = FCInv + NWCInv - S_old_now + (T * (S_old_now - B_old))
-        
-        
-        Incremental_Cash_flows = [(IncrementalSales - IncrementalCosts) * (1 - T) + (Incremental_depreciation[year] * T) for year in range(user_input["years"])]
-        
-        
-        Salvage_value_new_total = sum(user_input["salvage_value_new"])
-        Book_value_new_total = sum(user_input["book_value_new"])
-        TNOCF = (Salvage_value_new_total - S_old_years) + NWCInv - (T * (Salvage_value_new_total - Book_value_new_total) + (S_old_years - B_old_years))
-        
-        
-        Incremental_Cash_flows[-1] += TNOCF
-        Incremental_Cash_flows.insert(0, -Initial_outlay)
-        
-        
-        return Incremental_Cash_flows
-
-    def discount_cash_flows(Incremental_Cash_flows, cost_of_capital):
-        """
-        Discounts the calculated incremental cash flows to their present value and calculates
-        the Net Present Value (NPV) of the project.
-        """
-
-        discounted_cash_flows = [cash_flow / ((1 + cost_of_capital) ** index) for index, cash_flow in enumerate(Incremental_Cash_flows)]
-        NPV = sum(discounted_cash_flows)
-        
+    if verbose:
         print(f"Net Present Value (NPV) calculated: {NPV}")
-        return NPV
+    return NPV
 
+def capital_budgeting_replace(user_input=None):
+    """
+    This function encapsulates the entire capital budgeting process for a replacement project including 
+    getting user inputs, calculating cash flows, and discounting those cash flows 
+    to calculate the Net Present Value (NPV) of a project.
+    The user is prompted for the inputs unless a user_input dictionary in the format returned by get_user_input is given.
+    """
     # Main execution starts here
-    user_input = get_user_input()
+    if user_input is None:
+        user_input = get_user_input()
     cash_flows = calculate_cash_flows(user_input)
     net_present_value = discount_cash_flows(cash_flows, user_input['cost_of_capital'])
 
@@ -132,5 +144,58 @@ def capital_budgeting_replace():
 
     return net_present_value
 
-# Call the main function to run the capital budgeting process
-capital_budgeting_replace()
+def scenario_input(job):
+    """
+    Converts one job file scenario into the input dictionary used by calculate_cash_flows.
+    Rates are given as percentages (0-100), as at the interactive prompts.
+    """
+    user_input = {
+        "years": int(float(job["years"])),
+        "tax_rate": float(job["tax_rate"]) / 100,
+        "cost_of_capital": float(job["cost_of_capital"]) / 100,
+        "salvage_old_now": float(job["salvage_old_now"]),
+        "salvage_old_years": float(job["salvage_old_years"]),
+        "book_old_years": float(job["book_old_years"]),
+        "book_old": float(job["book_old"]),
+        "nwc_investment": float(job["nwc_investment"]),
+        "sales_change": float(job["sales_change"]),
+        "operating_costs_change": float(job["operating_costs_change"]),
+        "capex": as_list(job["capex"]),
+        "depreciation_old": as_list(job["depreciation_old"]),
+        "depreciation_new": as_list(job["depreciation_new"]),
+        "salvage_value_new": as_list(job["salvage_value_new"]),
+        "book_value_new": as_list(job["book_value_new"]),
+    }
+    user_input["capex_items"] = len(user_input["capex"])
+    return user_input
+
+def evaluate_projects(jobs):
+    """
+    Calculates the NPV of many replacement project scenarios without prompting.
+    Returns a Dataframe with one row per scenario holding its name (the optional 'name' field, or its position) and NPV.
+    """
+    import pandas as pd
+
+    rows = []
+    for index, job in enumerate(jobs):
+        user_input = scenario_input(job)
+        cash_flows = calculate_cash_flows(user_input)
+        rows.append({"name": job.get("name", index), "npv": discount_cash_flows(cash_flows, user_input["cost_of_capital"], verbose=False)})
+    return pd.DataFrame(rows)
+
+def main():
+    """
+    Command line entry point: evaluates a job file in bulk, or runs the interactive prompts when no job file is given.
+    """
+    parser = argparse.ArgumentParser(description="Capital budgeting for replacement projects.")
+    parser.add_argument("--jobs", help="JSON, YAML or CSV file of scenarios to evaluate without prompting.")
+    parser.add_argument("--output", help="CSV or JSON file for the results (printed when omitted).")
+    args = parser.parse_args()
+
+    if args.jobs:
+        write_results(evaluate_projects(load_jobs(args.jobs)), args.output)
+    else:
+        capital_budgeting_replace()
+
+if __name__ == "__main__":
+    main()
@@ -47,4 +47,5 @@ def calculate_dividendpayout_residual_dividend(debt_target, equity_target, debtc
 
 
 #Example usage
-calculate_dividendpayout_residual_dividend(0.5,0.5,0.08,0.135,0.145,2500,[1000,1200,1200,1200,1000],[0.12,0.115,0.11,0.105,0.1])  
+if __name__ == "__main__":
+    calculate_dividendpayout_residual_dividend(0.5,0.5,0.08,0.135,0.145,2500,[1000,1200,1200,1200,1000],[0.12,0.115,0.11,0.105,0.1])  
@@ -10,5 +10,6 @@ def calculate_expected_dividend(previous_dividend, previous_EPS, future_EPS, tar
     return expected_dividend
 
 #Example usage
+if __name__ == "__main__":
 
-calculate_expected_dividend(0.7,3.5,4.5,0.35,5)
+    calculate_expected_dividend(0.7,3.5,4.5,0.35,5)
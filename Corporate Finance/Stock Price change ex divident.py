@@ -6,5 +6,5 @@ def stockprice_delta_exdividend(dividend, taxrate_dividend, taxrate_capitalgains
     return stock_price_delta_exdividend
 
 #Example usage
-stockprice_delta_exdividend(12, 0.3, 0.15)
-    
+if __name__ == "__main__":
+    stockprice_delta_exdividend(12, 0.3, 0.15)
@@ -0,0 +1,255 @@
+import numpy as np
+
+
+def flatten_schedules(schedules):
+    """
+    Flatten a ragged list of per-position cash flow schedules into a flat array plus offsets.
+
+    Parameters:
+    schedules (list of lists): One list of values (dividends, coupons or payment days) per position.
+
+    Returns:
+    tuple: (flat_values, offsets) where the schedule of position i is
+    flat_values[offsets[i]:offsets[i + 1]].
+    """
+    lengths = np.fromiter((len(schedule) for schedule in schedules), dtype=np.int64, count=len(schedules))
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    if offsets[-1] == 0:
+        return np.zeros(0), offsets
+    flat_values = np.concatenate([np.asarray(schedule, dtype=float) for schedule in schedules])
+    return flat_values, offsets
+
+
+def year_fraction(risk_free, days):
+    """
+    Convert day counts to years: on the curve's own basis for a DiscountCurve, actual/365 for a flat rate.
+
+    Parameters:
+    risk_free (float, np.ndarray or DiscountCurve): The annualised risk-free rates, or a discount curve.
+    days (float or np.ndarray): Days.
+
+    Returns:
+    np.ndarray: Times in years.
+    """
+    if hasattr(risk_free, 'year_fraction'):
+        return risk_free.year_fraction(days)
+    return np.asarray(days, dtype=float) / 365
+
+
+def growth_factor(risk_free, years):
+    """
+    Growth factor 1 / df over a number of years, from a flat annualised rate or a DiscountCurve.
+
+    Parameters:
+    risk_free (float, np.ndarray or DiscountCurve): The annualised risk-free rates, or a discount curve.
+    years (float or np.ndarray): Times in years.
+
+    Returns:
+    np.ndarray: (1 + risk_free) ** years, or 1 / curve.df(years) for a curve.
+    """
+    years = np.asarray(years, dtype=float)
+    if hasattr(risk_free, 'df'):
+        return 1 / risk_free.df(years)
+    return (1 + np.asarray(risk_free, dtype=float)) ** years
+
+
+def present_value_of_schedules(amounts, days, offsets, risk_free, valuation_day=0):
+    """
+    Present value of ragged cash flow schedules for many positions in one vectorized pass.
+
+    Parameters:
+    amounts (np.ndarray): Flat array of cash flow amounts for all positions.
+    days (np.ndarray): Flat array of days from today until each cash flow is paid.
+    offsets (np.ndarray): Offsets of length n_positions + 1 into the flat arrays.
+    risk_free (float, np.ndarray or DiscountCurve): The annualised risk-free rate, per position or shared, or a discount curve.
+    valuation_day (float or np.ndarray): Day at which the cash flows are valued, per position or shared.
+
+    Returns:
+    np.ndarray: Present value of each position's schedule.
+
+    The formula used for each cash flow is:
+    PV = amount / (1 + risk_free) ** ((days - valuation_day) / 365)
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    n_positions = offsets.shape[0] - 1
+    # Map every flat cash flow to the position that owns it
+    owner = np.repeat(np.arange(n_positions), np.diff(offsets))
+    if not hasattr(risk_free, 'df'):
+        risk_free = np.broadcast_to(np.asarray(risk_free, dtype=float), (n_positions,))[owner]
+    valuation_day = np.broadcast_to(np.asarray(valuation_day, dtype=float), (n_positions,))[owner]
+
+    discounted = np.asarray(amounts, dtype=float) / growth_factor(risk_free, year_fraction(risk_free, np.asarray(days, dtype=float) - valuation_day))
+    return np.bincount(owner, weights=discounted, minlength=n_positions)
+
+
+def forward_pricing_batch(spot_price, risk_free, term):
+    """
+    Batch version of forward_pricing for assets with no storage costs or payments.
+
+    Parameters:
+    spot_price (np.ndarray): Current market prices of the assets.
+    risk_free (float, np.ndarray or DiscountCurve): The annualised risk-free rates, or a discount curve.
+    term (float or np.ndarray): Forward contract terms in years.
+
+    Returns:
+    np.ndarray: The forward price of each position.
+    """
+    return np.asarray(spot_price, dtype=float) * growth_factor(risk_free, term)
+
+
+def equity_forward_price_days_batch(S0, r, q, T_days):
+    """
+    Batch version of equity_forward_price_days for equity forwards with continuous dividends.
+
+    Parameters:
+    S0 (np.ndarray): The current spot prices of the equities.
+    r (float, np.ndarray or DiscountCurve): The continuously compounded risk-free rates, or a discount curve.
+    q (float or np.ndarray): The continuous dividend yields.
+    T_days (np.ndarray): The times to maturity of the contracts in days.
+
+    Returns:
+    np.ndarray: The forward price of each position.
+    """
+    T_years = np.asarray(T_days, dtype=float) / 365
+    if hasattr(r, 'df'):
+        return np.asarray(S0, dtype=float) * np.exp(-np.asarray(q, dtype=float) * T_years) / r.df(r.year_fraction(T_days))
+    return np.asarray(S0, dtype=float) * np.exp((np.asarray(r, dtype=float) - np.asarray(q, dtype=float)) * T_years)
+
+
+def value_of_equity_index_forward_batch(Spot_Index_Value, r, q, T_days, t_days, Forward_Price_Initiation):
+    """
+    Batch version of value_of_equity_index_forward, the value to the long position of
+    equity index forwards with continuous dividends.
+
+    Parameters:
+    Spot_Index_Value (np.ndarray): The current values of the indices.
+    r (float, np.ndarray or DiscountCurve): The continuously compounded risk-free rates, or a discount curve.
+    q (float or np.ndarray): The continuous dividend yields.
+    T_days (np.ndarray): The original times to maturity of the contracts in days.
+    t_days (np.ndarray): The times elapsed since initiation of the contracts in days.
+    Forward_Price_Initiation (np.ndarray): The forward prices at initiation of the contracts.
+
+    Returns:
+    np.ndarray: The mark-to-market value of each position.
+    """
+    remaining_days = np.asarray(T_days, dtype=float) - np.asarray(t_days, dtype=float)
+    remaining_years = remaining_days / 365
+    discount_factor = r.df(r.year_fraction(remaining_days)) if hasattr(r, 'df') else np.exp(-np.asarray(r, dtype=float) * remaining_years)
+    return (np.asarray(Spot_Index_Value, dtype=float) * np.exp(-np.asarray(q, dtype=float) * remaining_years)
+            - np.asarray(Forward_Price_Initiation, dtype=float) * discount_factor)
+
+
+def forward_pricing_discrete_dividends_batch(spot_price, risk_free, term, dividends, days, offsets):
+    """
+    Batch version of forward_pricing_discrete_dividends.
+
+    Parameters:
+    spot_price (np.ndarray): Current market prices of the assets.
+    risk_free (float, np.ndarray or DiscountCurve): The annualised risk-free rates, or a discount curve.
+    term (np.ndarray): Forward contract terms in days.
+    dividends (np.ndarray): Flat array of dividends for all positions.
+    days (np.ndarray): Flat array of days until each dividend is paid.
+    offsets (np.ndarray): Offsets of length n_positions + 1 into dividends and days.
+
+    Returns:
+    np.ndarray: The forward price of each position.
+    """
+    present_value_dividends = present_value_of_schedules(dividends, days, offsets, risk_free)
+    return (np.asarray(spot_price, dtype=float) - present_value_dividends) * growth_factor(risk_free, year_fraction(risk_free, term))
+
+
+def calculate_forward_price_fixed_income_security_batch(spot_price, risk_free, term, coupons, days, offsets):
+    """
+    Batch version of calculate_forward_price_fixed_income_security.
+
+    Parameters:
+    spot_price (np.ndarray): Current prices of the fixed income securities.
+    risk_free (float, np.ndarray or DiscountCurve): The annualised risk-free rates, or a discount curve.
+    term (np.ndarray): Forward contract terms in days.
+    coupons (np.ndarray): Flat array of coupons for all positions.
+    days (np.ndarray): Flat array of days until each coupon is paid.
+    offsets (np.ndarray): Offsets of length n_positions + 1 into coupons and days.
+
+    Returns:
+    np.ndarray: The forward price of each position.
+    """
+    return forward_pricing_discrete_dividends_batch(spot_price, risk_free, term, coupons, days, offsets)
+
+
+def value_forward_contract_fixed_income_batch(spot_price, risk_free, term, coupons, days, offsets,
+                                              forward_price_fixed_income_security, T):
+    """
+    Batch version of value_forward_contract_fixed_income, the value of long positions in
+    forward contracts on fixed income securities.
+
+    Parameters:
+    spot_price (np.ndarray): Current prices of the fixed income securities.
+    risk_free (float, np.ndarray or DiscountCurve): The annualised risk-free rates, or a discount curve.
+    term (np.ndarray): Original forward contract terms in days.
+    coupons (np.ndarray): Flat array of coupons for all positions.
+    days (np.ndarray): Flat array of days from initiation until each coupon is paid.
+    offsets (np.ndarray): Offsets of length n_positions + 1 into coupons and days.
+    forward_price_fixed_income_security (np.ndarray): The forward prices agreed at initiation.
+    T (float or np.ndarray): Days elapsed since initiation of each contract.
+
+    Returns:
+    np.ndarray: The mark-to-market value of each position.
+    """
+    present_value_coupons = present_value_of_schedules(coupons, days, offsets, risk_free, valuation_day=T)
+    remaining_years = year_fraction(risk_free, np.asarray(term, dtype=float) - np.asarray(T, dtype=float))
+    return ((np.asarray(spot_price, dtype=float) - present_value_coupons)
+            - np.asarray(forward_price_fixed_income_security, dtype=float) / growth_factor(risk_free, remaining_years))
+
+
+def revalue_forward_positions(positions, amounts=None, days=None, offsets=None, curve=None):
+    """
+    Compute forward prices and mark-to-market values for a book of forwards on assets with
+    discrete payments (dividend-paying equities or coupon-paying bonds) in one vectorized pass.
+
+    Parameters:
+    positions (pd.DataFrame): One row per position with columns 'spot_price', 'risk_free' (unless a curve is given),
+        'term' (days), 'elapsed' (days since initiation) and 'contract_price' (forward price
+        agreed at initiation).
+    amounts (np.ndarray): Flat array of dividends/coupons for all positions (optional).
+    days (np.ndarray): Flat array of days from initiation until each payment (optional).
+    offsets (np.ndarray): Offsets of length len(positions) + 1 into amounts and days (optional).
+    curve (DiscountCurve): Discount curve used in place of the 'risk_free' column (optional).
+
+    Returns:
+    pd.DataFrame: A copy of positions with 'forward_price' (fair forward price for the
+    remaining term, as of today) and 'mtm_value' (value to the long position) columns added.
+    """
+    n_positions = len(positions)
+    if offsets is None:
+        amounts, days, offsets = np.zeros(0), np.zeros(0), np.zeros(n_positions + 1, dtype=np.int64)
+
+    spot_price = positions['spot_price'].to_numpy(dtype=float)
+    risk_free = curve if curve is not None else positions['risk_free'].to_numpy(dtype=float)
+    term = positions['term'].to_numpy(dtype=float)
+    elapsed = positions['elapsed'].to_numpy(dtype=float)
+
+    # Present value of payments as of today, shared by the forward price and the valuation
+    present_value_payments = present_value_of_schedules(amounts, days, offsets, risk_free, valuation_day=elapsed)
+    growth = growth_factor(risk_free, year_fraction(risk_free, term - elapsed))
+
+    result = positions.copy()
+    result['forward_price'] = (spot_price - present_value_payments) * growth
+    result['mtm_value'] = (spot_price - present_value_payments) - positions['contract_price'].to_numpy(dtype=float) / growth
+    return result
+
+
+# Example usage
+if __name__ == "__main__":
+    import pandas as pd
+
+    # Two equity forwards and one bond forward revalued together; the bond pays a single coupon of 35 in 182 days
+    dividends_and_coupons, offsets = flatten_schedules([[0.4, 0.4], [], [35]])
+    payment_days, _ = flatten_schedules([[15, 85], [], [182]])
+    positions = pd.DataFrame({
+        'spot_price': [30, 500, 1090],
+        'risk_free': [0.05, 0.06, 0.06],
+        'term': [100, 91, 250],
+        'elapsed': [0, 0, 100],
+        'contract_price': [30.2, 507.0, 1057.37],
+    })
+    revalue_forward_positions(positions, dividends_and_coupons, payment_days, offsets)
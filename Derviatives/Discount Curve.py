@@ -0,0 +1,186 @@
+import numpy as np
+
+
+class DiscountCurve:
+    """
+    A term structure of discount factors built from pillar points, with vectorized lookups.
+
+    Times are year fractions from today on a single actual/days_in_year basis, actual/365 by
+    default. Callers holding day counts convert them with year_fraction(), so every valuation
+    reads the same discount factor for the same date whatever the convention of the
+    instrument's own accruals. Interpolation is either 'log_linear' on the
+    discount factors (piecewise flat forward rates) or 'monotone_cubic', a shape-preserving
+    PCHIP spline through log discount factors. Beyond the last pillar the curve is
+    extrapolated at the last forward rate.
+
+    The forward, FRA and fixed income functions in this folder accept a DiscountCurve in
+    place of a flat risk-free rate, so one curve build serves many valuations.
+    """
+
+    def __init__(self, times, discount_factors, interpolation='log_linear', days_in_year=365):
+        """
+        Parameters:
+        times (list or np.ndarray): Pillar times in years, strictly increasing and positive.
+        discount_factors (list or np.ndarray): Discount factors at each pillar time.
+        interpolation (str): 'log_linear' or 'monotone_cubic'.
+        days_in_year (int): Day-count basis of the curve's year fractions, 365 or 360.
+        """
+        if interpolation not in ('log_linear', 'monotone_cubic'):
+            raise ValueError("interpolation must be either 'log_linear' or 'monotone_cubic'.")
+        times = np.asarray(times, dtype=float)
+        discount_factors = np.asarray(discount_factors, dtype=float)
+        if times.shape != discount_factors.shape or times.size == 0:
+            raise ValueError("times and discount_factors must be non-empty and of equal length.")
+        if np.any(np.diff(times) <= 0) or times[0] <= 0:
+            raise ValueError("Pillar times must be positive and strictly increasing.")
+
+        # Anchor the curve at df(0) = 1
+        self.times = np.concatenate(([0.0], times))
+        self.log_discount_factors = np.concatenate(([0.0], np.log(discount_factors)))
+        self.interpolation = interpolation
+        self.days_in_year = days_in_year
+        self._spline = None
+        if interpolation == 'monotone_cubic' and self.times.size > 2:
+            # SciPy is only loaded by curves that need it
+            from scipy.interpolate import PchipInterpolator
+            self._spline = PchipInterpolator(self.times, self.log_discount_factors, extrapolate=False)
+
+    @classmethod
+    def from_quotes(cls, deposits=(), fras=(), swaps=(), interpolation='log_linear', swap_frequency=1,
+                    days_in_year=365):
+        """
+        Bootstrap a curve from money market and swap quotes.
+
+        Parameters:
+        deposits (list of tuples): (T, rate) simple-interest deposit quotes, T in years.
+        fras (list of tuples): (T1, T2, rate) simple-interest FRA quotes, times in years.
+        swaps (list of tuples): (T, rate) par swap quotes with fixed payments swap_frequency times a year.
+        interpolation (str): 'log_linear' or 'monotone_cubic' for the finished curve.
+        swap_frequency (int): Number of fixed payments per year on the swaps.
+        days_in_year (int): Day-count basis of the quote times and of the finished curve.
+
+        Returns:
+        DiscountCurve: The bootstrapped curve.
+
+        Deposits give df(T) = 1 / (1 + rate * T), FRAs give df(T2) = df(T1) / (1 + rate * (T2 - T1)),
+        and each swap solves 1 = rate * sum(tau * df(t_i)) + df(T) with log-linear interpolation
+        between the previous pillar and T for any fixed payment dates that fall in between.
+        """
+        times, discount_factors = [], []
+
+        def add_pillar(t, discount_factor):
+            if times and t <= times[-1]:
+                raise ValueError("Quotes must extend the curve to strictly increasing maturities.")
+            times.append(t)
+            discount_factors.append(discount_factor)
+
+        for T, rate in sorted(deposits):
+            add_pillar(T, 1 / (1 + rate * T))
+
+        for T1, T2, rate in sorted(fras, key=lambda quote: quote[1]):
+            if times:
+                start_discount_factor = cls(times, discount_factors).df(T1)
+            elif T1 == 0:
+                start_discount_factor = 1.0
+            else:
+                raise ValueError(f"The FRA from {T1} to {T2} needs a deposit or an earlier FRA to discount from {T1}.")
+            add_pillar(T2, start_discount_factor / (1 + rate * (T2 - T1)))
+
+        tau = 1 / swap_frequency
+        for T, rate in sorted(swaps):
+            payment_times = np.arange(1, int(round(T * swap_frequency)) + 1) * tau
+            last_time = times[-1] if times else 0.0
+            known = payment_times[payment_times <= last_time]
+            unknown = payment_times[payment_times > last_time]
+            known_annuity = tau * cls(times, discount_factors).df(known).sum() if known.size else 0.0
+            last_log_df = np.log(discount_factors[-1]) if discount_factors else 0.0
+            weights = (unknown - last_time) / (T - last_time)
+
+            def par_error(log_df_T):
+                # Log-linear between the last pillar and the trial df(T)
+                unknown_dfs = np.exp(last_log_df + weights * (log_df_T - last_log_df))
+                return rate * (known_annuity + tau * unknown_dfs.sum()) + unknown_dfs[-1] - 1
+
+            from scipy.optimize import brentq
+            add_pillar(T, np.exp(brentq(par_error, -10.0, 1.0)))
+
+        return cls(times, discount_factors, interpolation, days_in_year)
+
+    def _log_df(self, t):
+        """Interpolated log discount factors for an array of times."""
+        t = np.asarray(t, dtype=float)
+        if self._spline is not None:
+            inside = t <= self.times[-1]
+            result = np.empty_like(t)
+            result[inside] = self._spline(t[inside])
+        else:
+            result = np.interp(t, self.times, self.log_discount_factors)
+        # Flat forward extrapolation beyond the last pillar
+        beyond = t > self.times[-1]
+        if beyond.any():
+            last_forward = ((self.log_discount_factors[-2] - self.log_discount_factors[-1])
+                            / (self.times[-1] - self.times[-2]))
+            result[beyond] = self.log_discount_factors[-1] - last_forward * (t[beyond] - self.times[-1])
+        return result
+
+    def year_fraction(self, days):
+        """
+        Convert day counts to the curve's year fractions.
+
+        Parameters:
+        days (float or np.ndarray): Days from today.
+
+        Returns:
+        float or np.ndarray: days / days_in_year.
+        """
+        return np.asarray(days, dtype=float) / self.days_in_year
+
+    def df(self, t):
+        """
+        Discount factors for one or many times.
+
+        Parameters:
+        t (float or np.ndarray): Times in years.
+
+        Returns:
+        float or np.ndarray: The discount factor for each time.
+        """
+        t = np.asarray(t, dtype=float)
+        result = np.exp(self._log_df(t.ravel())).reshape(t.shape)
+        return float(result) if result.ndim == 0 else result
+
+    def forward(self, t1, t2):
+        """
+        Simple-interest forward rates between two sets of times.
+
+        Parameters:
+        t1 (float or np.ndarray): Start times in years.
+        t2 (float or np.ndarray): End times in years.
+
+        Returns:
+        float or np.ndarray: The annualised forward rate (df(t1) / df(t2) - 1) / (t2 - t1).
+        """
+        return (self.df(t1) / self.df(t2) - 1) / (np.asarray(t2, dtype=float) - np.asarray(t1, dtype=float))
+
+    def zero_rate(self, t):
+        """
+        Continuously compounded zero rates.
+
+        Parameters:
+        t (float or np.ndarray): Times in years.
+
+        Returns:
+        float or np.ndarray: The zero rate -log(df(t)) / t.
+        """
+        return -np.log(self.df(t)) / np.asarray(t, dtype=float)
+
+
+# Example usage
+if __name__ == "__main__":
+    # Bootstrap from 1M/3M deposits, a 3x6 FRA and 1y-5y par swaps, then price off the curve
+    curve = DiscountCurve.from_quotes(
+        deposits=[(1 / 12, 0.040), (0.25, 0.042)],
+        fras=[(0.25, 0.5, 0.044)],
+        swaps=[(1, 0.045), (2, 0.046), (3, 0.047), (5, 0.048)],
+    )
+    curve.df([0.5, 1, 2.5, 5]), curve.forward(curve.year_fraction(30), curve.year_fraction(120))
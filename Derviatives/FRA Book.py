@@ -0,0 +1,175 @@
+import numpy as np
+
+
+class FRABook:
+    """
+    A book of Forward Rate Agreements held in columnar arrays.
+
+    Trades are grouped by their (start, end) tenor so that each forward rate is read off
+    the curve once per tenor rather than once per trade. Adding trades only extends the
+    tenor table with tenors that have not been seen before, and forward rates already
+    computed for the current curve are reused on the next revaluation.
+
+    Days are measured from today. Accruals and forward rates are on an actual/360 basis,
+    matching fra_forward_rate and fra_value_at_maturity, while discount factors are read at the
+    curve's own year fractions (curve.year_fraction).
+    """
+
+    def __init__(self):
+        self.notional = np.zeros(0)
+        self.contract_rate = np.zeros(0)
+        self.tenor_index = np.zeros(0, dtype=np.int64)
+        self.tenor_start = np.zeros(0)
+        self.tenor_end = np.zeros(0)
+        self._tenor_lookup = {}
+        self._curve = None
+        self._forward_rates = np.zeros(0)
+
+    def __len__(self):
+        return self.notional.shape[0]
+
+    def add_trades(self, notional, contract_rate, start_day, end_day):
+        """
+        Append trades to the book.
+
+        Parameters:
+        notional (float or np.ndarray): Notional principal of each trade; negative for short (receive fixed) positions.
+        contract_rate (float or np.ndarray): The FRA rate agreed in each contract.
+        start_day (int or np.ndarray): Days from today until the FRA settles (the fixing of the underlying rate).
+        end_day (int or np.ndarray): Days from today until the end of the underlying loan.
+        """
+        notional = np.atleast_1d(np.asarray(notional, dtype=float))
+        n_trades = notional.shape[0]
+        contract_rate = np.broadcast_to(np.asarray(contract_rate, dtype=float), (n_trades,))
+        start_day = np.broadcast_to(np.asarray(start_day, dtype=float), (n_trades,))
+        end_day = np.broadcast_to(np.asarray(end_day, dtype=float), (n_trades,))
+        if np.any(end_day <= start_day):
+            raise ValueError("Each FRA must end after it starts.")
+
+        # Resolve only the distinct tenors of the new trades against the tenor table
+        pairs, inverse = np.unique(np.column_stack((start_day, end_day)), axis=0, return_inverse=True)
+        pair_index = np.empty(pairs.shape[0], dtype=np.int64)
+        new_tenors = []
+        for k, (start, end) in enumerate(pairs.tolist()):
+            index = self._tenor_lookup.get((start, end))
+            if index is None:
+                index = len(self._tenor_lookup)
+                self._tenor_lookup[(start, end)] = index
+                new_tenors.append((start, end))
+            pair_index[k] = index
+        if new_tenors:
+            new_tenors = np.asarray(new_tenors)
+            self.tenor_start = np.concatenate((self.tenor_start, new_tenors[:, 0]))
+            self.tenor_end = np.concatenate((self.tenor_end, new_tenors[:, 1]))
+
+        self.notional = np.concatenate((self.notional, notional))
+        self.contract_rate = np.concatenate((self.contract_rate, contract_rate))
+        self.tenor_index = np.concatenate((self.tenor_index, pair_index[inverse.ravel()]))
+
+    def forward_rates(self, curve):
+        """
+        Annualised forward rate for every tenor in the book.
+
+        Parameters:
+        curve (DiscountCurve): The discount curve to read forward rates from.
+
+        Returns:
+        np.ndarray: Forward rate per tenor, in tenor table order.
+        """
+        if curve is not self._curve:
+            self._curve = curve
+            self._forward_rates = np.zeros(0)
+        n_cached = self._forward_rates.shape[0]
+        if n_cached < self.tenor_start.shape[0]:
+            # Only tenors added since the last revaluation against this curve are computed
+            start, end = self.tenor_start[n_cached:], self.tenor_end[n_cached:]
+            growth = curve.df(curve.year_fraction(start)) / curve.df(curve.year_fraction(end))
+            new_rates = (growth - 1) * 360 / (end - start)
+            self._forward_rates = np.concatenate((self._forward_rates, np.atleast_1d(new_rates)))
+        return self._forward_rates
+
+    def revalue(self, curve):
+        """
+        Value every trade in the book in one vectorized pass.
+
+        Parameters:
+        curve (DiscountCurve): The discount curve to value against.
+
+        Returns:
+        pd.DataFrame: One row per trade with the forward rate, the cash settlement amount at
+        the FRA settlement date, its present value today, and PV01 (change in PV for a one
+        basis point rise in the trade's forward rate).
+
+        The settlement amount follows fra_value_at_maturity:
+        Settlement = Notional * (F - Contract Rate) * tau * exp(-F * tau), with tau = (end - start) / 360
+        """
+        import pandas as pd
+
+        tenor_forward = self.forward_rates(curve)
+        tenor_accrual = (self.tenor_end - self.tenor_start) / 360
+        tenor_discount = np.atleast_1d(curve.df(curve.year_fraction(self.tenor_start)))
+
+        forward = tenor_forward[self.tenor_index]
+        accrual = tenor_accrual[self.tenor_index]
+        discount = tenor_discount[self.tenor_index]
+        settlement_discount = np.exp(-forward * accrual)
+
+        settlement = self.notional * (forward - self.contract_rate) * accrual * settlement_discount
+        pv = settlement * discount
+        # d(settlement)/dF = Notional * tau * exp(-F tau) * (1 - (F - K) * tau)
+        pv01 = (self.notional * accrual * settlement_discount
+                * (1 - (forward - self.contract_rate) * accrual) * discount * 1e-4)
+
+        return pd.DataFrame({
+            'start_day': self.tenor_start[self.tenor_index],
+            'end_day': self.tenor_end[self.tenor_index],
+            'forward_rate': forward,
+            'settlement': settlement,
+            'pv': pv,
+            'pv01': pv01,
+        })
+
+    def aggregate_by_tenor(self, curve):
+        """
+        Total settlement, PV and PV01 per (start, end) tenor.
+
+        Parameters:
+        curve (DiscountCurve): The discount curve to value against.
+
+        Returns:
+        pd.DataFrame: One row per tenor with the trade count and summed risk measures.
+        """
+        import pandas as pd
+
+        valuation = self.revalue(curve)
+        n_tenors = self.tenor_start.shape[0]
+        summary = pd.DataFrame({
+            'start_day': self.tenor_start,
+            'end_day': self.tenor_end,
+            'forward_rate': self.forward_rates(curve),
+            'trades': np.bincount(self.tenor_index, minlength=n_tenors),
+        })
+        for column in ('settlement', 'pv', 'pv01'):
+            summary[column] = np.bincount(self.tenor_index, weights=valuation[column].to_numpy(), minlength=n_tenors)
+        return summary
+
+
+# Example usage
+if __name__ == "__main__":
+    # Two long 1x4 FRAs sharing one tenor and a short 3x6 FRA, valued on a flat 4% continuously
+    # compounded curve; any object with df() and year_fraction(), such as a DiscountCurve, can be used
+    class FlatCurve:
+        def __init__(self, rate):
+            self.rate = rate
+
+        def year_fraction(self, days):
+            return np.asarray(days, dtype=float) / 365
+
+        def df(self, t):
+            return np.exp(-self.rate * np.asarray(t, dtype=float))
+
+
+    book = FRABook()
+    book.add_trades([1e6, 2e6], [0.0532, 0.05], [30, 30], [120, 120])
+    book.add_trades(-5e5, 0.045, 90, 180)
+    book.aggregate_by_tenor(FlatCurve(0.04))
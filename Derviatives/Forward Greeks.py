@@ -0,0 +1,249 @@
+import numpy as np
+
+
+def _owner(offsets):
+    """Position index of every entry in a flat schedule described by offsets."""
+    offsets = np.asarray(offsets, dtype=np.int64)
+    return np.repeat(np.arange(offsets.shape[0] - 1), np.diff(offsets))
+
+
+def continuous_dividend_forward_greeks(S0, r, q, T_days):
+    """
+    Closed-form sensitivities of equity_forward_price_days, FP = S0 * exp((r - q) * T).
+
+    Parameters:
+    S0 (float or np.ndarray): The current spot prices of the equities.
+    r (float or np.ndarray): The continuously compounded risk-free rates.
+    q (float or np.ndarray): The continuous dividend yields.
+    T_days (float or np.ndarray): The times to maturity of the contracts in days.
+
+    Returns:
+    dict: Arrays 'forward_price', 'delta' (dFP/dS0), 'rho' (dFP/dr) and 'dividend' (dFP/dq).
+    """
+    T_years = np.asarray(T_days, dtype=float) / 365
+    growth = np.exp((np.asarray(r, dtype=float) - np.asarray(q, dtype=float)) * T_years)
+    forward_price = np.asarray(S0, dtype=float) * growth
+    return {
+        'forward_price': forward_price,
+        'delta': growth,
+        'rho': T_years * forward_price,
+        'dividend': -T_years * forward_price,
+    }
+
+
+def continuous_dividend_forward_value_greeks(Spot_Index_Value, r, q, T_days, t_days, Forward_Price_Initiation):
+    """
+    Closed-form sensitivities of value_of_equity_index_forward,
+    Value = S * exp(-q * (T - t)) - F0 * exp(-r * (T - t)).
+
+    Parameters:
+    Spot_Index_Value (float or np.ndarray): The current values of the indices.
+    r (float or np.ndarray): The continuously compounded risk-free rates.
+    q (float or np.ndarray): The continuous dividend yields.
+    T_days (float or np.ndarray): The original times to maturity of the contracts in days.
+    t_days (float or np.ndarray): The times elapsed since initiation of the contracts in days.
+    Forward_Price_Initiation (float or np.ndarray): The forward prices at initiation of the contracts.
+
+    Returns:
+    dict: Arrays 'value', 'delta' (dV/dS), 'rho' (dV/dr) and 'dividend' (dV/dq).
+    """
+    remaining_years = (np.asarray(T_days, dtype=float) - np.asarray(t_days, dtype=float)) / 365
+    spot_leg = np.asarray(Spot_Index_Value, dtype=float) * np.exp(-np.asarray(q, dtype=float) * remaining_years)
+    forward_leg = np.asarray(Forward_Price_Initiation, dtype=float) * np.exp(-np.asarray(r, dtype=float) * remaining_years)
+    return {
+        'value': spot_leg - forward_leg,
+        'delta': np.exp(-np.asarray(q, dtype=float) * remaining_years),
+        'rho': remaining_years * forward_leg,
+        'dividend': -remaining_years * spot_leg,
+    }
+
+
+def discrete_dividend_forward_greeks(spot_price, risk_free, term, dividends, days, offsets):
+    """
+    Closed-form sensitivities of forward_pricing_discrete_dividends for a batch of positions,
+    FP = (S - sum(D_i * (1 + r) ** -t_i)) * (1 + r) ** T with times in years of 365 days.
+
+    Parameters:
+    spot_price (float or np.ndarray): Current market prices of the assets.
+    risk_free (float or np.ndarray): The annualised risk-free rates.
+    term (float or np.ndarray): Forward contract terms in days.
+    dividends (np.ndarray): Flat array of dividends for all positions.
+    days (np.ndarray): Flat array of days until each dividend is paid.
+    offsets (np.ndarray): Offsets of length n_positions + 1 into dividends and days.
+
+    Returns:
+    dict: Arrays 'forward_price', 'delta' (dFP/dS), 'rho' (dFP/dr) and 'dividend' (dFP for a
+    one unit rise in every dividend of the position), plus 'dividend_by_payment' with dFP/dD_i
+    for every entry of the flat dividend array.
+    """
+    owner = _owner(offsets)
+    n_positions = np.asarray(offsets).shape[0] - 1
+    rate = np.broadcast_to(np.asarray(risk_free, dtype=float), (n_positions,))
+    T_years = np.broadcast_to(np.asarray(term, dtype=float) / 365, (n_positions,))
+    t_years = np.asarray(days, dtype=float) / 365
+    dividends = np.asarray(dividends, dtype=float)
+
+    discount = (1 + rate[owner]) ** -t_years
+    present_value_dividends = np.bincount(owner, weights=dividends * discount, minlength=n_positions)
+    # d/dr of sum(D_i * (1 + r) ** -t_i)
+    present_value_rate_slope = np.bincount(owner, weights=-dividends * t_years * discount / (1 + rate[owner]),
+                                           minlength=n_positions)
+    growth = (1 + rate) ** T_years
+    forward_price = (np.asarray(spot_price, dtype=float) - present_value_dividends) * growth
+    dividend_by_payment = -discount * growth[owner]
+
+    return {
+        'forward_price': forward_price,
+        'delta': growth,
+        'rho': T_years / (1 + rate) * forward_price - present_value_rate_slope * growth,
+        'dividend': np.bincount(owner, weights=dividend_by_payment, minlength=n_positions),
+        'dividend_by_payment': dividend_by_payment,
+    }
+
+
+def fixed_income_forward_greeks(spot_price, risk_free, term, coupons, days, offsets):
+    """
+    Closed-form sensitivities of calculate_forward_price_fixed_income_security for a batch of
+    positions. The formula is the discrete dividend one with coupons in place of dividends.
+
+    Parameters:
+    spot_price (float or np.ndarray): Current prices of the fixed income securities.
+    risk_free (float or np.ndarray): The annualised risk-free rates.
+    term (float or np.ndarray): Forward contract terms in days.
+    coupons (np.ndarray): Flat array of coupons for all positions.
+    days (np.ndarray): Flat array of days until each coupon is paid.
+    offsets (np.ndarray): Offsets of length n_positions + 1 into coupons and days.
+
+    Returns:
+    dict: Arrays 'forward_price', 'delta', 'rho', 'coupon' and 'coupon_by_payment'.
+    """
+    greeks = discrete_dividend_forward_greeks(spot_price, risk_free, term, coupons, days, offsets)
+    greeks['coupon'] = greeks.pop('dividend')
+    greeks['coupon_by_payment'] = greeks.pop('dividend_by_payment')
+    return greeks
+
+
+def fixed_income_forward_value_greeks(spot_price, risk_free, term, coupons, days, offsets,
+                                      forward_price_fixed_income_security, T):
+    """
+    Closed-form sensitivities of value_forward_contract_fixed_income for a batch of positions,
+    Value = S - sum(C_i * (1 + r) ** -(t_i - T)) - F0 * (1 + r) ** -(term - T).
+
+    Parameters:
+    spot_price (float or np.ndarray): Current prices of the fixed income securities.
+    risk_free (float or np.ndarray): The annualised risk-free rates.
+    term (float or np.ndarray): Original forward contract terms in days.
+    coupons (np.ndarray): Flat array of coupons for all positions.
+    days (np.ndarray): Flat array of days from initiation until each coupon is paid.
+    offsets (np.ndarray): Offsets of length n_positions + 1 into coupons and days.
+    forward_price_fixed_income_security (float or np.ndarray): The forward prices agreed at initiation.
+    T (float or np.ndarray): Days elapsed since initiation of each contract.
+
+    Returns:
+    dict: Arrays 'value', 'delta' (dV/dS), 'rho' (dV/dr) and 'coupon' (dV for a one unit rise in every coupon).
+    """
+    owner = _owner(offsets)
+    n_positions = np.asarray(offsets).shape[0] - 1
+    rate = np.broadcast_to(np.asarray(risk_free, dtype=float), (n_positions,))
+    elapsed = np.broadcast_to(np.asarray(T, dtype=float), (n_positions,))
+    coupons = np.asarray(coupons, dtype=float)
+
+    tau = (np.asarray(days, dtype=float) - elapsed[owner]) / 365
+    discount = (1 + rate[owner]) ** -tau
+    remaining_years = (np.asarray(term, dtype=float) - elapsed) / 365
+    forward_leg = np.asarray(forward_price_fixed_income_security, dtype=float) * (1 + rate) ** -remaining_years
+
+    present_value_coupons = np.bincount(owner, weights=coupons * discount, minlength=n_positions)
+    coupon_rate_slope = np.bincount(owner, weights=coupons * tau * discount / (1 + rate[owner]), minlength=n_positions)
+
+    return {
+        'value': np.asarray(spot_price, dtype=float) - present_value_coupons - forward_leg,
+        'delta': np.ones(n_positions),
+        'rho': coupon_rate_slope + remaining_years / (1 + rate) * forward_leg,
+        'coupon': -np.bincount(owner, weights=discount, minlength=n_positions),
+    }
+
+
+def fra_value_at_maturity_greeks(notional_principal, market_rate, contract_rate, T):
+    """
+    Closed-form sensitivities of fra_value_at_maturity,
+    Value = N * (m - c) * tau * exp(-m * tau) with tau = T / 360.
+
+    Parameters:
+    notional_principal (float or np.ndarray): The notional principal amounts of the FRAs.
+    market_rate (float or np.ndarray): The prevailing market interest rates at expiration.
+    contract_rate (float or np.ndarray): The interest rates agreed upon in the FRAs.
+    T (float or np.ndarray): The number of days from settlement to the end of the loan term.
+
+    Returns:
+    dict: Arrays 'value' and 'rho' (dV/dm).
+    """
+    tau = np.asarray(T, dtype=float) / 360
+    market_rate = np.asarray(market_rate, dtype=float)
+    spread = market_rate - np.asarray(contract_rate, dtype=float)
+    discounted_accrual = np.asarray(notional_principal, dtype=float) * tau * np.exp(-market_rate * tau)
+    return {
+        'value': discounted_accrual * spread,
+        'rho': discounted_accrual * (1 - spread * tau),
+    }
+
+
+def bump_and_reval(pricer, inputs, bumps, central=False):
+    """
+    Finite-difference sensitivities for any vectorized pricer, with every bump evaluated in a
+    single stacked call.
+
+    The inputs are stacked along a new leading axis: row 0 holds the base scenario and each
+    further row bumps one input (two rows per input for central differences). The pricer is
+    called once on the stacked arrays, so it must broadcast over that leading axis, as the
+    functions in Batch Forward Pricing.py and the *_greeks functions above do for positions
+    without schedules.
+
+    Parameters:
+    pricer (callable): Function taking the inputs as keyword arguments and returning an array of values.
+    inputs (dict): Base inputs by keyword, each a scalar or an array of length n_positions.
+    bumps (dict): Absolute bump size by keyword for each input to differentiate.
+    central (bool): Use central rather than forward differences.
+
+    Returns:
+    dict: 'base' holds the base values and each bumped keyword holds dValue/dInput per position.
+    """
+    names = list(bumps)
+    shifts = [1.0, -1.0] if central else [1.0]
+    n_rows = 1 + len(names) * len(shifts)
+
+    stacked = {}
+    for name, value in inputs.items():
+        value = np.asarray(value, dtype=float)
+        if name not in bumps:
+            # Unbumped inputs broadcast over the scenario axis without copying
+            stacked[name] = value[np.newaxis, ...]
+            continue
+        rows = np.repeat(value[np.newaxis, ...], n_rows, axis=0)
+        first_row = 1 + names.index(name) * len(shifts)
+        for k, shift in enumerate(shifts):
+            rows[first_row + k] += shift * bumps[name]
+        stacked[name] = rows
+
+    values = np.asarray(pricer(**stacked), dtype=float)
+    values = np.broadcast_to(values, (n_rows,) + values.shape[1:])
+
+    result = {'base': values[0]}
+    for i, name in enumerate(names):
+        first_row = 1 + i * len(shifts)
+        if central:
+            result[name] = (values[first_row] - values[first_row + 1]) / (2 * bumps[name])
+        else:
+            result[name] = (values[first_row] - values[0]) / bumps[name]
+    return result
+
+
+# Example usage
+if __name__ == "__main__":
+    # Analytic and bump-and-reval sensitivities of the continuous dividend forward from
+    # equity_forward_price_days for three positions
+    positions = {'S0': [1140, 1025, 980], 'r': [0.046, 0.046, 0.05], 'q': [0.021, 0.021, 0.03], 'T_days': [140, 45, 365]}
+    analytic = continuous_dividend_forward_greeks(**positions)
+    numerical = bump_and_reval(lambda **kw: continuous_dividend_forward_greeks(**kw)['forward_price'],
+                               positions, {'S0': 0.01, 'r': 1e-5, 'q': 1e-5}, central=True)
+    analytic['rho'], numerical['r']
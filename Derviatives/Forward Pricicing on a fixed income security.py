@@ -1,5 +1,10 @@
 def calculate_forward_price_fixed_income_security(spot_price, risk_free, term, coupon, days):
     
+    #risk_free is either a flat annualised rate or a DiscountCurve
+    if hasattr(risk_free, 'df'):
+        present_value_coupons = sum(coupon * risk_free.df(risk_free.year_fraction(days)))
+        return (spot_price - present_value_coupons) / risk_free.df(risk_free.year_fraction(term))
+
     present_value_coupons=0
     #calculate present value of coupon
     for coupon, days in zip(coupon,days):
@@ -15,5 +20,5 @@ def calculate_forward_price_fixed_income_security(spot_price, risk_free, term, c
 
 
 #Example usage
-calculate_forward_price_fixed_income_security(1050, 0.06, 250, [35],[182])
-        
+if __name__ == "__main__":
+    calculate_forward_price_fixed_income_security(1050, 0.06, 250, [35],[182])
@@ -5,7 +5,7 @@ def equity_forward_price_days(S0, r, q, T_days):
 
     Parameters:
     S0 (float): The current spot price of the equity.
-    r (float): The risk-free interest rate, continuously compounded.
+    r (float or DiscountCurve): The risk-free interest rate, continuously compounded, or a discount curve.
     q (float): The continuous dividend yield.
     T_days (int): The time to maturity of the contract in days.
 
@@ -23,12 +23,16 @@ def equity_forward_price_days(S0, r, q, T_days):
     # Convert days to years
     T_years = T_days / 365
 
+    if hasattr(r, 'df'):
+        return S0 * exp(-q * T_years) / r.df(r.year_fraction(T_days))
+
     # Calculate the forward price
     FP = S0 * exp((r - q) * T_years)
 
     return FP
 
 # Example usage of the function
-# Assume a spot price of $1140, risk-free rate of 4.6% (0.046), dividend yield of 2.1% (0.021), and a 140-day contract
-forward_price_days = equity_forward_price_days(1140, 0.046, 0.021, 140)
-forward_price_days
+if __name__ == "__main__":
+    # Assume a spot price of $1140, risk-free rate of 4.6% (0.046), dividend yield of 2.1% (0.021), and a 140-day contract
+    forward_price_days = equity_forward_price_days(1140, 0.046, 0.021, 140)
+    forward_price_days
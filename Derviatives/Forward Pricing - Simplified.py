@@ -2,12 +2,15 @@ def forward_pricing(spot_price, risk_free, term):
     """
     Function to calculate the forward price on an asset that costs nothing to store and makes not payments to its owner over the life of the forward contract. A zero-coupon bond meets these criteria.
     spot_price : current market price for the asset
-    risk_free : the annualised risk-free rate (i.e. the annualised return on a short-term government bond
+    risk_free : the annualised risk-free rate (i.e. the annualised return on a short-term government bond, or a DiscountCurve
     term: forward contract term in years
     """
+    if hasattr(risk_free, 'df'):
+        return spot_price / risk_free.df(term)
     forward_price = spot_price * (1 + risk_free)**term
     return forward_price
 
 
 #Example usage
-forward_pricing(500, 0.06, 0.25)
+if __name__ == "__main__":
+    forward_pricing(500, 0.06, 0.25)
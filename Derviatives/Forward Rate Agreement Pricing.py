@@ -1,4 +1,4 @@
-def fra_forward_rate(S_short, T_short, S_long, T_long):
+def fra_forward_rate(S_short, T_short, S_long, T_long, curve=None):
     """
     Calculate the no-arbitrage forward rate for a Forward Rate Agreement (FRA).
 
@@ -7,6 +7,8 @@ def fra_forward_rate(S_short, T_short, S_long, T_long):
     T_short (int): The total time in days for the shorter period.
     S_long (float): The longer period spot rate (e.g., 120-day LIBOR).
     T_long (int): The total time in days for the longer period.
+    curve (DiscountCurve, optional): If given, the spot rates are ignored and the growth
+        factors are read from the curve at its own year fractions of T_short and T_long.
 
     Returns:
     float: The calculated no-arbitrage forward rate for the FRA.
@@ -17,7 +19,10 @@ def fra_forward_rate(S_short, T_short, S_long, T_long):
     """
 
     # Calculate the forward rate
-    forward_rate = ((1 + S_long * T_long/360) / (1 + S_short * T_short/360)) - 1
+    if curve is not None:
+        forward_rate = curve.df(curve.year_fraction(T_short)) / curve.df(curve.year_fraction(T_long)) - 1
+    else:
+        forward_rate = ((1 + S_long * T_long/360) / (1 + S_short * T_short/360)) - 1
 
     # Annualizing the forward rate
     forward_rate_annualized = forward_rate * (360 / (T_long - T_short))
@@ -25,6 +30,7 @@ def fra_forward_rate(S_short, T_short, S_long, T_long):
     return forward_rate, forward_rate_annualized
 
 # Example usage of the function
-# Assume a 30-day LIBOR of 4% (0.04) and a 120-day LIBOR of 5% (0.05)
-fra_rate, fra_rate_annualized = fra_forward_rate(0.04, 30, 0.05, 120)
-fra_rate, fra_rate_annualized
+if __name__ == "__main__":
+    # Assume a 30-day LIBOR of 4% (0.04) and a 120-day LIBOR of 5% (0.05)
+    fra_rate, fra_rate_annualized = fra_forward_rate(0.04, 30, 0.05, 120)
+    fra_rate, fra_rate_annualized
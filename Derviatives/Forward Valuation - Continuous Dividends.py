@@ -4,7 +4,7 @@ def value_of_equity_index_forward(Spot_Index_Value, r, q, T_days, t_days, Forwar
 
     Parameters:
     Spot_Index_Value (float): The current value of the index.
-    r (float): The continuously compounded risk-free rate.
+    r (float or DiscountCurve): The continuously compounded risk-free rate, or a discount curve built as of today.
     q (float): The continuous dividend yield.
     T_days (int): The original time to maturity of the contract in days.
     t_days (int): The time elapsed since the initiation of the contract in days.
@@ -24,6 +24,8 @@ def value_of_equity_index_forward(Spot_Index_Value, r, q, T_days, t_days, Forwar
     T_years = T_days / 365
     t_years = t_days / 365
     
+    if hasattr(r, 'df'):
+        return Spot_Index_Value * exp(-q * (T_years - t_years)) - Forward_Price_Initiation * r.df(r.year_fraction(T_days - t_days))
 
     # Calculate the value of the forward contract
     value = (Spot_Index_Value / (exp((q) * (T_years - t_years)))) - (Forward_Price_Initiation / (exp((r) * (T_years - t_years))))
@@ -31,7 +33,8 @@ def value_of_equity_index_forward(Spot_Index_Value, r, q, T_days, t_days, Forwar
     return value
 
 # Example usage of the function
-# Assume an index value of 1025, risk-free rate of 4.6% (0.046), dividend yield of 2.1% (0.021), 
-# original contract duration of 140 days, 95 days elapsed, and an initial forward price of 1151
-value_of_contract = value_of_equity_index_forward(1025, 0.046, 0.021, 140, 95, 1151)
-value_of_contract
+if __name__ == "__main__":
+    # Assume an index value of 1025, risk-free rate of 4.6% (0.046), dividend yield of 2.1% (0.021), 
+    # original contract duration of 140 days, 95 days elapsed, and an initial forward price of 1151
+    value_of_contract = value_of_equity_index_forward(1025, 0.046, 0.021, 140, 95, 1151)
+    value_of_contract
@@ -1,12 +1,16 @@
 def forward_pricing_discrete_dividends(spot_price, risk_free, term, dividends, days):
     """
     Function to calculate the forward price on an asset that provides discrete dividends over the contract term. Equity stocks are an example of an asset that meets this criteria
-    risk_free : the annualised risk-free rate (i.e. the annualised return on a short-term government bond
+    risk_free : the annualised risk-free rate (i.e. the annualised return on a short-term government bond, or a DiscountCurve
     term: forward contract term in days
     dividends : series dividends to be paid in the future
     days = series of days representing the number of days from today´s date until each corresponding dividend will be paid
     """
-    
+    if hasattr(risk_free, 'df'):
+        # Discount all dividends with one vectorized curve lookup
+        present_value_dividends = sum(dividends * risk_free.df(risk_free.year_fraction(days)))
+        return (spot_price - present_value_dividends) / risk_free.df(risk_free.year_fraction(term))
+
     present_value_dividends = 0
     # Loop through each dividend and corresponding day
     for dividend, T in zip(dividends, days):
@@ -19,4 +23,5 @@ def forward_pricing_discrete_dividends(spot_price, risk_free, term, dividends, d
     return forward_price_discrete_dividends
 
 #Example usage
-forward_pricing_discrete_dividends(30, 0.05, 100, [0.4, 0.4], [15, 85])
+if __name__ == "__main__":
+    forward_pricing_discrete_dividends(30, 0.05, 100, [0.4, 0.4], [15, 85])
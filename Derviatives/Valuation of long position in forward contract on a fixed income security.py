@@ -1,5 +1,10 @@
 def value_forward_contract_fixed_income(spot_price, risk_free, term, coupon, days, forward_price_fixed_income_security, T):
     
+    #risk_free is either a flat annualised rate or a DiscountCurve built as of time T
+    if hasattr(risk_free, 'df'):
+        present_value_coupons = sum(coupon * risk_free.df(risk_free.year_fraction([d - T for d in days])))
+        return (spot_price - present_value_coupons) - forward_price_fixed_income_security * risk_free.df(risk_free.year_fraction(term - T))
+
     #Calculate present value of coupons at time T
     present_value_coupons =0
     for coupon, days in zip(coupon,days):
@@ -12,5 +17,5 @@ def value_forward_contract_fixed_income(spot_price, risk_free, term, coupon, day
     return value_forward_contract
 
 #Example usage
-value_forward_contract_fixed_income(1090, 0.06,250,[35],[182],1057.37,100)
-    
+if __name__ == "__main__":
+    value_forward_contract_fixed_income(1090, 0.06,250,[35],[182],1057.37,100)
@@ -23,6 +23,7 @@ def fra_value_at_maturity(notional_principal, market_rate, contract_rate, T):
     return value
 
 # Example usage of the function
-# Assume a notional principal of $1 million, market rate of 6% (0.06), contract rate of 5.32% (0.0532), and a loan term of 90 days
-fra_maturity_value = fra_value_at_maturity(1e6, 0.06, 0.0532, 90)
-fra_maturity_value
+if __name__ == "__main__":
+    # Assume a notional principal of $1 million, market rate of 6% (0.06), contract rate of 5.32% (0.0532), and a loan term of 90 days
+    fra_maturity_value = fra_value_at_maturity(1e6, 0.06, 0.0532, 90)
+    fra_maturity_value
@@ -30,16 +30,17 @@ def capm(risk_free, beta, market_return):
     return np.array([f"{x * 100:.2f}%" for x in ke])
 
 # Example usage
-try:
-    # For single asset calculation
-    ke_single = capm(0.04, 0.8, 0.079)
-    print(f"Single asset CAPM return: {ke_single[0]}")
-
-    # For multiple assets calculation
-    risk_free_rates = [0.03, 0.04, 0.05]
-    betas = [0.7, 0.8, 1.0]
-    market_returns = [0.07, 0.08, 0.09]
-    ke_multiple = capm(risk_free_rates, betas, market_returns)
-    print(f"Multiple assets CAPM returns: {ke_multiple}")
-except ValueError as e:
-    print(f"Error: {e}")
+if __name__ == "__main__":
+    try:
+        # For single asset calculation
+        ke_single = capm(0.04, 0.8, 0.079)
+        print(f"Single asset CAPM return: {ke_single[0]}")
+
+        # For multiple assets calculation
+        risk_free_rates = [0.03, 0.04, 0.05]
+        betas = [0.7, 0.8, 1.0]
+        market_returns = [0.07, 0.08, 0.09]
+        ke_multiple = capm(risk_free_rates, betas, market_returns)
+        print(f"Multiple assets CAPM returns: {ke_multiple}")
+    except ValueError as e:
+        print(f"Error: {e}")
@@ -42,23 +42,24 @@ def calculate_risk_premium_fama_french(risk_free, market_return, return_small, r
     return risk_premium
 
 # Example usage
-try:
-    # For single calculation
-    single_premium = calculate_risk_premium_fama_french(0.03, 0.1, 0.12, 0.08, 0.15, 0.07, 1.2, 0.5, 0.3)
-    print(f"Single calculation risk premium: {single_premium[0]}")
+if __name__ == "__main__":
+    try:
+        # For single calculation
+        single_premium = calculate_risk_premium_fama_french(0.03, 0.1, 0.12, 0.08, 0.15, 0.07, 1.2, 0.5, 0.3)
+        print(f"Single calculation risk premium: {single_premium[0]}")
 
-    # For batch calculation
-    risk_free_rates = [0.03, 0.04]
-    market_returns = [0.1, 0.11]
-    return_smalls = [0.12, 0.13]
-    return_bigs = [0.08, 0.09]
-    return_HBMs = [0.15, 0.16]
-    return_LBMs = [0.07, 0.08]
-    beta_mkts = [1.2, 1.3]
-    beta_SMBs = [0.5, 0.6]
-    beta_HMLs = [0.3, 0.4]
+        # For batch calculation
+        risk_free_rates = [0.03, 0.04]
+        market_returns = [0.1, 0.11]
+        return_smalls = [0.12, 0.13]
+        return_bigs = [0.08, 0.09]
+        return_HBMs = [0.15, 0.16]
+        return_LBMs = [0.07, 0.08]
+        beta_mkts = [1.2, 1.3]
+        beta_SMBs = [0.5, 0.6]
+        beta_HMLs = [0.3, 0.4]
 
-    batch_premiums = calculate_risk_premium_fama_french(risk_free_rates, market_returns, return_smalls, return_bigs, return_HBMs, return_LBMs, beta_mkts, beta_SMBs, beta_HMLs)
-    print(f"Batch calculation risk premiums: {batch_premiums}")
-except ValueError as e:
-    print(f"Error: {e}")
+        batch_premiums = calculate_risk_premium_fama_french(risk_free_rates, market_returns, return_smalls, return_bigs, return_HBMs, return_LBMs, beta_mkts, beta_SMBs, beta_HMLs)
+        print(f"Batch calculation risk premiums: {batch_premiums}")
+    except ValueError as e:
+        print(f"Error: {e}")
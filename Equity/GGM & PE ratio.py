@@ -67,5 +67,5 @@ def ggm_fundamentalvalue_and_justified_price_earnings_ratio(d0,g,r,earnings):
     return price_to_earnings(v0, earnings, g)
 
 # Example usage
-ggm_fundamentalvalue_and_justified_price_earnings_ratio(1.5,0.035,0.106,3)
-
+if __name__ == "__main__":
+    ggm_fundamentalvalue_and_justified_price_earnings_ratio(1.5,0.035,0.106,3)
@@ -28,8 +28,9 @@ def calculate_HPR(initial_price, ending_price, cash_flows):
     return HPR
 
 # Example usage
-try:
-    hpr_percentage = calculate_HPR(100, 200, [50, 25])  # Multiple cash flows can be passed as a list
-    print(f"Holding period return for the asset is {hpr_percentage:.2f}%")
-except ValueError as e:
-    print(f"Error: {e}")
+if __name__ == "__main__":
+    try:
+        hpr_percentage = calculate_HPR(100, 200, [50, 25])  # Multiple cash flows can be passed as a list
+        print(f"Holding period return for the asset is {hpr_percentage:.2f}%")
+    except ValueError as e:
+        print(f"Error: {e}")
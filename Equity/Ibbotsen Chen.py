@@ -34,19 +34,20 @@ def calculate_risk_premium_ibbotson_chen(inflation_expected, real_growth_EPS_exp
     return risk_premium
 
 # Example usage
-try:
-    # For single calculation
-    single_premium = calculate_risk_premium_ibbotson_chen(0.05, 0.07, -0.04, 0.08, 0.04)
-    print(f"Single calculation risk premium: {single_premium[0]}")
-
-    # For batch calculation
-    inflation_rates = [0.03, 0.04, 0.05]
-    growth_rates = [0.06, 0.07, 0.08]
-    pe_changes = [-0.02, 0.00, 0.02]
-    index_yields = [0.07, 0.08, 0.09]
-    risk_free_rates = [0.03, 0.035, 0.04]
-
-    batch_premiums = calculate_risk_premium_ibbotson_chen(inflation_rates, growth_rates, pe_changes, index_yields, risk_free_rates)
-    print(f"Batch calculation risk premiums: {batch_premiums}")
-except ValueError as e:
-    print(f"Error: {e}")
+if __name__ == "__main__":
+    try:
+        # For single calculation
+        single_premium = calculate_risk_premium_ibbotson_chen(0.05, 0.07, -0.04, 0.08, 0.04)
+        print(f"Single calculation risk premium: {single_premium[0]}")
+
+        # For batch calculation
+        inflation_rates = [0.03, 0.04, 0.05]
+        growth_rates = [0.06, 0.07, 0.08]
+        pe_changes = [-0.02, 0.00, 0.02]
+        index_yields = [0.07, 0.08, 0.09]
+        risk_free_rates = [0.03, 0.035, 0.04]
+
+        batch_premiums = calculate_risk_premium_ibbotson_chen(inflation_rates, growth_rates, pe_changes, index_yields, risk_free_rates)
+        print(f"Batch calculation risk premiums: {batch_premiums}")
+    except ValueError as e:
+        print(f"Error: {e}")
@@ -1,5 +1,16 @@
+import os
+import sys
+import time
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+# Shared helpers live in the common package at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from common.jobs import as_bool, load_jobs, write_results
+from common.options import black_scholes_price
+from common.plotting import new_figure, show_or_save
 
 def generate_binomial_tree(initial_value, up_factor, down_factor, steps):
     """
@@ -10,11 +21,25 @@ def generate_binomial_tree(initial_value, up_factor, down_factor, steps):
     :param steps: Number of steps in the tree.
     :return: A NumPy array representing the binomial tree.
     """
-    tree = np.zeros((steps + 1, steps + 1))
-    for i in range(steps + 1):
-        for j in range(i + 1):
-            tree[j, i] = initial_value * (up_factor ** (i - j)) * (down_factor ** j)
-    return tree
+    # Node (j, i) holds initial_value * u**(i - j) * d**j for j <= i; built by broadcasting
+    # a column of down-move counts against a row of time steps.
+    i = np.arange(steps + 1)[np.newaxis, :]
+    j = np.arange(steps + 1)[:, np.newaxis]
+    up_moves = np.maximum(i - j, 0)
+    tree = initial_value * np.power(float(up_factor), up_moves) * np.power(float(down_factor), j)
+    return np.triu(tree)
+
+def tree_slice(initial_value, up_factor, down_factor, step):
+    """
+    Node values of a binomial tree at a single time step.
+    :param initial_value: The initial value at the root of the tree.
+    :param up_factor: The factor by which the value increases.
+    :param down_factor: The factor by which the value decreases.
+    :param step: The time step (column of the tree) to return.
+    :return: A NumPy array of length step + 1, ordered from the highest node to the lowest.
+    """
+    j = np.arange(step + 1)
+    return initial_value * np.power(float(up_factor), step - j) * np.power(float(down_factor), j)
 
 def value_fixed_income_instrument(face_value, coupon_rate, maturity, interest_rate_tree):
     """
@@ -50,82 +75,640 @@ def value_option(S0, strike_price, u, d, r, steps, option_type='call', american=
     :param american: Boolean indicating if the option is American.
     :return: The value of the option.
     """
+    return float(value_options_batch(S0, [strike_price], u, d, r, steps, option_type, american)[0])
+
+def value_options_batch(S0, strike_prices, u, d, r, steps, option_type='call', american=False, maturities=None,
+                        terminal_values=None):
+    """
+    Value a batch of options written on the same underlying with a single shared binomial tree.
+    Backward induction runs one time slice at a time as a vector operation over every option
+    in the batch, so memory is O(len(strike_prices) * steps) rather than a full square tree.
+    :param S0: Initial asset price.
+    :param strike_prices: Strike prices of the options.
+    :param u: Up factor for asset price.
+    :param d: Down factor for asset price.
+    :param r: Risk-free interest rate per step.
+    :param steps: Number of steps in the shared binomial tree.
+    :param option_type: Type of the options ('call' or 'put'), or an array with one entry per option.
+    :param american: Boolean, or boolean array, indicating if the options are American.
+    :param maturities: Optional maturities in time steps, one per option (defaults to steps).
+    :param terminal_values: Optional function of the asset prices at a slice returning an (options x nodes)
+        array used in place of the payoff at each option's final slice.
+    :return: A NumPy array with the value of each option.
+    """
+    strikes = np.atleast_1d(np.asarray(strike_prices, dtype=float))
+    n_options = strikes.shape[0]
+    if maturities is None:
+        maturities = np.full(n_options, steps, dtype=int)
+    maturities = np.broadcast_to(np.asarray(maturities, dtype=int), (n_options,))
+    if np.any(maturities > steps) or np.any(maturities < 0):
+        raise ValueError("Maturities must lie between 0 and the number of time steps in the tree.")
+    # +1 for calls, -1 for puts, so the payoff is max(sign * (S - K), 0) for both
+    sign = np.where(np.broadcast_to(np.asarray(option_type), (n_options,)) == 'call', 1.0, -1.0)
+    american = np.broadcast_to(np.asarray(american, dtype=bool), (n_options,))
+
     p = (np.exp(r) - d) / (u - d)  # Risk-neutral probability
-    asset_tree = generate_binomial_tree(S0, u, d, steps)
-    option_tree = np.zeros_like(asset_tree)
+    discount = np.exp(-r)
+    values = np.zeros((n_options, steps + 1))
 
-    # Calculate option value at final nodes
-    if option_type == 'call':
-        option_tree[:, -1] = np.maximum(asset_tree[:, -1] - strike_price, 0)
-    else:
-        option_tree[:, -1] = np.maximum(strike_price - asset_tree[:, -1], 0)
+    for t in range(steps, -1, -1):
+        asset_prices = tree_slice(S0, u, d, t)
+        exercise = np.maximum(sign[:, np.newaxis] * (asset_prices - strikes[:, np.newaxis]), 0)
+
+        # Roll back options that expire after this slice
+        rolling = maturities > t
+        if rolling.any():
+            continuation = discount * (p * values[rolling, :t + 1] + (1 - p) * values[rolling, 1:t + 2])
+            early = american[rolling][:, np.newaxis]
+            values[rolling, :t + 1] = np.where(early, np.maximum(continuation, exercise[rolling]), continuation)
+
+        # Options expiring at this slice start from their payoff
+        expiring = maturities == t
+        if expiring.any():
+            start = exercise if terminal_values is None else terminal_values(asset_prices)
+            values[expiring, :t + 1] = start[expiring]
+
+    return values[:, 0]
+
+def _peizer_pratt(z, steps):
+    """
+    Peizer-Pratt method 2 inversion used by the Leisen-Reimer tree.
+    """
+    return 0.5 + np.sign(z) * 0.5 * np.sqrt(1 - np.exp(-(z / (steps + 1 / 3 + 0.1 / (steps + 1))) ** 2 * (steps + 1 / 6)))
 
-    # Backward induction for option value
-    for j in range(steps - 1, -1, -1):
-        for i in range(j + 1):
-            option_value = np.exp(-r) * (p * option_tree[i, j + 1] + (1 - p) * option_tree[i + 1, j + 1])
+def tree_parameters(S0, strike_price, sigma, r, T, steps, method='crr'):
+    """
+    Up and down factors of a binomial tree parameterisation.
+    :param S0: Initial asset price.
+    :param strike_price: Strike price of the option (used by Leisen-Reimer).
+    :param sigma: Annualised volatility.
+    :param r: Continuously compounded risk-free rate.
+    :param T: Time to expiry in years.
+    :param steps: Number of steps; Leisen-Reimer rounds it up to the next odd number.
+    :param method: 'crr' (Cox-Ross-Rubinstein), 'tian', 'leisen_reimer' or 'bbs' (CRR factors, smoothed
+        with Black-Scholes at the penultimate step by value_option_tree).
+    :return: A tuple (u, d, steps).
+    """
+    if method == 'leisen_reimer' and steps % 2 == 0:
+        steps += 1
+    dt = T / steps
+    growth = np.exp(r * dt)
+    if method in ('crr', 'bbs'):
+        u = np.exp(sigma * np.sqrt(dt))
+        return u, 1 / u, steps
+    if method == 'tian':
+        v = np.exp(sigma ** 2 * dt)
+        root = np.sqrt(v ** 2 + 2 * v - 3)
+        return 0.5 * growth * v * (v + 1 + root), 0.5 * growth * v * (v + 1 - root), steps
+    if method == 'leisen_reimer':
+        d1 = (np.log(S0 / strike_price) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
+        d2 = d1 - sigma * np.sqrt(T)
+        p = _peizer_pratt(d2, steps)
+        u = growth * _peizer_pratt(d1, steps) / p
+        return u, (growth - p * u) / (1 - p), steps
+    raise ValueError("method must be 'crr', 'tian', 'leisen_reimer' or 'bbs'.")
+
+# Parameterisations whose prices converge smoothly in the number of steps, so that Richardson
+# extrapolation removes their leading error term; CRR and Tian oscillate between odd and even steps
+RICHARDSON_METHODS = ('leisen_reimer', 'bbs')
+
+def value_option_tree(S0, strike_price, sigma, r, T, steps, option_type='call', american=False, method='crr',
+                      richardson=False):
+    """
+    Value an option on a binomial tree with a selectable parameterisation and optional
+    two-point Richardson extrapolation.
+    Leisen-Reimer converges at second order without the odd-even oscillation of CRR; the
+    smoothed 'bbs' tree replaces the last step with Black-Scholes values and converges smoothly
+    at first order. Richardson extrapolation, only available for these two, combines the prices
+    for steps and about steps / 2, weighted by the step counts actually used, to cancel the
+    leading error term (second order for European Leisen-Reimer, first order otherwise).
+    :param S0: Initial asset price.
+    :param strike_price: Strike price of the option.
+    :param sigma: Annualised volatility.
+    :param r: Continuously compounded risk-free rate.
+    :param T: Time to expiry in years.
+    :param steps: Number of steps in the binomial model.
+    :param option_type: Type of the option ('call' or 'put').
+    :param american: Boolean indicating if the option is American.
+    :param method: 'crr', 'tian', 'leisen_reimer' or 'bbs'.
+    :param richardson: Boolean indicating whether to apply Richardson extrapolation.
+    :return: The value of the option.
+    """
+    def price(n):
+        u, d, n = tree_parameters(S0, strike_price, sigma, r, T, n, method)
+        dt = T / n
+        if method != 'bbs':
+            return float(value_options_batch(S0, [strike_price], u, d, r * dt, n, option_type, american)[0]), n
+
+        def smoothed(asset_prices):
+            values = black_scholes_price(asset_prices, strike_price, r, sigma, dt, option_type)
             if american:
-                if option_type == 'call':
-                    option_tree[i, j] = max(option_value, asset_tree[i, j] - strike_price)
-                else:
-                    option_tree[i, j] = max(option_value, strike_price - asset_tree[i, j])
-            else:
-                option_tree[i, j] = option_value
+                sign = 1.0 if option_type == 'call' else -1.0
+                values = np.maximum(values, sign * (asset_prices - strike_price))
+            return values[np.newaxis, :]
+
+        return float(value_options_batch(S0, [strike_price], u, d, r * dt, n - 1, option_type, american,
+                                         terminal_values=smoothed)[0]), n
+
+    if not richardson:
+        return price(steps)[0]
+    if method not in RICHARDSON_METHODS:
+        raise ValueError(f"Richardson extrapolation needs smooth convergence; use one of {RICHARDSON_METHODS}.")
+    # Early exercise reduces Leisen-Reimer to first order convergence for American options
+    order = 2 if method == 'leisen_reimer' and not american else 1
+    (fine, fine_steps), (coarse, coarse_steps) = price(steps), price(steps // 2)
+    # With error ~ c / n ** order, weight the two prices so that the c terms cancel
+    fine_weight, coarse_weight = float(fine_steps) ** order, float(coarse_steps) ** order
+    return (fine_weight * fine - coarse_weight * coarse) / (fine_weight - coarse_weight)
+
+def convergence_benchmark(S0, strike_price, sigma, r, T, option_type='put', american=True,
+                          step_grid=(50, 100, 200, 500, 1000, 2000), reference_steps=20001):
+    """
+    Error and run time of every tree parameterisation, and of Richardson extrapolation for the
+    ones that support it, against a reference price from a very fine Leisen-Reimer tree.
+    :param step_grid: Numbers of steps to benchmark.
+    :param reference_steps: Number of steps of the reference tree.
+    :return: A list of dicts with method, richardson, steps, price, error and seconds.
+    """
+    reference = value_option_tree(S0, strike_price, sigma, r, T, reference_steps, option_type, american, 'leisen_reimer')
+    rows = []
+    for method in ('crr', 'tian', 'leisen_reimer', 'bbs'):
+        for richardson in (False, True) if method in RICHARDSON_METHODS else (False,):
+            for steps in step_grid:
+                start = time.perf_counter()
+                price = value_option_tree(S0, strike_price, sigma, r, T, steps, option_type, american, method, richardson)
+                rows.append({'method': method, 'richardson': richardson, 'steps': steps, 'price': price,
+                             'error': abs(price - reference), 'seconds': time.perf_counter() - start})
+    return rows
+
+class ShortRateLattice:
+    """
+    A recombining short-rate lattice calibrated to a discount curve.
+    Each time slice i stores the node short rates, the one-step discount factor at every node,
+    the indices of each node's children in slice i + 1 and the branch probabilities, so binomial
+    (Black-Derman-Toy) and trinomial (Hull-White) trees share one backward induction.
+    :param dt: Length of a time step in years.
+    :param rates: List of arrays with the short rate at each node of every slice.
+    :param discount: List of arrays with the one-step discount factor at each node.
+    :param children: List of integer arrays (nodes x branches) indexing into the next slice.
+    :param probabilities: List of arrays (nodes x branches) of branch probabilities.
+    :param arrow_debreu: List of arrays with the Arrow-Debreu price of each node.
+    :param compounding: 'simple' or 'continuous', how a node rate becomes its discount factor.
+    """
+    def __init__(self, dt, rates, discount, children, probabilities, arrow_debreu, compounding='simple'):
+        self.dt = dt
+        self.compounding = compounding
+        self.rates = rates
+        self.discount = discount
+        self.children = children
+        self.probabilities = probabilities
+        self.arrow_debreu = arrow_debreu
+        # Branches whose children are consecutive nodes are read with a slice instead of a gather
+        self._branch_slices = [
+            [slice(c[0], c[0] + len(c)) if np.array_equal(c, c[0] + np.arange(len(c))) else None for c in step_children.T]
+            for step_children in children
+        ]
+
+    @property
+    def steps(self):
+        return len(self.rates)
+
+    def rollback(self, values, step, spread=None):
+        """
+        Discounted expectation of next-slice values at every node of a slice.
+        :param values: Array (..., nodes in slice step + 1) of values; leading axes index instruments.
+        :param step: The slice to roll back to.
+        :param spread: Optional spread added to every node rate, one per instrument (shape (..., 1)).
+        :return: Array (..., nodes in slice step) of values.
+        """
+        expected = 0
+        for k, branch in enumerate(self._branch_slices[step]):
+            child_values = values[..., branch] if branch is not None else values[..., self.children[step][:, k]]
+            expected = expected + self.probabilities[step][:, k] * child_values
+        if spread is None:
+            return expected * self.discount[step]
+        shifted_rates = self.rates[step] + spread
+        if self.compounding == 'simple':
+            return expected / (1 + shifted_rates * self.dt)
+        return expected * np.exp(-shifted_rates * self.dt)
+
+    def zero_coupon_prices(self):
+        """
+        Zero-coupon bond prices implied by the lattice for maturities dt, 2 dt, ..., steps * dt.
+        :return: A NumPy array of discount factors, which match the calibration curve.
+        """
+        return np.array([np.sum(q * df) for q, df in zip(self.arrow_debreu, self.discount)])
+
+def _forward_induction(arrow_debreu, discount, children, probabilities, next_size):
+    """
+    Arrow-Debreu prices of the next slice from those of the current slice.
+    :return: A NumPy array with one price per node of the next slice.
+    """
+    contributions = (arrow_debreu * discount)[:, np.newaxis] * probabilities
+    return np.bincount(children.ravel(), weights=contributions.ravel(), minlength=next_size)
+
+def build_bdt_lattice(curve, steps, dt, sigma):
+    """
+    Calibrate a Black-Derman-Toy binomial short-rate lattice to a discount curve.
+    Rates at slice i are r(i, j) = a(i) * exp(sigma * sqrt(dt) * (i - 2j)) for j down moves,
+    discounted with simple interest over each step as in value_fixed_income_instrument. Each a(i)
+    is found by Newton iterations vectorized over the slice so the lattice reprices the curve's
+    zero-coupon bonds, and Arrow-Debreu prices are carried forward one slice at a time.
+    :param curve: Object with a df(t) method returning discount factors for times in years.
+    :param steps: Number of time steps in the lattice.
+    :param dt: Length of a time step in years.
+    :param sigma: Annualised volatility of the log short rate.
+    :return: A ShortRateLattice.
+    """
+    zero_prices = np.asarray(curve.df(dt * np.arange(1, steps + 1)), dtype=float)
+    rates, discount, children, probabilities, arrow_debreu = [], [], [], [], []
+    q = np.ones(1)
+    a = -np.log(zero_prices[0]) / dt  # Initial guess: the first zero rate
+
+    for i in range(steps):
+        j = np.arange(i + 1)
+        spread = np.exp(sigma * np.sqrt(dt) * (i - 2 * j))
+        for _ in range(50):
+            df = 1 / (1 + a * spread * dt)
+            error = np.sum(q * df) - zero_prices[i]
+            slope = -np.sum(q * spread * dt * df ** 2)
+            step_size = error / slope
+            a -= step_size
+            if abs(step_size) < 1e-14:
+                break
+        node_rates = a * spread
+        node_discount = 1 / (1 + node_rates * dt)
+        node_children = np.column_stack((j, j + 1))
+        node_probabilities = np.full((i + 1, 2), 0.5)
+
+        rates.append(node_rates)
+        discount.append(node_discount)
+        children.append(node_children)
+        probabilities.append(node_probabilities)
+        arrow_debreu.append(q)
+        q = _forward_induction(q, node_discount, node_children, node_probabilities, i + 2)
 
-    return option_tree[0, 0]
+    return ShortRateLattice(dt, rates, discount, children, probabilities, arrow_debreu)
 
-def plot_tree(tree, valuation_tree=None):
+def build_hull_white_lattice(curve, steps, dt, sigma, mean_reversion):
     """
-    Plot a binomial tree.
+    Calibrate a Hull-White trinomial short-rate lattice to a discount curve.
+    Nodes sit at r(i, j) = alpha(i) + j * dx with dx = sigma * sqrt(3 dt), using the standard
+    branching that switches at |j| = jmax to keep probabilities positive and continuous
+    discounting over each step. alpha(i) has a closed form given the Arrow-Debreu prices, so
+    calibration needs no root finding.
+    :param curve: Object with a df(t) method returning discount factors for times in years.
+    :param steps: Number of time steps in the lattice.
+    :param dt: Length of a time step in years.
+    :param sigma: Annualised normal volatility of the short rate.
+    :param mean_reversion: Mean reversion speed a (must be positive).
+    :return: A ShortRateLattice.
+    """
+    zero_prices = np.asarray(curve.df(dt * np.arange(1, steps + 1)), dtype=float)
+    dx = sigma * np.sqrt(3 * dt)
+    M = -mean_reversion * dt
+    jmax = int(np.ceil(0.184 / (mean_reversion * dt)))
+
+    # Branching for every level j in [-jmax, jmax]: child offsets and probabilities
+    levels = np.arange(-jmax, jmax + 1)
+    jM = levels * M
+    j2M2 = jM ** 2
+    offsets = np.tile([1, 0, -1], (levels.size, 1))
+    branch_probabilities = np.column_stack((1 / 6 + (j2M2 + jM) / 2, 2 / 3 - j2M2, 1 / 6 + (j2M2 - jM) / 2))
+    top, bottom = -1, 0
+    offsets[top] = [0, -1, -2]
+    branch_probabilities[top] = [7 / 6 + (j2M2[top] + 3 * jM[top]) / 2, -1 / 3 - j2M2[top] - 2 * jM[top],
+                                 1 / 6 + (j2M2[top] + jM[top]) / 2]
+    offsets[bottom] = [2, 1, 0]
+    branch_probabilities[bottom] = [1 / 6 + (j2M2[bottom] - jM[bottom]) / 2, -1 / 3 - j2M2[bottom] + 2 * jM[bottom],
+                                    7 / 6 + (j2M2[bottom] - 3 * jM[bottom]) / 2]
+
+    rates, discount, children, probabilities, arrow_debreu = [], [], [], [], []
+    q = np.ones(1)
+    for i in range(steps):
+        width = min(i, jmax)
+        next_width = min(i + 1, jmax)
+        j = np.arange(-width, width + 1)
+        alpha = (np.log(np.sum(q * np.exp(-j * dx * dt))) - np.log(zero_prices[i])) / dt
+        node_rates = alpha + j * dx
+        node_discount = np.exp(-node_rates * dt)
+        # Non-standard branching only applies at |j| = jmax, which a slice reaches once it is jmax wide
+        level_index = j + jmax
+        node_children = j[:, np.newaxis] + offsets[level_index] + next_width
+        node_probabilities = branch_probabilities[level_index]
+
+        rates.append(node_rates)
+        discount.append(node_discount)
+        children.append(node_children)
+        probabilities.append(node_probabilities)
+        arrow_debreu.append(q)
+        q = _forward_induction(q, node_discount, node_children, node_probabilities, 2 * next_width + 1)
+
+    return ShortRateLattice(dt, rates, discount, children, probabilities, arrow_debreu, compounding='continuous')
+
+_lattice_cache = {}
+
+def short_rate_lattice(curve, steps, dt, model='bdt', sigma=0.2, mean_reversion=0.1, curve_date=None):
+    """
+    Build a calibrated short-rate lattice, reusing a cached one for the same curve date and parameters.
+    :param curve: Object with a df(t) method returning discount factors for times in years.
+    :param steps: Number of time steps in the lattice.
+    :param dt: Length of a time step in years.
+    :param model: 'bdt' for Black-Derman-Toy or 'hull_white' for the Hull-White trinomial tree.
+    :param sigma: Volatility (lognormal for BDT, normal for Hull-White).
+    :param mean_reversion: Mean reversion speed, used by Hull-White only.
+    :param curve_date: Key identifying the curve, e.g. its valuation date. Lattices are only cached when given.
+    :return: A ShortRateLattice.
+    """
+    key = (curve_date, model, steps, dt, sigma, mean_reversion if model == 'hull_white' else None)
+    if curve_date is not None and key in _lattice_cache:
+        return _lattice_cache[key]
+    if model == 'bdt':
+        lattice = build_bdt_lattice(curve, steps, dt, sigma)
+    elif model == 'hull_white':
+        lattice = build_hull_white_lattice(curve, steps, dt, sigma, mean_reversion)
+    else:
+        raise ValueError("Model must be either 'bdt' or 'hull_white'.")
+    if curve_date is not None:
+        _lattice_cache[key] = lattice
+    return lattice
+
+def exercise_schedule(schedules, n_bonds, steps):
+    """
+    Convert per-bond exercise schedules into the array form used by value_bonds_on_lattice.
+    :param schedules: List with one dict per bond mapping time step to exercise price, or None for no option.
+    :param n_bonds: Number of bonds.
+    :param steps: Number of time steps in the lattice.
+    :return: A NumPy array (n_bonds x steps + 1) of exercise prices, NaN where the option cannot be exercised.
+    """
+    prices = np.full((n_bonds, steps + 1), np.nan)
+    for bond, schedule in enumerate(schedules):
+        for step, price in (schedule or {}).items():
+            prices[bond, step] = price
+    return prices
+
+def value_bonds_on_lattice(lattice, face_values, coupon_rates, maturities, call_prices=None, put_prices=None, spreads=None):
+    """
+    Value a batch of coupon bonds, optionally with embedded call and put options, on one
+    calibrated short-rate lattice.
+    Coupons of face_value * coupon_rate * dt are paid at every step up to maturity, and all
+    bonds are rolled back together one slice at a time. At each exercise date the issuer calls
+    when the continuation value exceeds the call price and the holder puts when it falls below
+    the put price; both compare ex-coupon values.
+    :param lattice: A ShortRateLattice.
+    :param face_values: Face values of the bonds.
+    :param coupon_rates: Annual coupon rates of the bonds.
+    :param maturities: Maturities of the bonds in time steps.
+    :param call_prices: Optional array (bonds x steps + 1) of call prices, NaN where not callable (see exercise_schedule).
+    :param put_prices: Optional array (bonds x steps + 1) of put prices, NaN where not putable.
+    :param spreads: Optional spread over the lattice short rates for each bond, e.g. an option-adjusted spread.
+    :return: A NumPy array with the value of each bond today.
+    """
+    face_values = np.atleast_1d(np.asarray(face_values, dtype=float))
+    n_bonds = face_values.shape[0]
+    coupons = face_values * np.broadcast_to(np.asarray(coupon_rates, dtype=float), (n_bonds,)) * lattice.dt
+    maturities = np.broadcast_to(np.asarray(maturities, dtype=int), (n_bonds,))
+    if np.any(maturities > lattice.steps) or np.any(maturities < 1):
+        raise ValueError("Maturities must lie between 1 and the number of time steps in the lattice.")
+    if spreads is not None:
+        spreads = np.broadcast_to(np.asarray(spreads, dtype=float), (n_bonds,))
+
+    # Sort by maturity, longest first, so the bonds still alive at any slice are a leading block
+    order = np.argsort(-maturities, kind='stable')
+    face_values, coupons, maturities = face_values[order], coupons[order], maturities[order]
+    if call_prices is not None:
+        call_prices = call_prices[order]
+    if put_prices is not None:
+        put_prices = put_prices[order]
+    if spreads is not None:
+        spreads = spreads[order, np.newaxis]
+
+    # values only holds the rows of bonds alive at the current slice
+    last = maturities[0]
+    values = np.zeros((0, lattice.children[last - 1].max() + 1))
+    for t in range(last, 0, -1):
+        alive = np.searchsorted(-maturities, -t, side='right')
+        matured = np.searchsorted(-maturities, -t, side='left')
+        if alive > values.shape[0]:
+            values = np.vstack((values, np.zeros((alive - values.shape[0], values.shape[1]))))
+        # Bonds maturing at this slice start from their final cash flow
+        values[matured:] = (face_values + coupons)[matured:alive, np.newaxis]
+        live = values[:matured]
+        if put_prices is not None:
+            live[:] = np.fmax(live, put_prices[:matured, t, np.newaxis])
+        if call_prices is not None:
+            live[:] = np.fmin(live, call_prices[:matured, t, np.newaxis])
+        live += coupons[:matured, np.newaxis]
+        values = lattice.rollback(values, t - 1, None if spreads is None else spreads[:alive])
+
+    result = np.empty(n_bonds)
+    result[order] = values[:, 0]
+    return result
+
+def solve_oas(lattice, market_prices, face_values, coupon_rates, maturities, call_prices=None, put_prices=None,
+              tolerance=1e-10, max_iterations=50):
+    """
+    Solve the option-adjusted spread of every bond so its lattice value matches its market price.
+    Secant iterations run on all bonds at once, each iteration being a single backward pass over
+    the same lattice, and bonds drop out of the update once converged.
+    :param lattice: A ShortRateLattice.
+    :param market_prices: Market prices of the bonds.
+    :param face_values: Face values of the bonds.
+    :param coupon_rates: Annual coupon rates of the bonds.
+    :param maturities: Maturities of the bonds in time steps.
+    :param call_prices: Optional array of call prices (see value_bonds_on_lattice).
+    :param put_prices: Optional array of put prices (see value_bonds_on_lattice).
+    :param tolerance: Convergence tolerance on the pricing error.
+    :param max_iterations: Maximum number of secant iterations.
+    :return: A NumPy array with the option-adjusted spread of each bond (NaN if it did not converge).
+    """
+    market_prices = np.atleast_1d(np.asarray(market_prices, dtype=float))
+    n_bonds = market_prices.shape[0]
+
+    def pricing_error(spreads):
+        return value_bonds_on_lattice(lattice, face_values, coupon_rates, maturities,
+                                      call_prices, put_prices, spreads) - market_prices
+
+    previous_spread, spread = np.zeros(n_bonds), np.full(n_bonds, 0.01)
+    previous_error, error = pricing_error(previous_spread), pricing_error(spread)
+    # Bonds already priced at a zero spread keep it, along with its error
+    converged = np.abs(previous_error) < tolerance
+    spread[converged] = previous_spread[converged]
+    error[converged] = previous_error[converged]
+    for _ in range(max_iterations):
+        converged |= np.abs(error) < tolerance
+        if converged.all():
+            break
+        slope = (error - previous_error) / np.where(converged, 1.0, spread - previous_spread)
+        step = np.where(converged | (slope == 0), 0.0, error / np.where(slope == 0, 1.0, slope))
+        previous_spread, previous_error = spread, error
+        spread = spread - step
+        error = np.where(converged, error, pricing_error(spread))
+    converged |= np.abs(error) < tolerance
+    return np.where(converged, spread, np.nan)
+
+def effective_duration_convexity(lattice, face_values, coupon_rates, maturities, call_prices=None, put_prices=None,
+                                 spreads=0.0, shift=0.0001):
+    """
+    Effective duration and convexity of a batch of bonds from parallel shifts of the lattice rates.
+    The base, up-shifted and down-shifted scenarios are priced together in one backward pass on
+    the same lattice by stacking them as extra instruments with shifted spreads.
+    :param lattice: A ShortRateLattice.
+    :param face_values: Face values of the bonds.
+    :param coupon_rates: Annual coupon rates of the bonds.
+    :param maturities: Maturities of the bonds in time steps.
+    :param call_prices: Optional array of call prices (see value_bonds_on_lattice).
+    :param put_prices: Optional array of put prices (see value_bonds_on_lattice).
+    :param spreads: Spread of each bond over the lattice, e.g. its option-adjusted spread.
+    :param shift: Size of the parallel rate shift.
+    :return: A tuple (values, effective_durations, effective_convexities) of NumPy arrays.
+    """
+    face_values = np.atleast_1d(np.asarray(face_values, dtype=float))
+    n_bonds = face_values.shape[0]
+
+    def stack(array):
+        return None if array is None else np.concatenate([np.broadcast_to(array, (n_bonds,) + np.shape(array)[1:])] * 3)
+
+    spreads = np.broadcast_to(np.asarray(spreads, dtype=float), (n_bonds,))
+    values = value_bonds_on_lattice(lattice, stack(face_values), stack(np.asarray(coupon_rates, dtype=float)),
+                                    stack(np.asarray(maturities, dtype=int)), stack(call_prices), stack(put_prices),
+                                    np.concatenate((spreads, spreads - shift, spreads + shift)))
+    base, down, up = values[:n_bonds], values[n_bonds:2 * n_bonds], values[2 * n_bonds:]
+    duration = (down - up) / (2 * base * shift)
+    convexity = (down + up - 2 * base) / (base * shift ** 2)
+    return base, duration, convexity
+
+def plot_tree(tree, valuation_tree=None, output=None, max_labels=500, max_edges=200000):
+    """
+    Plot a binomial tree. All nodes are drawn by one scatter call and all branches as one
+    LineCollection, so the number of artists does not grow with the number of steps.
     :param tree: A NumPy array representing the binomial tree to plot.
     :param valuation_tree: An optional NumPy array representing a secondary valuation tree.
+    :param output: Path of a PNG file to write instead of showing the plot. The figure is then
+        rendered with Agg alone, without pyplot or a display.
+    :param max_labels: Valuation labels are only drawn for trees with at most this many nodes.
+    :param max_edges: Branches are only drawn for trees with at most this many branches.
     """
+    from matplotlib.collections import LineCollection
+
     steps = tree.shape[1] - 1
-    plt.figure(figsize=(10, 6))
-    plt.title("Binomial Tree Visualization")
-    for i in range(steps + 1):
-        for j in range(i + 1):
-            plt.scatter(i, tree[j, i], color='blue')
-            if valuation_tree is not None:
-                plt.text(i, tree[j, i], f"{valuation_tree[j, i]:.2f}", color='red')
-            if i < steps:
-                plt.plot([i, i + 1], [tree[j, i], tree[j, i + 1]], color='black')
-                plt.plot([i, i + 1], [tree[j, i], tree[j + 1, i + 1]], color='black')
-    plt.xlabel("Time Step")
-    plt.ylabel("Value")
-    plt.grid(True)
-    plt.show()
-
-# User interaction
-asset_type = input("Enter the type of asset to value (fixed_income/option): ").lower()
-
-if asset_type == 'fixed_income':
-    r0 = float(input("Initial interest rate (as a decimal): "))
-    u = float(input("Up factor for interest rate: "))
-    d = float(input("Down factor for interest rate: "))
-    n = int(input("Number of time steps: "))
-    interest_rate_tree = generate_binomial_tree(r0, u, d, n)
-    face_value = float(input("Face value of the fixed income instrument: "))
-    coupon_rate = float(input("Coupon rate (as a decimal): "))
-    maturity = int(input("Maturity of the instrument in time steps: "))
-    valuation_tree = value_fixed_income_instrument(face_value, coupon_rate, maturity, interest_rate_tree)
-    plot_tree(interest_rate_tree, valuation_tree)
-
-elif asset_type == 'option':
-    S0 = float(input("Initial asset price: "))
-    strike_price = float(input("Option strike price: "))
-    u = float(input("Up factor for asset price: "))
-    d = float(input("Down factor for asset price: "))
-    r = float(input("Risk-free interest rate (as a decimal): "))
-    steps = int(input("Number of time steps: "))
-    option_type = input("Type of option (call/put): ").lower()
-    is_american = input("Is the option American? (yes/no): ").lower() == 'yes'
-
-    option_valuation = value_option(S0, strike_price, u, d, r, steps, option_type, american=is_american)
-    print(f"The estimated value of the {option_type} option is: {option_valuation:.2f}")
-
-    asset_price_tree = generate_binomial_tree(S0, u, d, steps)
-    plot_tree(asset_price_tree)
-
-else:
-    print("Invalid asset type entered. Please enter either 'fixed_income' or 'option'.")
+    # Node (j, i) is the j-th down move at time step i, for j <= i
+    rows, columns = np.triu_indices(steps + 1)
+    values = tree[rows, columns]
+
+    figure = new_figure(output)
+    axes = figure.gca()
+    axes.set_title("Binomial Tree Visualization")
+    # Every node before the last step has an up and a down branch
+    if steps * (steps + 1) <= max_edges:
+        inner = columns < steps
+        start = np.column_stack((columns[inner], values[inner]))
+        up = np.column_stack((columns[inner] + 1, tree[rows[inner], columns[inner] + 1]))
+        down = np.column_stack((columns[inner] + 1, tree[rows[inner] + 1, columns[inner] + 1]))
+        segments = np.concatenate((np.stack((start, up), axis=1), np.stack((start, down), axis=1)))
+        axes.add_collection(LineCollection(segments, colors='black', linewidths=0.5 if steps > 50 else 1.0, zorder=1))
+    axes.scatter(columns, values, color='blue', s=20 if steps <= 50 else 2, zorder=2)
+    if valuation_tree is not None and values.size <= max_labels:
+        for i, j, value in zip(columns, rows, values):
+            axes.text(i, value, f"{valuation_tree[j, i]:.2f}", color='red')
+    axes.set_xlabel("Time Step")
+    axes.set_ylabel("Value")
+    axes.grid(True)
+    axes.autoscale_view()
+    show_or_save(figure, output)
+
+def evaluate_jobs(jobs):
+    """
+    Value many fixed income and option scenarios without prompting or plotting.
+    Option jobs sharing the same tree (S0, u, d, r and steps) are valued together in one
+    value_options_batch call, so thousands of strikes cost little more than one.
+    :param jobs: A list of dictionaries with an 'asset_type' of 'fixed_income' (fields r0, u, d,
+        steps, face_value, coupon_rate, maturity) or 'option' (fields S0, strike_price, u, d, r,
+        steps, option_type, american), and an optional 'name'.
+    :return: A DataFrame with one row per job holding its name, asset type and value.
+    """
+    import pandas as pd
+
+    values = np.full(len(jobs), np.nan)
+    option_groups = {}
+    for index, job in enumerate(jobs):
+        asset_type = job['asset_type'].lower()
+        if asset_type == 'fixed_income':
+            interest_rate_tree = generate_binomial_tree(float(job['r0']), float(job['u']), float(job['d']),
+                                                        int(job['steps']))
+            valuation_tree = value_fixed_income_instrument(float(job['face_value']), float(job['coupon_rate']),
+                                                           int(job['maturity']), interest_rate_tree)
+            values[index] = valuation_tree[0, 0]
+        elif asset_type == 'option':
+            tree = tuple(float(job[field]) for field in ('S0', 'u', 'd', 'r')) + (int(job['steps']),)
+            option_groups.setdefault(tree, []).append(index)
+        else:
+            raise ValueError(f"Invalid asset type {job['asset_type']!r} in job {index}.")
+
+    for (S0, u, d, r, steps), indices in option_groups.items():
+        group = [jobs[index] for index in indices]
+        values[indices] = value_options_batch(S0, [float(job['strike_price']) for job in group], u, d, r, steps,
+                                              [job.get('option_type', 'call').lower() for job in group],
+                                              [as_bool(job.get('american', False)) for job in group])
+
+    return pd.DataFrame({
+        'name': [job.get('name', index) for index, job in enumerate(jobs)],
+        'asset_type': [job['asset_type'].lower() for job in jobs],
+        'value': values,
+    })
+
+def run_interactive():
+    """
+    Prompt for a single fixed income instrument or option, value it and plot its tree.
+    """
+    asset_type = input("Enter the type of asset to value (fixed_income/option): ").lower()
+
+    if asset_type == 'fixed_income':
+        r0 = float(input("Initial interest rate (as a decimal): "))
+        u = float(input("Up factor for interest rate: "))
+        d = float(input("Down factor for interest rate: "))
+        n = int(input("Number of time steps: "))
+        interest_rate_tree = generate_binomial_tree(r0, u, d, n)
+        face_value = float(input("Face value of the fixed income instrument: "))
+        coupon_rate = float(input("Coupon rate (as a decimal): "))
+        maturity = int(input("Maturity of the instrument in time steps: "))
+        valuation_tree = value_fixed_income_instrument(face_value, coupon_rate, maturity, interest_rate_tree)
+        plot_tree(interest_rate_tree, valuation_tree)
+
+    elif asset_type == 'option':
+        S0 = float(input("Initial asset price: "))
+        strike_price = float(input("Option strike price: "))
+        u = float(input("Up factor for asset price: "))
+        d = float(input("Down factor for asset price: "))
+        r = float(input("Risk-free interest rate (as a decimal): "))
+        steps = int(input("Number of time steps: "))
+        option_type = input("Type of option (call/put): ").lower()
+        is_american = input("Is the option American? (yes/no): ").lower() == 'yes'
+
+        option_valuation = value_option(S0, strike_price, u, d, r, steps, option_type, american=is_american)
+        print(f"The estimated value of the {option_type} option is: {option_valuation:.2f}")
+
+        asset_price_tree = generate_binomial_tree(S0, u, d, steps)
+        plot_tree(asset_price_tree)
+
+    else:
+        print("Invalid asset type entered. Please enter either 'fixed_income' or 'option'.")
+
+def main():
+    """
+    Command line entry point: values a job file in bulk, or runs the interactive prompts when no job file is given.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Binomial tree valuation of fixed income instruments and options.")
+    parser.add_argument("--jobs", help="JSON, YAML or CSV file of scenarios to value without prompting.")
+    parser.add_argument("--output", help="CSV or JSON file for the results (printed when omitted).")
+    args = parser.parse_args()
+
+    if args.jobs:
+        write_results(evaluate_jobs(load_jobs(args.jobs)), args.output)
+    else:
+        run_interactive()
+
+if __name__ == "__main__":
+    main()
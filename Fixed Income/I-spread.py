@@ -1,5 +1,16 @@
+import os
+import sys
+
 import numpy as np
 
+# Shared helpers live in the common package at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from common.bonds import bullet_bond_cash_flows, solve_spread
+from common.spreads import SPREAD_DTYPE, format_spreads, interpolate_curve
+
+
 def calculate_i_spreads(risky_bond_yields, swap_rates, maturities):
     """
     Calculate the i-spreads for multiple risky bond yields, swap rates, and maturities, in basis points.
@@ -10,29 +21,81 @@ def calculate_i_spreads(risky_bond_yields, swap_rates, maturities):
         maturities (list or np.ndarray): List or array of maturities (years).
     
     Returns:
-        np.ndarray: Array of strings with swap spreads in basis points, rounded to 2 decimal places, 
-                    followed by 'bps', and including the maturity.
+        np.ndarray: Structured array with 'maturity' (years) and 'spread_bps' fields. Use
+                    format_spreads to turn it into display strings.
     """
     # Convert inputs to NumPy arrays for vectorized operations
-    risky_bond_yields = np.array(risky_bond_yields)
-    swap_rates = np.array(swap_rates)
-    maturities = np.array(maturities)
+    risky_bond_yields = np.asarray(risky_bond_yields, dtype=float)
+    swap_rates = np.asarray(swap_rates, dtype=float)
+    maturities = np.asarray(maturities, dtype=float)
 
     # Calculate  i-spreads
-    i_spreads_basis = (risky_bond_yields - swap_rates) * 10000
-    i_spreads_basis = np.round(i_spreads_basis, 2)
+    results = np.empty(np.broadcast(risky_bond_yields, swap_rates, maturities).shape, dtype=SPREAD_DTYPE)
+    results['maturity'] = maturities
+    results['spread_bps'] = (risky_bond_yields - swap_rates) * 10000
 
-    # Format results with maturity
-    results = np.core.defchararray.add(i_spreads_basis.astype(str), " bps, Maturity: ")
-    results = np.core.defchararray.add(results, maturities.astype(str))
-    results = np.core.defchararray.add(results, " years")
+    return results
+
+def calculate_bond_spreads(bond_yields, maturities, swap_tenors, swap_rates, treasury_tenors, treasury_yields):
+    """
+    Calculate i-spreads over the swap curve and G-spreads over the government curve for a bond
+    universe, with both curves interpolated to each bond's exact maturity.
+    
+    Args:
+        bond_yields (list or np.ndarray): Bond yields to maturity (%).
+        maturities (list or np.ndarray): Bond maturities (years).
+        swap_tenors (list or np.ndarray): Swap curve tenors (years).
+        swap_rates (list or np.ndarray): Swap rates at each tenor (%).
+        treasury_tenors (list or np.ndarray): Government curve tenors (years).
+        treasury_yields (list or np.ndarray): Government yields at each tenor (%).
+    
+    Returns:
+        np.ndarray: Structured array with 'maturity', 'i_spread_bps' and 'g_spread_bps' fields.
+    """
+    bond_yields = np.asarray(bond_yields, dtype=float)
+    maturities = np.asarray(maturities, dtype=float)
+
+    results = np.empty(maturities.shape, dtype=[('maturity', float), ('i_spread_bps', float), ('g_spread_bps', float)])
+    results['maturity'] = maturities
+    results['i_spread_bps'] = (bond_yields - interpolate_curve(swap_tenors, swap_rates, maturities)) * 10000
+    results['g_spread_bps'] = (bond_yields - interpolate_curve(treasury_tenors, treasury_yields, maturities)) * 10000
 
     return results
 
+def calculate_z_spreads(prices, coupon_rates, maturities, zero_tenors, zero_rates, frequency=2, face_value=100,
+                        tolerance=1e-10, max_iterations=50):
+    """
+    Calculate Z-spreads, the constant spread over the zero curve that reprices each bond, for
+    plain bullet bonds. Coupon dates are laid out on a padded (bonds x periods) grid counted back
+    from maturity, and Newton iterations run on all bonds at once in the solver shared with
+    solve_bond_universe in Yield Solver.py.
+    
+    Args:
+        prices (list or np.ndarray): Full (dirty) prices of the bonds per face_value.
+        coupon_rates (list or np.ndarray): Annual coupon rates (%).
+        maturities (list or np.ndarray): Bond maturities (years).
+        zero_tenors (list or np.ndarray): Zero curve tenors (years).
+        zero_rates (list or np.ndarray): Zero rates at each tenor, compounded `frequency` times a year (%).
+        frequency (int): Coupon payments per year.
+        face_value (float): Face value the prices are quoted per.
+        tolerance (float): Convergence tolerance on the pricing error.
+        max_iterations (int): Maximum number of Newton iterations.
+    
+    Returns:
+        np.ndarray: Z-spread of each bond in basis points (NaN where the solver did not converge).
+    """
+    prices = np.atleast_1d(np.asarray(prices, dtype=float))
+    maturities = np.broadcast_to(np.asarray(maturities, dtype=float), prices.shape)
+    cash_flows, times = bullet_bond_cash_flows(coupon_rates, maturities, frequency, face_value)
+    zero = interpolate_curve(zero_tenors, zero_rates, times)
+    spread = solve_spread(prices, cash_flows, times, zero, frequency, 'newton', tolerance, max_iterations)
+    return spread * 10000
+
 # Example usage with lists of data
-risky_bond_yields = [0.0202, 0.025]
-swap_rates = [0.0161, 0.02]
-maturities = [2, 5]
+if __name__ == "__main__":
+    risky_bond_yields = [0.0202, 0.025]
+    swap_rates = [0.0161, 0.02]
+    maturities = [2, 5]
 
-result = calculate_i_spreads(risky_bond_yields, swap_rates, maturities)
-print(result)
+    result = calculate_i_spreads(risky_bond_yields, swap_rates, maturities)
+    print(format_spreads(result))
@@ -0,0 +1,151 @@
+import numpy as np
+
+def basket_payoff(prices, strike_price, weights, option_type='call', basket='weighted'):
+    """
+    Exercise value of a basket option at one time slice.
+    :param prices: A NumPy array (n_paths x n_assets) of asset prices.
+    :param strike_price: Strike price of the option.
+    :param weights: Basket weights, one per asset.
+    :param option_type: 'call' or 'put'.
+    :param basket: 'weighted' (weighted sum), 'max' (best-of) or 'min' (worst-of).
+    :return: A NumPy array with the exercise value of each path.
+    """
+    if basket == 'weighted':
+        underlying = prices @ weights
+    elif basket == 'max':
+        underlying = prices.max(axis=1)
+    elif basket == 'min':
+        underlying = prices.min(axis=1)
+    else:
+        raise ValueError("basket must be 'weighted', 'max' or 'min'.")
+    sign = 1.0 if option_type == 'call' else -1.0
+    return np.maximum(sign * (underlying - strike_price), 0)
+
+def polynomial_basis(prices, S0, exercise_value):
+    """
+    Regression basis of all monomials of degree two or less in the normalised prices, plus the
+    exercise value itself.
+    :param prices: A NumPy array (n_paths x n_assets) of asset prices.
+    :param S0: Initial asset prices used to normalise.
+    :param exercise_value: The exercise value of each path.
+    :return: A NumPy array (n_paths x n_basis).
+    """
+    x = prices / S0
+    rows, columns = np.triu_indices(x.shape[1])
+    return np.column_stack((np.ones(x.shape[0]), x, x[:, rows] * x[:, columns], exercise_value / np.mean(S0)))
+
+def _backward_bridge(rng, n_paths, n_assets, steps):
+    """
+    Generate standard Brownian motions backwards in time with a Brownian bridge, yielding one
+    time slice at a time from the last step to the first, so only one slice is held in memory.
+    """
+    w = rng.standard_normal((n_paths, n_assets)) * np.sqrt(steps)
+    yield steps, w
+    for t in range(steps - 1, 0, -1):
+        # W(t) given W(t + 1) and W(0) = 0 is normal with mean W(t + 1) * t / (t + 1) and variance t / (t + 1)
+        w = w * t / (t + 1) + rng.standard_normal((n_paths, n_assets)) * np.sqrt(t / (t + 1))
+        yield t, w
+
+def _asset_prices(w, t, S0, r, sigma, cholesky):
+    """Correlated GBM prices at step t from independent Brownian motions w."""
+    return S0 * np.exp((r - 0.5 * sigma ** 2) * t + sigma * (w @ cholesky.T))
+
+def _lsm_block(seed, n_paths, S0, strike_price, r, sigma, cholesky, steps, weights, option_type, basket,
+               coefficients):
+    """
+    Run the backward Longstaff-Schwartz recursion over one block of paths.
+    Without coefficients the continuation value is regressed on the block (training) and the
+    fitted coefficients are returned; with coefficients the block is priced out of sample.
+    :return: A tuple (sum of discounted values, sum of squares, n_paths, coefficients).
+    """
+    rng = np.random.default_rng(seed)
+    discount = np.exp(-r)
+    training = coefficients is None
+    if training:
+        coefficients = {}
+
+    value = None
+    for t, w in _backward_bridge(rng, n_paths, S0.shape[0], steps):
+        prices = _asset_prices(w, t, S0, r, sigma, cholesky)
+        exercise = basket_payoff(prices, strike_price, weights, option_type, basket)
+        if value is None:
+            value = exercise
+            continue
+        value = value * discount
+        in_the_money = exercise > 0
+        if not in_the_money.any():
+            continue
+        basis = polynomial_basis(prices[in_the_money], S0, exercise[in_the_money])
+        if training:
+            coefficients[t] = np.linalg.lstsq(basis, value[in_the_money], rcond=None)[0]
+        if t not in coefficients:
+            continue
+        continuation = basis @ coefficients[t]
+        exercise_now = np.flatnonzero(in_the_money)[exercise[in_the_money] > continuation]
+        value[exercise_now] = exercise[exercise_now]
+
+    # Discount to today; immediate exercise at S0 is compared by the caller
+    value = value * discount
+    return value.sum(), (value ** 2).sum(), n_paths, coefficients
+
+def value_american_basket_option(S0, strike_price, sigma, r, steps, correlation=None, weights=None,
+                                 option_type='put', basket='weighted', n_paths=100000, n_training_paths=20000,
+                                 block_paths=10000, n_workers=1, seed=None):
+    """
+    Value an American option on a basket of assets with the Longstaff-Schwartz least-squares
+    Monte Carlo method.
+    Regression coefficients for every exercise date are fitted on an independent training set,
+    then the pricing paths are split into blocks, each with its own SeedSequence-spawned stream,
+    and valued out of sample on n_workers processes. Paths are generated backwards with a
+    Brownian bridge so each block only ever holds one time slice.
+    :param S0: Initial asset prices, one per asset.
+    :param strike_price: Strike price of the option.
+    :param sigma: Log-return volatilities per step, one per asset.
+    :param r: Risk-free interest rate per step.
+    :param steps: Number of exercise dates (time steps).
+    :param correlation: Correlation matrix of the assets (defaults to independent assets).
+    :param weights: Basket weights (defaults to equal weights).
+    :param option_type: 'call' or 'put'.
+    :param basket: 'weighted', 'max' or 'min' (see basket_payoff).
+    :param n_paths: Number of pricing paths.
+    :param n_training_paths: Number of paths used to fit the regressions.
+    :param block_paths: Number of paths per block.
+    :param n_workers: Number of worker processes; 1 runs in the current process.
+    :param seed: Seed for the root SeedSequence.
+    :return: A tuple (value, standard_error).
+    """
+    S0 = np.atleast_1d(np.asarray(S0, dtype=float))
+    n_assets = S0.shape[0]
+    sigma = np.broadcast_to(np.asarray(sigma, dtype=float), (n_assets,))
+    correlation = np.eye(n_assets) if correlation is None else np.asarray(correlation, dtype=float)
+    cholesky = np.linalg.cholesky(correlation)
+    weights = np.full(n_assets, 1 / n_assets) if weights is None else np.asarray(weights, dtype=float)
+
+    training_seed, *block_seeds = np.random.SeedSequence(seed).spawn(1 + -(-n_paths // block_paths))
+    common = (S0, strike_price, r, sigma, cholesky, steps, weights, option_type, basket)
+    coefficients = _lsm_block(training_seed, n_training_paths, *common, None)[3]
+
+    block_sizes = [min(block_paths, n_paths - start) for start in range(0, n_paths, block_paths)]
+    arguments = [(s, n) + common + (coefficients,) for s, n in zip(block_seeds, block_sizes)]
+    if n_workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(_lsm_block, *zip(*arguments)))
+    else:
+        results = [_lsm_block(*a) for a in arguments]
+
+    total, total_squares, n = (sum(result[k] for result in results) for k in range(3))
+    mean = total / n
+    standard_error = np.sqrt((total_squares / n - mean ** 2) / (n - 1))
+    exercise_today = basket_payoff(S0[np.newaxis, :], strike_price, weights, option_type, basket)[0]
+    return max(mean, exercise_today), standard_error
+
+# Example usage
+if __name__ == "__main__":
+    # Single asset American put, comparable with value_option(100, 100, u, 1 / u, 0.0004, 50, 'put', True)
+    # for u = exp(0.02)
+    print(value_american_basket_option([100], 100, 0.02, 0.0004, 50, seed=7))
+    # American put on an equally weighted basket of three correlated assets
+    correlation = [[1.0, 0.5, 0.3], [0.5, 1.0, 0.4], [0.3, 0.4, 1.0]]
+    print(value_american_basket_option([100, 95, 105], 100, [0.02, 0.025, 0.015], 0.0004, 50,
+                                       correlation=correlation, seed=7))
@@ -0,0 +1,200 @@
+import os
+import sys
+
+import numpy as np
+
+# Shared helpers live in the common package at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from common.options import black_scholes_price, ndtr
+
+def crr_to_gbm(u, d):
+    """
+    Per-step volatility of the geometric Brownian motion matched to a CRR up/down pair.
+    :param u: Up factor for asset price.
+    :param d: Down factor for asset price.
+    :return: The per-step log-return volatility ln(u / d) / 2.
+    """
+    return np.log(u / d) / 2
+
+def geometric_asian_price(S0, strike_price, r, sigma, steps, option_type='call'):
+    """
+    Closed-form price of a discretely monitored geometric-average Asian option averaging the
+    prices at steps 1..steps, with the rate and volatility quoted per step.
+    :return: The option value.
+    """
+    mean = np.log(S0) + (r - 0.5 * sigma ** 2) * (steps + 1) / 2
+    variance = sigma ** 2 * (steps + 1) * (2 * steps + 1) / (6 * steps)
+    d1 = (mean - np.log(strike_price) + variance) / np.sqrt(variance)
+    d2 = d1 - np.sqrt(variance)
+    forward = np.exp(mean + 0.5 * variance)
+    if option_type == 'call':
+        return np.exp(-r * steps) * (forward * ndtr(d1) - strike_price * ndtr(d2))
+    return np.exp(-r * steps) * (strike_price * ndtr(-d2) - forward * ndtr(-d1))
+
+def generate_gbm_paths(S0, r, sigma, steps, n_paths, rng, antithetic=False):
+    """
+    Generate risk-neutral geometric Brownian motion paths.
+    :param S0: Initial asset price.
+    :param r: Risk-free interest rate per step.
+    :param sigma: Log-return volatility per step.
+    :param steps: Number of time steps per path.
+    :param n_paths: Number of paths (with antithetic=True, half are mirror images of the other half).
+    :param rng: A NumPy Generator.
+    :param antithetic: Pair every path with its antithetic path built from the negated shocks.
+    :return: A NumPy array (n_paths x steps) of prices at steps 1..steps.
+    """
+    if antithetic:
+        shocks = rng.standard_normal((n_paths // 2, steps))
+        shocks = np.concatenate((shocks, -shocks))
+    else:
+        shocks = rng.standard_normal((n_paths, steps))
+    log_returns = (r - 0.5 * sigma ** 2) + sigma * shocks
+    return S0 * np.exp(np.cumsum(log_returns, axis=1))
+
+def path_payoff(paths, S0, strike_price, option_type='call', style='asian', barrier=None, barrier_type='up-and-out'):
+    """
+    Payoff of each simulated path.
+    :param paths: A NumPy array (n_paths x steps) of simulated prices.
+    :param S0: Initial asset price (part of the path for barrier and lookback monitoring).
+    :param strike_price: Strike price (unused for floating-strike lookbacks).
+    :param option_type: 'call' or 'put'.
+    :param style: 'european', 'asian' (arithmetic average), 'barrier' or 'lookback' (floating strike).
+    :param barrier: Barrier level for barrier options.
+    :param barrier_type: 'up-and-out', 'up-and-in', 'down-and-out' or 'down-and-in'.
+    :return: A NumPy array with the undiscounted payoff of each path.
+    """
+    sign = 1.0 if option_type == 'call' else -1.0
+    terminal = paths[:, -1]
+    if style == 'european':
+        return np.maximum(sign * (terminal - strike_price), 0)
+    if style == 'asian':
+        return np.maximum(sign * (paths.mean(axis=1) - strike_price), 0)
+    if style == 'barrier':
+        if barrier_type.startswith('up'):
+            crossed = np.maximum(paths.max(axis=1), S0) >= barrier
+        else:
+            crossed = np.minimum(paths.min(axis=1), S0) <= barrier
+        alive = ~crossed if barrier_type.endswith('out') else crossed
+        return np.where(alive, np.maximum(sign * (terminal - strike_price), 0), 0.0)
+    if style == 'lookback':
+        if option_type == 'call':
+            return terminal - np.minimum(paths.min(axis=1), S0)
+        return np.maximum(paths.max(axis=1), S0) - terminal
+    raise ValueError("style must be 'european', 'asian', 'barrier' or 'lookback'.")
+
+def _simulate_chunk(seed, n_paths, S0, strike_price, r, sigma, steps, payoff_kwargs, antithetic, control):
+    """
+    Simulate one chunk of paths and return running sums for the (control-variate) estimator.
+    :return: A NumPy array [n, sum Y, sum Y^2, sum X, sum X^2, sum XY].
+    """
+    rng = np.random.default_rng(seed)
+    paths = generate_gbm_paths(S0, r, sigma, steps, n_paths, rng, antithetic)
+    discount = np.exp(-r * steps)
+    y = discount * path_payoff(paths, S0, strike_price, **payoff_kwargs)
+    if control == 'geometric':
+        geometric_average = np.exp(np.log(paths).mean(axis=1))
+        sign = 1.0 if payoff_kwargs.get('option_type', 'call') == 'call' else -1.0
+        x = discount * np.maximum(sign * (geometric_average - strike_price), 0)
+    elif control == 'european':
+        x = discount * path_payoff(paths, S0, strike_price, payoff_kwargs.get('option_type', 'call'), 'european')
+    else:
+        x = np.zeros_like(y)
+    if antithetic:
+        # Each antithetic pair is one independent sample
+        half = y.shape[0] // 2
+        y = 0.5 * (y[:half] + y[half:])
+        x = 0.5 * (x[:half] + x[half:])
+    return np.array([y.shape[0], y.sum(), (y * y).sum(), x.sum(), (x * x).sum(), (x * y).sum()])
+
+def value_path_dependent_option(S0, strike_price, u, d, r, steps, option_type='call', style='asian', barrier=None,
+                                barrier_type='up-and-out', n_paths=100000, antithetic=True, control=None,
+                                max_chunk_bytes=64 * 2 ** 20, n_workers=1, seed=None):
+    """
+    Value a path-dependent option by Monte Carlo on the same inputs as value_option.
+    The CRR up/down factors are mapped to a GBM with per-step volatility ln(u / d) / 2 and
+    per-step drift r. Paths are simulated in chunks that fit in max_chunk_bytes, and each chunk
+    draws from its own stream spawned from one SeedSequence, so results are reproducible for a
+    given seed whatever the number of worker processes.
+    :param S0: Initial asset price.
+    :param strike_price: Strike price of the option.
+    :param u: Up factor for asset price.
+    :param d: Down factor for asset price.
+    :param r: Risk-free interest rate per step.
+    :param steps: Number of monitoring steps.
+    :param option_type: Type of the option ('call' or 'put').
+    :param style: 'european', 'asian', 'barrier' or 'lookback' (see path_payoff).
+    :param barrier: Barrier level for barrier options.
+    :param barrier_type: 'up-and-out', 'up-and-in', 'down-and-out' or 'down-and-in'.
+    :param n_paths: Total number of simulated paths.
+    :param antithetic: Use antithetic variates.
+    :param control: None, 'european' (vanilla payoff with its Black-Scholes price) or 'geometric'
+        (geometric Asian with its closed-form price, for arithmetic Asians).
+    :param max_chunk_bytes: Upper bound on the memory used by one chunk of paths.
+    :param n_workers: Number of worker processes; 1 runs in the current process.
+    :param seed: Seed for the root SeedSequence.
+    :return: A tuple (value, standard_error).
+    """
+    sigma = crr_to_gbm(u, d)
+    # Roughly three (paths x steps) float arrays are alive at once within a chunk
+    chunk_paths = max(2, int(max_chunk_bytes // (3 * 8 * steps)) // 2 * 2)
+    chunk_sizes = [chunk_paths] * (n_paths // chunk_paths)
+    if n_paths % chunk_paths:
+        chunk_sizes.append(n_paths % chunk_paths + (n_paths % chunk_paths) % 2)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    payoff_kwargs = {'option_type': option_type, 'style': style, 'barrier': barrier, 'barrier_type': barrier_type}
+    arguments = [(s, n, S0, strike_price, r, sigma, steps, payoff_kwargs, antithetic, control)
+                 for s, n in zip(seeds, chunk_sizes)]
+
+    if n_workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            sums = sum(pool.map(_simulate_chunk, *zip(*arguments)))
+    else:
+        sums = sum(_simulate_chunk(*a) for a in arguments)
+
+    n, sum_y, sum_yy, sum_x, sum_xx, sum_xy = sums
+    mean_y = sum_y / n
+    var_y = (sum_yy - n * mean_y ** 2) / (n - 1)
+    if control is None:
+        return mean_y, np.sqrt(var_y / n)
+
+    if control == 'geometric':
+        control_value = geometric_asian_price(S0, strike_price, r, sigma, steps, option_type)
+    else:
+        control_value = black_scholes_price(S0, strike_price, r, sigma, steps, option_type)
+    mean_x = sum_x / n
+    var_x = (sum_xx - n * mean_x ** 2) / (n - 1)
+    cov_xy = (sum_xy - n * mean_x * mean_y) / (n - 1)
+    beta = cov_xy / var_x if var_x > 0 else 0.0
+    value = mean_y - beta * (mean_x - control_value)
+    variance = var_y - 2 * beta * cov_xy + beta ** 2 * var_x
+    return value, np.sqrt(max(variance, 0.0) / n)
+
+def check_against_binomial(value_option, S0, strike_price, u, d, r, steps, option_type='call', tree_steps=2000, **kwargs):
+    """
+    Compare the Monte Carlo engine with the binomial value_option on a vanilla European option.
+    The tree is refined to tree_steps steps over the same horizon so both converge to the same
+    continuous-time GBM price. No control variate is used, so the comparison is independent.
+    :param value_option: The binomial value_option function from Binomial Tree.py.
+    :param tree_steps: Number of steps for the refined binomial tree.
+    :param kwargs: Further arguments for value_path_dependent_option.
+    :return: A tuple (monte_carlo_value, standard_error, binomial_value).
+    """
+    kwargs['control'] = None
+    value, standard_error = value_path_dependent_option(S0, strike_price, u, d, r, steps, option_type,
+                                                        style='european', **kwargs)
+    scale = steps / tree_steps
+    sigma = crr_to_gbm(u, d) * np.sqrt(scale)
+    tree_value = value_option(S0, strike_price, np.exp(sigma), np.exp(-sigma), r * scale, tree_steps, option_type)
+    return value, standard_error, tree_value
+
+# Example usage
+if __name__ == "__main__":
+    S0, strike_price, u, d, r, steps = 100, 100, 1.02, 1 / 1.02, 0.0004, 250
+    for style, control in (('european', None), ('asian', 'geometric'), ('barrier', None), ('lookback', None)):
+        value, standard_error = value_path_dependent_option(S0, strike_price, u, d, r, steps, style=style, barrier=130,
+                                                            control=control, seed=42)
+        print(f"{style}: {value:.4f} +/- {standard_error:.4f}")
+    print(f"Black-Scholes: {black_scholes_price(S0, strike_price, r, crr_to_gbm(u, d), steps):.4f}")
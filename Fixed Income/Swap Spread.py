@@ -1,5 +1,14 @@
+import os
+import sys
+
 import numpy as np
 
+# Shared helpers live in the common package at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from common.spreads import SPREAD_DTYPE, format_spreads, interpolate_curve
+
 def calculate_swap_spreads(swap_rates, treasury_yields, maturities):
     """
     Calculate the swap spreads for multiple swap rates, treasury yields, and maturities, in basis points.
@@ -10,29 +19,46 @@ def calculate_swap_spreads(swap_rates, treasury_yields, maturities):
         maturities (list or np.ndarray): List or array of maturities (years).
     
     Returns:
-        np.ndarray: Array of strings with swap spreads in basis points, rounded to 2 decimal places, 
-                    followed by 'bps', and including the maturity.
+        np.ndarray: Structured array with 'maturity' (years) and 'spread_bps' fields. Use
+                    format_spreads to turn it into display strings.
     """
     # Convert inputs to NumPy arrays for vectorized operations
-    swap_rates = np.array(swap_rates)
-    treasury_yields = np.array(treasury_yields)
-    maturities = np.array(maturities)
+    swap_rates = np.asarray(swap_rates, dtype=float)
+    treasury_yields = np.asarray(treasury_yields, dtype=float)
+    maturities = np.asarray(maturities, dtype=float)
 
     # Calculate swap spreads
-    swap_spreads_basis = (swap_rates - treasury_yields) * 10000
-    swap_spreads_basis = np.round(swap_spreads_basis, 2)
-
-    # Format results with maturity
-    results = np.core.defchararray.add(swap_spreads_basis.astype(str), " bps, Maturity: ")
-    results = np.core.defchararray.add(results, maturities.astype(str))
-    results = np.core.defchararray.add(results, " years")
+    results = np.empty(np.broadcast(swap_rates, treasury_yields, maturities).shape, dtype=SPREAD_DTYPE)
+    results['maturity'] = maturities
+    results['spread_bps'] = (swap_rates - treasury_yields) * 10000
 
     return results
 
+def calculate_swap_spreads_interpolated(swap_tenors, swap_rates, treasury_tenors, treasury_yields, maturities):
+    """
+    Calculate swap spreads at arbitrary maturities, interpolating the swap and treasury curves
+    (which may have different tenor grids) to each maturity.
+    
+    Args:
+        swap_tenors (list or np.ndarray): Swap curve tenors (years), increasing.
+        swap_rates (list or np.ndarray): Swap rates at each tenor (%).
+        treasury_tenors (list or np.ndarray): Treasury curve tenors (years), increasing.
+        treasury_yields (list or np.ndarray): Treasury yields at each tenor (%).
+        maturities (list or np.ndarray): Maturities to compute spreads for (years).
+    
+    Returns:
+        np.ndarray: Structured array with 'maturity' (years) and 'spread_bps' fields.
+    """
+    maturities = np.asarray(maturities, dtype=float)
+    swap_rates = interpolate_curve(swap_tenors, swap_rates, maturities)
+    treasury_yields = interpolate_curve(treasury_tenors, treasury_yields, maturities)
+    return calculate_swap_spreads(swap_rates, treasury_yields, maturities)
+
 # Example usage with lists of data
-swap_rates = [0.0202, 0.025]
-treasury_yields = [0.0161, 0.02]
-maturities = [2, 5]
+if __name__ == "__main__":
+    swap_rates = [0.0202, 0.025]
+    treasury_yields = [0.0161, 0.02]
+    maturities = [2, 5]
 
-result = calculate_swap_spreads(swap_rates, treasury_yields, maturities)
-print(result)
+    result = calculate_swap_spreads(swap_rates, treasury_yields, maturities)
+    print(format_spreads(result))
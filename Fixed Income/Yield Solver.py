@@ -0,0 +1,88 @@
+import os
+import sys
+
+import numpy as np
+
+# Shared helpers live in the common package at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from common.bonds import bullet_bond_cash_flows, present_value_and_derivatives, solve_spread
+from common.spreads import interpolate_curve
+
+def pad_cash_flows(cash_flows, times):
+    """
+    Pad ragged per-bond cash flow schedules into rectangular arrays.
+
+    Args:
+        cash_flows (list of lists): Cash flow amounts of each bond.
+        times (list of lists): Time in years until each cash flow of each bond.
+
+    Returns:
+        tuple: (cash_flows, times) as (bonds x max cash flows) arrays; padded entries have a zero
+               cash flow and a zero time, so they drop out of every sum.
+    """
+    n_bonds = len(cash_flows)
+    lengths = np.array([len(flows) for flows in cash_flows])
+    padded_cash_flows = np.zeros((n_bonds, lengths.max() if n_bonds else 0))
+    padded_times = np.zeros_like(padded_cash_flows)
+    # Scatter the flattened schedules into the rows of the padded arrays
+    rows = np.repeat(np.arange(n_bonds), lengths)
+    columns = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    padded_cash_flows[rows, columns] = np.concatenate([np.asarray(flows, dtype=float) for flows in cash_flows])
+    padded_times[rows, columns] = np.concatenate([np.asarray(t, dtype=float) for t in times])
+    return padded_cash_flows, padded_times
+
+def solve_bond_universe(prices, cash_flows, times, zero_tenors=None, zero_rates=None, frequency=2, method='halley',
+                        tolerance=1e-10, max_iterations=50):
+    """
+    Solve yields to maturity and Z-spreads for a whole bond universe in one call, with modified
+    duration and convexity at the solved yield.
+
+    Args:
+        prices (list or np.ndarray): Full (dirty) prices of the bonds.
+        cash_flows (np.ndarray): Padded (bonds x cash flows) amounts, e.g. from pad_cash_flows.
+        times (np.ndarray): Padded (bonds x cash flows) times in years.
+        zero_tenors (list or np.ndarray): Zero curve tenors (years); Z-spreads are skipped when omitted.
+        zero_rates (list or np.ndarray): Zero rates compounded `frequency` times a year (%).
+        frequency (int): Compounding frequency of the yields and spreads.
+        method (str): 'halley' or 'newton'.
+        tolerance (float): Convergence tolerance on the pricing error.
+        max_iterations (int): Maximum number of iterations.
+
+    Returns:
+        dict: Arrays 'yield', 'z_spread', 'modified_duration' and 'convexity'; entries are NaN for
+              bonds that did not converge (and 'z_spread' is all NaN without a zero curve).
+    """
+    prices = np.atleast_1d(np.asarray(prices, dtype=float))
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    times = np.asarray(times, dtype=float)
+
+    # A flat yield is a spread over a zero base curve
+    yields = solve_spread(prices, cash_flows, times, np.zeros_like(times), frequency, method, tolerance,
+                          max_iterations, initial_guess=0.05)
+    price, first, second = present_value_and_derivatives(cash_flows, times, np.zeros_like(times),
+                                                         np.nan_to_num(yields), frequency)
+    modified_duration = np.where(np.isnan(yields), np.nan, -first / price)
+    convexity = np.where(np.isnan(yields), np.nan, second / price)
+
+    z_spreads = np.full(prices.shape, np.nan)
+    if zero_tenors is not None:
+        base_rates = interpolate_curve(zero_tenors, zero_rates, times)
+        z_spreads = solve_spread(prices, cash_flows, times, base_rates, frequency, method, tolerance,
+                                 max_iterations, initial_guess=0.0)
+
+    return {
+        'yield': yields,
+        'z_spread': z_spreads,
+        'modified_duration': modified_duration,
+        'convexity': convexity,
+    }
+
+# Example usage
+if __name__ == "__main__":
+    # A 2-year 4% semi-annual bullet bond and an amortising bond with an irregular schedule
+    cash_flows, times = pad_cash_flows([[2.0, 2.0, 2.0, 102.0], [52.0, 51.0, 50.5]], [[0.5, 1.0, 1.5, 2.0], [0.4, 0.9, 1.4]])
+    results = solve_bond_universe([101.2, 150.0], cash_flows, times,
+                                  zero_tenors=[0.5, 1, 2, 5, 10], zero_rates=[0.02, 0.021, 0.023, 0.026, 0.03])
+    print(results)
@@ -29,14 +29,13 @@ def calculate_expected_active_return(portfolio_weights, benchmark_weights, expec
     return sum(w * r for w, r in zip(active_weights, expected_excess_returns))
 
 # Example usage
-example_portfolio_weights = [0.25, 0.20, 0.30, 0.25]
-example_benchmark_weights = [0.20, 0.25, 0.25, 0.30]
-example_expected_excess_returns = [0.08, 0.06, 0.10, 0.04]
-
-try:
-    active_return = calculate_expected_active_return(example_portfolio_weights, example_benchmark_weights, example_expected_excess_returns)
-    print("Expected Active Return:", active_return)
-except ValueError as e:
-    print("Error:", e)
-
-  
+if __name__ == "__main__":
+    example_portfolio_weights = [0.25, 0.20, 0.30, 0.25]
+    example_benchmark_weights = [0.20, 0.25, 0.25, 0.30]
+    example_expected_excess_returns = [0.08, 0.06, 0.10, 0.04]
+
+    try:
+        active_return = calculate_expected_active_return(example_portfolio_weights, example_benchmark_weights, example_expected_excess_returns)
+        print("Expected Active Return:", active_return)
+    except ValueError as e:
+        print("Error:", e)
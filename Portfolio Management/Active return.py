@@ -3,4 +3,5 @@ def calculate_active_return(expected_return_activeportfolio, expected_return_ben
 
 
 #Example usage
-calculate_active_return(0.15, 0.12)
+if __name__ == "__main__":
+    calculate_active_return(0.15, 0.12)
@@ -28,12 +28,13 @@ def calculate_information_ratio(portfolio_returns, benchmark_returns, annualizat
     return information_ratio
 
 # Example usage
-# Assuming these are daily returns
-portfolio_returns = np.array([0.001, 0.002, 0.0015, 0.0025, -0.001])  # Sample portfolio returns
-benchmark_returns = np.array([0.0006, 0.00015, 0.001, 0.002, -0.0005])  # Sample benchmark returns
-
-try:
-    ir = calculate_information_ratio(portfolio_returns, benchmark_returns)
-    print(f"Information Ratio: {ir:.4f}")
-except ValueError as e:
-    print(f"Error calculating Information Ratio: {e}")
+if __name__ == "__main__":
+    # Assuming these are daily returns
+    portfolio_returns = np.array([0.001, 0.002, 0.0015, 0.0025, -0.001])  # Sample portfolio returns
+    benchmark_returns = np.array([0.0006, 0.00015, 0.001, 0.002, -0.0005])  # Sample benchmark returns
+
+    try:
+        ir = calculate_information_ratio(portfolio_returns, benchmark_returns)
+        print(f"Information Ratio: {ir:.4f}")
+    except ValueError as e:
+        print(f"Error calculating Information Ratio: {e}")
@@ -79,10 +79,11 @@ def bootstrap(data, stat_func, n_samples=1000, seed=None):
     return estimate_standard_error(statistics)
 
 # Example usage
-# Define a sample dataset and a statistic function (e.g., mean)
-data = np.random.normal(size=100)  # Sample data
-stat_func = np.mean              # Statistic function (mean in this case)
-
-# Perform bootstrap
-standard_error = bootstrap(data, stat_func)
-print(f"Estimated Standard Error: {standard_error}")
+if __name__ == "__main__":
+    # Define a sample dataset and a statistic function (e.g., mean)
+    data = np.random.normal(size=100)  # Sample data
+    stat_func = np.mean              # Statistic function (mean in this case)
+
+    # Perform bootstrap
+    standard_error = bootstrap(data, stat_func)
+    print(f"Estimated Standard Error: {standard_error}")
@@ -1,9 +1,7 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from tabulate import tabulate
-
 def basic_info(df):
+    import pandas as pd
+    from tabulate import tabulate
+
     print("Basic DataFrame Information")
     print("============================")
     print("Shape of DataFrame: ", df.shape)
@@ -28,6 +26,9 @@ def descriptive_stats(df):
     print("\n")
 
 def missing_data_analysis(df):
+    import pandas as pd
+    from tabulate import tabulate
+
     print("Missing Data Analysis")
     print("=======================")
     missing_data = df.isnull().sum()
@@ -40,12 +41,15 @@ def missing_data_analysis(df):
 def data_distribution(df):
     print("Data Distribution for Numerical Columns")
     print("===========================================")
+    import matplotlib.pyplot as plt
     df.hist(figsize=(12, 10), bins=20)
     plt.show()
 
 def correlation_analysis(df):
     print("Correlation Analysis")
     print("======================")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
     plt.figure(figsize=(10, 8))
     sns.heatmap(df.corr(), annot=True, fmt=".2f", cmap='coolwarm')
     plt.show()
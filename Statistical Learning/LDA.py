@@ -1,8 +1,4 @@
 import numpy as np
-import pandas as pd
-from ISLP import load_data, confusion_table
-from ISLP.models import ModelSpec as MS
-from sklearn.discriminant_analysis import LinearDiscriminantAnalysis as LDA
 
 def lda_analysis(data, features, target, train_condition, lda_params=None):
     """
@@ -18,6 +14,8 @@ def lda_analysis(data, features, target, train_condition, lda_params=None):
     Returns:
     - dict: A dictionary containing the LDA model, predictions, probabilities, and evaluation metrics.
     """
+    from ISLP import confusion_table
+    from sklearn.discriminant_analysis import LinearDiscriminantAnalysis as LDA
 
     # Preprocess data: Select columns specified in 'features' and 'target'
     X = data[features]
@@ -49,6 +47,8 @@ def lda_analysis(data, features, target, train_condition, lda_params=None):
 
 # Example usage with 'Smarket' dataset
 if __name__ == "__main__":
+    from ISLP import load_data
+
     # Load data: Replace 'Smarket' with any other dataset as required
     Smarket = load_data('Smarket')
 
@@ -1,3 +1,9 @@
+import numpy as np
+import torch
+import torch.nn as nn
+from torch.utils.data import DataLoader, TensorDataset
+from sklearn.preprocessing import StandardScaler
+
 class TimeSeriesPreprocessor:
     """
     Preprocesses time series data for LSTM input. This involves scaling the data
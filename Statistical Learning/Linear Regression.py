@@ -1,14 +1,9 @@
-import pandas as pd
-import numpy as np
-import statsmodels.api as sm
-import matplotlib.pyplot as plt
-import seaborn as sns
-import statsmodels.graphics.gofplots as smgof
-
 def run_ols_regression(data, independent_vars, dependent_var):
     """
     Performs Ordinary Least Squares (OLS) regression on the provided dataset and returns the model.
     """
+    import statsmodels.api as sm
+
     X = data[independent_vars]
     X = sm.add_constant(X)  # Add a constant term for the intercept
     y = data[dependent_var]
@@ -25,6 +20,11 @@ def plot_regression_results(data, model, independent_vars, dependent_var):
     """
     Generates plots to visualize the regression results.
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    import statsmodels.api as sm
+    import statsmodels.graphics.gofplots as smgof
+
     plot_size = (10, 6)
 
     # Scatter Plots with Regression Lines
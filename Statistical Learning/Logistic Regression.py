@@ -1,10 +1,4 @@
 import numpy as np
-import pandas as pd
-import statsmodels.api as sm
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import confusion_matrix, accuracy_score
-import matplotlib.pyplot as plt
-from ISLP import load_data  # Importing from the ISLP package
 
 def prepare_data(data, target_column, drop_columns=None):
     """
@@ -41,6 +35,10 @@ def fit_logistic_regression(data, target_column, test_size=0.3, random_state=Non
     Returns:
     dict: Dictionary containing model, predictions, accuracy, and other relevant information.
     """
+    import statsmodels.api as sm
+    from sklearn.metrics import confusion_matrix, accuracy_score
+    from sklearn.model_selection import train_test_split
+
     # Splitting the dataset into features and target
     X = data.drop(columns=[target_column])
     y = data[target_column]
@@ -83,6 +81,8 @@ def plot_confusion_matrix(conf_matrix, labels=["Negative", "Positive"]):
     Returns:
     None: The function only creates a plot.
     """
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots()
     im = ax.imshow(conf_matrix, interpolation='nearest', cmap=plt.cm.Blues)
     ax.figure.colorbar(im, ax=ax)
@@ -107,6 +107,8 @@ def main():
     """
     Main function to run the analysis.
     """
+    from ISLP import load_data  # Importing from the ISLP package
+
     # Load the Smarket data from the ISLP package
     Smarket = load_data('Smarket')
 
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 def monte_carlo_simulation(simulation_function, n_simulations=1000, **kwargs):
     """
@@ -46,6 +45,8 @@ def plot_simulation_results(simulation_results):
     """
     Plot a histogram of the final balances from the Monte Carlo simulation results.
     """
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 6))
     plt.hist(simulation_results, bins=50, color='blue', alpha=0.7)
     plt.title('Histogram of Final Investment Balances')
@@ -54,19 +55,20 @@ def plot_simulation_results(simulation_results):
     plt.show()
 
 # Example usage
-n_simulations = 10000
-initial_investment = 10000  # The amount of money you start with
-years = 20                  # The duration of the investment in years
-avg_return = 0.07           # The average annual return (e.g., 7%)
-std_dev = 0.1               # The standard deviation of the annual return (e.g., 10%)
+if __name__ == "__main__":
+    n_simulations = 10000
+    initial_investment = 10000  # The amount of money you start with
+    years = 20                  # The duration of the investment in years
+    avg_return = 0.07           # The average annual return (e.g., 7%)
+    std_dev = 0.1               # The standard deviation of the annual return (e.g., 10%)
 
-# Running the Monte Carlo simulation
-simulation_results = monte_carlo_simulation(investment_return_simulation, n_simulations, 
-                                            initial_investment=initial_investment, 
-                                            years=years, 
-                                            avg_return=avg_return, 
-                                            std_dev=std_dev)
+    # Running the Monte Carlo simulation
+    simulation_results = monte_carlo_simulation(investment_return_simulation, n_simulations, 
+                                                initial_investment=initial_investment, 
+                                                years=years, 
+                                                avg_return=avg_return, 
+                                                std_dev=std_dev)
 
-# Outputting the results and plotting the histogram
-output_simulation_statistics(simulation_results)
-plot_simulation_results(simulation_results)
+    # Outputting the results and plotting the histogram
+    output_simulation_statistics(simulation_results)
+    plot_simulation_results(simulation_results)
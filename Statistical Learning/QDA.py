@@ -1,8 +1,4 @@
 import numpy as np
-import pandas as pd
-import statsmodels.api as sm
-from sklearn.discriminant_analysis import QuadraticDiscriminantAnalysis as QDA
-from ISLP import load_data, confusion_table
 
 # Load and Prepare Data
 def prepare_data(data, predictors, target, split_year):
@@ -44,6 +40,9 @@ def run_qda_analysis(split_year=2005, predictors=['Lag1', 'Lag2']):
     Returns:
     - None, but prints out the analysis results.
     """
+    from ISLP import load_data, confusion_table
+    from sklearn.discriminant_analysis import QuadraticDiscriminantAnalysis as QDA
+
     # Load the Smarket dataset
     Smarket = load_data('Smarket')
 
@@ -60,6 +59,7 @@ def run_qda_analysis(split_year=2005, predictors=['Lag1', 'Lag2']):
     print("Accuracy of QDA Model:", accuracy)
     print("Confusion Matrix:")
     print(confusion_table(predictions, y_test))
+if __name__ == "__main__":
 
-# Run the analysis
-run_qda_analysis()
+    # Run the analysis
+    run_qda_analysis()
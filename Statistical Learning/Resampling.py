@@ -1,9 +1,5 @@
 # Import necessary libraries
 import numpy as np
-import statsmodels.api as sm
-from ISLP import load_data
-from ISLP.models import ModelSpec as MS, sklearn_sm, poly
-from sklearn.model_selection import train_test_split, cross_validate, KFold, ShuffleSplit
 
 # Function to load and split the dataset
 def load_and_split_data(dataset, test_size, random_state):
@@ -21,6 +17,8 @@ def load_and_split_data(dataset, test_size, random_state):
     Returns:
     tuple: A tuple containing the training and validation sets.
     """
+    from sklearn.model_selection import train_test_split
+
     return train_test_split(dataset, test_size=test_size, random_state=random_state)
 
 # Function to evaluate model using Mean Squared Error (MSE)
@@ -38,6 +36,9 @@ def evalMSE(terms, response, train, test):
     Returns:
     float: The MSE of the model.
     """
+    import statsmodels.api as sm
+    from ISLP.models import ModelSpec as MS
+
     mm = MS(terms)
     X_train = mm.fit_transform(train)
     y_train = train[response]
@@ -47,12 +48,6 @@ def evalMSE(terms, response, train, test):
     test_pred = results.predict(X_test)
     return np.mean((y_test - test_pred)**2)
 
-# Load the 'Auto' dataset
-Auto = load_data('Auto')
-
-# Load and split the 'Auto' dataset
-Auto_train, Auto_valid = load_and_split_data(Auto, test_size=196, random_state=0)
-
 # Evaluate MSE for different degrees of polynomial features
 def evaluate_polynomial_models(train, valid, degrees, response='mpg', predictor='horsepower'):
     """
@@ -70,19 +65,13 @@ def evaluate_polynomial_models(train, valid, degrees, response='mpg', predictor=
     Returns:
     np.array: An array containing the MSE for each polynomial degree.
     """
+    from ISLP.models import poly
+
     MSE = np.zeros(degrees)
     for idx, degree in enumerate(range(1, degrees + 1)):
         MSE[idx] = evalMSE([poly(predictor, degree)], response, train, valid)
     return MSE
 
-# Example usage: Evaluating polynomial models
-MSE_values = evaluate_polynomial_models(Auto_train, Auto_valid, 3)
-
-# Printing MSE values with more context
-print("MSE for Polynomial Models (Degree 1 to 3):")
-for i, mse in enumerate(MSE_values, 1):
-    print(f"Degree {i}: MSE = {mse}")
-
 # Function to perform cross-validation
 def perform_cross_validation(model, X, Y, cv_method, n_splits=None, test_size=None, random_state=0):
     """
@@ -103,6 +92,8 @@ def perform_cross_validation(model, X, Y, cv_method, n_splits=None, test_size=No
     Returns:
     dict: A dictionary containing the cross-validation results.
     """
+    from sklearn.model_selection import cross_validate, KFold, ShuffleSplit
+
     if cv_method == 'kfold':
         cv = KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
     elif cv_method == 'shuffle_split':
@@ -112,13 +103,32 @@ def perform_cross_validation(model, X, Y, cv_method, n_splits=None, test_size=No
 
     return cross_validate(model, X, Y, cv=cv)
 
-# Example usage of cross-validation
-hp_model = sklearn_sm(sm.OLS, MS(['horsepower']))
-X, Y = Auto.drop(columns=['mpg']), Auto['mpg']
-cv_results = perform_cross_validation(hp_model, X, Y, cv_method='kfold', n_splits=10)
+if __name__ == "__main__":
+    import statsmodels.api as sm
+    from ISLP import load_data
+    from ISLP.models import ModelSpec as MS, sklearn_sm
+
+    # Load the 'Auto' dataset
+    Auto = load_data('Auto')
+
+    # Load and split the 'Auto' dataset
+    Auto_train, Auto_valid = load_and_split_data(Auto, test_size=196, random_state=0)
+
+    # Example usage: Evaluating polynomial models
+    MSE_values = evaluate_polynomial_models(Auto_train, Auto_valid, 3)
+
+    # Printing MSE values with more context
+    print("MSE for Polynomial Models (Degree 1 to 3):")
+    for i, mse in enumerate(MSE_values, 1):
+        print(f"Degree {i}: MSE = {mse}")
+
+    # Example usage of cross-validation
+    hp_model = sklearn_sm(sm.OLS, MS(['horsepower']))
+    X, Y = Auto.drop(columns=['mpg']), Auto['mpg']
+    cv_results = perform_cross_validation(hp_model, X, Y, cv_method='kfold', n_splits=10)
 
-# Formatting Cross-Validation Results
-print("\nCross-Validation Results:")
-print("Fit Times:", cv_results['fit_time'])
-print("Score Times:", cv_results['score_time'])
-print("Test Scores (Negative MSE):", cv_results['test_score'])
+    # Formatting Cross-Validation Results
+    print("\nCross-Validation Results:")
+    print("Fit Times:", cv_results['fit_time'])
+    print("Score Times:", cv_results['score_time'])
+    print("Test Scores (Negative MSE):", cv_results['test_score'])
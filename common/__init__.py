@@ -0,0 +1,8 @@
+"""
+Helpers shared by the scripts in this repository.
+
+The scripts live in folders whose names contain spaces, so they cannot import each other. Code
+used by more than one script lives here instead, and each script puts the repository root on
+sys.path before importing from this package. Modules only import heavy dependencies where the
+scripts using them already do, so importing a helper keeps a script's import time unchanged.
+"""
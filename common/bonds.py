@@ -0,0 +1,95 @@
+"""
+Vectorized bond cash flows and the spread solver shared by the yield, Z-spread and I-spread scripts.
+"""
+import numpy as np
+
+
+def bullet_bond_cash_flows(coupon_rates, maturities, frequency=2, face_value=100):
+    """
+    Padded cash flows of plain bullet bonds with regular coupons counted back from maturity.
+
+    Args:
+        coupon_rates (list or np.ndarray): Annual coupon rates (%).
+        maturities (list or np.ndarray): Bond maturities (years).
+        frequency (int): Coupon payments per year.
+        face_value (float): Face value of each bond.
+
+    Returns:
+        tuple: (cash_flows, times) as (bonds x periods) arrays; padded entries have a zero
+               cash flow and a zero time.
+    """
+    maturities = np.atleast_1d(np.asarray(maturities, dtype=float))
+    coupons = np.broadcast_to(np.asarray(coupon_rates, dtype=float), maturities.shape) * face_value / frequency
+    periods = int(np.ceil(maturities.max() * frequency))
+    times = maturities[:, np.newaxis] - np.arange(periods)[np.newaxis, :] / frequency
+    cash_flows = np.where(times > 0, coupons[:, np.newaxis], 0.0)
+    cash_flows[:, 0] += face_value
+    return cash_flows, np.maximum(times, 0)
+
+
+def present_value_and_derivatives(cash_flows, times, base_rates, spread, frequency):
+    """
+    Price and its first two derivatives with respect to a spread added to every discount rate.
+
+    Args:
+        cash_flows (np.ndarray): Padded (bonds x cash flows) amounts.
+        times (np.ndarray): Padded (bonds x cash flows) times in years.
+        base_rates (np.ndarray): Discount rate of every cash flow before the spread, compounded
+                                 `frequency` times a year.
+        spread (np.ndarray): Spread of each bond.
+        frequency (int): Compounding frequency.
+
+    Returns:
+        tuple: (price, first derivative, second derivative) arrays, one entry per bond.
+    """
+    base = 1 + (base_rates + spread[:, np.newaxis]) / frequency
+    discounted = cash_flows * base ** (-times * frequency)
+    price = discounted.sum(axis=1)
+    first = -(discounted * times / base).sum(axis=1)
+    second = (discounted * times * (times + 1 / frequency) / base ** 2).sum(axis=1)
+    return price, first, second
+
+
+def solve_spread(prices, cash_flows, times, base_rates, frequency=2, method='halley', tolerance=1e-10,
+                 max_iterations=50, initial_guess=0.0):
+    """
+    Simultaneous Newton or Halley iterations for the spread over base_rates that reprices each bond.
+    With zero base rates the spread is the yield to maturity, over a zero curve it is the Z-spread.
+    Converged bonds are dropped from the working set, so later iterations only touch the rest.
+
+    Args:
+        prices (np.ndarray): Full (dirty) prices of the bonds.
+        cash_flows (np.ndarray): Padded (bonds x cash flows) amounts.
+        times (np.ndarray): Padded (bonds x cash flows) times in years.
+        base_rates (np.ndarray): Discount rate of every cash flow before the spread.
+        frequency (int): Compounding frequency of the rates and the spread.
+        method (str): 'halley' or 'newton'.
+        tolerance (float): Convergence tolerance on the pricing error.
+        max_iterations (int): Maximum number of iterations.
+        initial_guess (float or np.ndarray): Starting spread.
+
+    Returns:
+        np.ndarray: Spread of each bond (NaN where the solver did not converge).
+    """
+    if method not in ('halley', 'newton'):
+        raise ValueError("method must be either 'halley' or 'newton'.")
+    n_bonds = prices.shape[0]
+    spread = np.broadcast_to(np.asarray(initial_guess, dtype=float), (n_bonds,)).copy()
+    converged = np.zeros(n_bonds, dtype=bool)
+    active = np.arange(n_bonds)
+    for _ in range(max_iterations):
+        price, first, second = present_value_and_derivatives(cash_flows[active], times[active], base_rates[active],
+                                                             spread[active], frequency)
+        error = price - prices[active]
+        done = np.abs(error) < tolerance
+        converged[active[done]] = True
+        keep = ~done
+        active, error, first, second = active[keep], error[keep], first[keep], second[keep]
+        if active.size == 0:
+            break
+        if method == 'halley':
+            step = 2 * error * first / (2 * first ** 2 - error * second)
+        else:
+            step = error / first
+        spread[active] -= step
+    return np.where(converged, spread, np.nan)
@@ -0,0 +1,58 @@
+"""
+Job files for the headless entry points of the interactive scripts: a list of scenarios read
+from JSON, YAML or CSV, and a results table written back to CSV or JSON.
+"""
+import os
+
+
+def load_jobs(path):
+    """
+    Loads a list of scenarios from a JSON, YAML or CSV job file.
+    Parameters:
+        path (str): Path to the job file. JSON and YAML files hold a list of objects; CSV files
+            have one scenario per row, with list-valued fields separated by semicolons.
+    Returns:
+        List[dict]: One dictionary of inputs per scenario.
+    """
+    suffix = os.path.splitext(path)[1].lower()
+    with open(path, newline='') as job_file:
+        if suffix == '.json':
+            import json
+            return json.load(job_file)
+        if suffix in ('.yaml', '.yml'):
+            import yaml
+            return yaml.safe_load(job_file)
+        if suffix == '.csv':
+            import csv
+            return list(csv.DictReader(job_file))
+    raise ValueError(f"Unsupported job file type: {suffix}")
+
+
+def write_results(results, path=None):
+    """
+    Writes a results DataFrame to a CSV or JSON file, or prints it when no path is given.
+    """
+    if path is None:
+        print(results.to_string(index=False))
+    elif path.lower().endswith('.json'):
+        results.to_json(path, orient='records', indent=2)
+    else:
+        results.to_csv(path, index=False)
+
+
+def as_list(value):
+    """
+    Reads a list-valued job field, given either as a list or as a semicolon-separated string.
+    """
+    if isinstance(value, str):
+        return [float(item) for item in value.split(';') if item.strip()]
+    return [float(item) for item in value]
+
+
+def as_bool(value):
+    """
+    Reads a boolean job field, given either as a boolean or as a string such as 'yes' or 'true'.
+    """
+    if isinstance(value, str):
+        return value.strip().lower() in ('yes', 'true', '1')
+    return bool(value)
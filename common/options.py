@@ -0,0 +1,34 @@
+"""
+Closed-form option values shared by the tree and Monte Carlo pricers.
+"""
+import numpy as np
+
+
+def ndtr(x):
+    """
+    Standard normal cumulative distribution function. SciPy is imported on first use so that
+    importing the pricers for their tree or simulation engines alone stays cheap.
+    """
+    from scipy.special import ndtr
+    return ndtr(x)
+
+
+def black_scholes_price(S, strike_price, r, sigma, T, option_type='call'):
+    """
+    Black-Scholes value of a European option. The rate and volatility may be quoted per year
+    with T in years, or per step with T in steps.
+    :param S: Asset price, or a NumPy array of asset prices.
+    :param strike_price: Strike price of the option.
+    :param r: Continuously compounded risk-free rate.
+    :param sigma: Volatility.
+    :param T: Time to expiry.
+    :param option_type: Type of the option ('call' or 'put').
+    :return: The value of the option for each asset price.
+    """
+    S = np.asarray(S, dtype=float)
+    vol = sigma * np.sqrt(T)
+    d1 = (np.log(S / strike_price) + (r + 0.5 * sigma ** 2) * T) / vol
+    d2 = d1 - vol
+    if option_type == 'call':
+        return S * ndtr(d1) - strike_price * np.exp(-r * T) * ndtr(d2)
+    return strike_price * np.exp(-r * T) * ndtr(-d2) - S * ndtr(-d1)
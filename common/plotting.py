@@ -0,0 +1,92 @@
+"""
+Plotting helpers shared by the scripts: downsampling long series to the points that shape the
+line, and figures that render to PNG without pyplot or a display in batch jobs.
+"""
+
+
+def lttb_indices(x, y, max_points):
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets downsampling: the first and last
+    points, and from each of max_points - 2 buckets the point forming the largest triangle with
+    the point kept before it and the average of the next bucket.
+    """
+    import numpy as np
+
+    n = len(y)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    selected = np.empty(max_points, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for k in range(max_points - 2):
+        start, stop = edges[k], edges[k + 1]
+        next_start, next_stop = (edges[k + 1], edges[k + 2]) if k + 2 < len(edges) else (n - 1, n)
+        average_x, average_y = x[next_start:next_stop].mean(), y[next_start:next_stop].mean()
+        area = np.abs((x[previous] - average_x) * (y[start:stop] - y[previous])
+                      - (x[previous] - x[start:stop]) * (average_y - y[previous]))
+        previous = start + int(np.argmax(area))
+        selected[k + 1] = previous
+    return selected
+
+
+def minmax_indices(y, max_points):
+    """
+    Indices of the minimum and maximum of each of max_points / 2 buckets, which keeps every spike.
+    """
+    import numpy as np
+
+    n = len(y)
+    if max_points >= n or max_points < 4:
+        return np.arange(n)
+    edges = np.linspace(0, n, max_points // 2 + 1).astype(int)
+    bucket = np.repeat(np.arange(len(edges) - 1), np.diff(edges))
+    # Sorted by value within each bucket, so a bucket's first entry is its minimum and its last its maximum
+    order = np.lexsort((y, bucket))
+    return np.unique(np.concatenate(([0, n - 1], order[edges[:-1]], order[edges[1:] - 1])))
+
+
+def downsample(x, y, max_points=2000, method='lttb'):
+    """
+    Indices of the points to draw so a series of any length renders as at most about max_points
+    points while keeping its visual shape. NaN values are dropped.
+    Parameters:
+    - x (array): Sorted x values; datetimes are passed as their integer representation.
+    - y (array): Values to plot.
+    - max_points (int): Number of points to keep.
+    - method (str): 'lttb' (Largest-Triangle-Three-Buckets) or 'minmax' (bucket extremes).
+    Returns:
+    - array: Indices into x and y.
+    """
+    import numpy as np
+
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    valid = np.flatnonzero(~np.isnan(y))
+    if method == 'lttb':
+        return valid[lttb_indices(x[valid], y[valid], max_points)]
+    if method == 'minmax':
+        return valid[minmax_indices(y[valid], max_points)]
+    raise ValueError("method must be either 'lttb' or 'minmax'.")
+
+
+def new_figure(output=None, figsize=(10, 6)):
+    """
+    A figure on the pyplot GUI backend, or with output set, a plain Agg figure that never loads
+    pyplot or a display, for writing PNGs in batch jobs.
+    """
+    if output is None:
+        import matplotlib.pyplot as plt
+        return plt.figure(figsize=figsize)
+    from matplotlib.figure import Figure
+    return Figure(figsize=figsize)
+
+
+def show_or_save(figure, output=None):
+    """
+    Shows a figure from new_figure, or writes it to output as a PNG.
+    """
+    if output is None:
+        import matplotlib.pyplot as plt
+        plt.show()
+    else:
+        figure.savefig(output, dpi=100, bbox_inches='tight')
@@ -0,0 +1,59 @@
+"""
+Rate limiting and retries shared by the downloaders: a token bucket shared by the worker
+threads and a retry loop with jittered exponential backoff.
+"""
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter shared by all the worker threads.
+    Tokens are added continuously at `rate` per second up to `capacity`; each request takes one,
+    so bursts of up to `capacity` requests are allowed while the long-run rate stays at `rate`.
+    """
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_seconds = (1 - self.tokens) / self.rate
+            time.sleep(wait_seconds)
+
+
+class RetryableError(Exception):
+    """
+    A failure worth retrying, such as a timeout, HTTP 429/418 or a 5xx response. retry_after is
+    the delay in seconds the server asked for, if any.
+    """
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def call_with_retry(call, bucket, max_retries=5, backoff=1.0, max_backoff=60.0):
+    """
+    Calls call() behind the shared rate limiter, retrying RetryableError after the delay the
+    server asked for or, failing that, with exponential backoff and full jitter (a random sleep
+    between 0 and backoff * 2 ** attempt seconds, at most max_backoff).
+    """
+    for attempt in range(max_retries + 1):
+        bucket.acquire()
+        try:
+            return call()
+        except RetryableError as error:
+            if attempt == max_retries:
+                raise
+            time.sleep(error.retry_after or random.uniform(0, min(max_backoff, backoff * 2 ** attempt)))
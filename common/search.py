@@ -0,0 +1,116 @@
+"""
+Ranked prefix, substring and fuzzy search over {key: description} catalogs, such as the World
+Bank series list and the Alpha Vantage currency lists, with indexes that can be saved to JSON.
+"""
+import bisect
+import json
+import os
+import re
+from collections import Counter
+
+
+# Tokens are runs of letters and digits; indicator codes like NY.GDP.MKTP.CD split into their parts
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def trigrams(token):
+    padded = f"${token}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """
+    Ranked prefix, substring and fuzzy search over (key, description) entries.
+    Every distinct token of the keys and descriptions goes into a sorted vocabulary (searched by
+    bisection for prefixes) and a trigram index (for substrings and misspellings), each with the
+    entries it occurs in. A query matches the entries containing a match for every query token,
+    ranked by how close the matches are, with exact and prefix matches on the key first.
+    """
+    def __init__(self, keys, texts, vocabulary, postings, fingerprint=None):
+        self.keys = keys
+        self.texts = texts
+        self.vocabulary = vocabulary
+        self.postings = postings
+        self.fingerprint = fingerprint
+        self.grams = {}
+        for position, token in enumerate(vocabulary):
+            for gram in trigrams(token):
+                self.grams.setdefault(gram, []).append(position)
+
+    @classmethod
+    def build(cls, entries, fingerprint=None):
+        keys, texts = list(entries), list(entries.values())
+        occurrences = {}
+        for entry, (key, text) in enumerate(zip(keys, texts)):
+            for token in set(tokenize(key) + tokenize(text)):
+                occurrences.setdefault(token, []).append(entry)
+        vocabulary = sorted(occurrences)
+        return cls(keys, texts, vocabulary, [occurrences[token] for token in vocabulary], fingerprint)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as index_file:
+            stored = json.load(index_file)
+        return cls(stored['keys'], stored['texts'], stored['vocabulary'], stored['postings'], stored.get('fingerprint'))
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        temporary_path = path + '.tmp'
+        with open(temporary_path, 'w') as index_file:
+            json.dump({'fingerprint': self.fingerprint, 'keys': self.keys, 'texts': self.texts,
+                       'vocabulary': self.vocabulary, 'postings': self.postings}, index_file)
+        os.replace(temporary_path, path)
+
+    def match_token(self, token, min_similarity=0.5):
+        """Scores of the vocabulary tokens matching one query token, by vocabulary position."""
+        scores = {}
+        position = bisect.bisect_left(self.vocabulary, token)
+        while position < len(self.vocabulary) and self.vocabulary[position].startswith(token):
+            scores[position] = 1.0 if self.vocabulary[position] == token else 0.8
+            position += 1
+        query_grams = trigrams(token)
+        shared = Counter(position for gram in query_grams for position in self.grams.get(gram, ()))
+        for position, count in shared.items():
+            if position in scores:
+                continue
+            candidate = self.vocabulary[position]
+            if len(token) >= 3 and token in candidate:
+                scores[position] = 0.6
+                continue
+            # Dice coefficient of the padded trigram sets
+            similarity = 2 * count / (len(query_grams) + len(trigrams(candidate)))
+            if similarity >= min_similarity:
+                scores[position] = 0.5 * similarity
+        return scores
+
+    def search(self, query, limit=None, min_similarity=0.5):
+        """
+        Entries matching every token of the query as {key: description}, best first.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return {}
+        totals = None
+        for token in tokens:
+            best = {}
+            for position, score in self.match_token(token, min_similarity).items():
+                for entry in self.postings[position]:
+                    if score > best.get(entry, 0.0):
+                        best[entry] = score
+            totals = best if totals is None else {entry: totals[entry] + score for entry, score in best.items()
+                                                  if entry in totals}
+            if not totals:
+                return {}
+        query_key = query.strip().lower()
+        for entry in totals:
+            key = self.keys[entry].lower()
+            if key == query_key:
+                totals[entry] += 2.0
+            elif key.startswith(query_key):
+                totals[entry] += 1.0
+        ranked = sorted(totals, key=lambda entry: (-totals[entry], len(self.texts[entry]), self.keys[entry]))
+        return {self.keys[entry]: self.texts[entry] for entry in ranked[:limit]}
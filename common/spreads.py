@@ -0,0 +1,48 @@
+"""
+Curve interpolation and the structured spread results shared by the I-spread, swap spread and
+yield scripts.
+"""
+import numpy as np
+
+# Numeric spread results are returned as structured arrays with these fields
+SPREAD_DTYPE = np.dtype([('maturity', float), ('spread_bps', float)])
+
+
+def interpolate_curve(tenors, rates, maturities):
+    """
+    Linearly interpolate a par or zero curve to each bond's exact maturity.
+
+    Args:
+        tenors (list or np.ndarray): Curve tenors (years), increasing.
+        rates (list or np.ndarray): Curve rates at each tenor (%).
+        maturities (list or np.ndarray): Maturities to interpolate to (years). Rates are held flat beyond the curve ends.
+
+    Returns:
+        np.ndarray: Interpolated rate for each maturity.
+    """
+    return np.interp(np.asarray(maturities, dtype=float), np.asarray(tenors, dtype=float), np.asarray(rates, dtype=float))
+
+
+def format_spreads(spreads, maturities=None):
+    """
+    Format numeric spreads for display, e.g. '41.0 bps, Maturity: 2 years'. Results with several
+    spread fields show each one by name, e.g. 'I-spread: 41.0 bps, G-spread: 52.5 bps, Maturity: 2 years'.
+
+    Args:
+        spreads (np.ndarray): Structured array with a 'maturity' field and one or more '*_bps'
+                              fields, or plain spreads in basis points.
+        maturities (list or np.ndarray): Maturities (years), required when spreads is a plain array.
+
+    Returns:
+        np.ndarray: Array of strings with spreads rounded to 2 decimal places.
+    """
+    if spreads.dtype.names:
+        maturities = spreads['maturity']
+        fields = [name for name in spreads.dtype.names if name.endswith('_bps')]
+        columns = [spreads[name] for name in fields]
+        labels = ['' if len(fields) == 1 else name[:-len('_bps')].replace('_', '-').capitalize() + ': '
+                  for name in fields]
+    else:
+        columns, labels = [spreads], ['']
+    return np.array([', '.join(f"{label}{round(column[i], 2)} bps" for label, column in zip(labels, columns))
+                     + f", Maturity: {maturity:g} years" for i, maturity in enumerate(maturities)])